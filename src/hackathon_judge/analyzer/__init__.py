@@ -3,5 +3,13 @@
 from .repo_analyzer import RepoAnalyzer
 from .git_forensics import GitForensics
 from .x402_detector import X402Detector
+from .repo_index import RepoIndex
+from .file_facts import FactStore
+from .provenance import ProvenanceIndex
+from .shared_history import SharedHistoryIndex
+from .vendored import VendoredFiles
 
-__all__ = ["RepoAnalyzer", "GitForensics", "X402Detector"]
+__all__ = [
+    "RepoAnalyzer", "GitForensics", "X402Detector", "RepoIndex", "FactStore",
+    "ProvenanceIndex", "SharedHistoryIndex", "VendoredFiles",
+]
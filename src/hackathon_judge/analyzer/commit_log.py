@@ -0,0 +1,148 @@
+"""Single-pass commit history reader built on `git log --numstat`."""
+
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from hackathon_judge.config import GIT_COMMAND_TIMEOUT
+
+
+# ASCII record/unit separators never appear in SHAs or timestamps
+_RECORD_SEP = '\x1e'
+_FIELD_SEP = '\x1f'
+_FORMAT = f'{_RECORD_SEP}%H{_FIELD_SEP}%P{_FIELD_SEP}%at{_FIELD_SEP}%ct{_FIELD_SEP}%s'
+
+
+@dataclass
+class CommitRecord:
+    """One commit with its line stats."""
+    sha: str
+    parents: list[str] = field(default_factory=list)
+    author_ts: int = 0
+    committer_ts: int = 0
+    insertions: int = 0
+    deletions: int = 0
+    summary: str = ""
+
+
+@dataclass
+class CommitTimeline:
+    """Commit history as parallel NumPy columns, newest first.
+
+    Timestamps are epoch seconds. Heuristics over the whole history are
+    vectorized array operations instead of loops over CommitRecords.
+    """
+    shas: list[str]
+    summaries: list[str]
+    author_ts: np.ndarray
+    committer_ts: np.ndarray
+    insertions: np.ndarray
+    deletions: np.ndarray
+    parent_count: np.ndarray
+
+    @classmethod
+    def from_records(cls, commits: list[CommitRecord]) -> 'CommitTimeline':
+        def column(values) -> np.ndarray:
+            return np.fromiter(values, dtype=np.int64, count=len(commits))
+
+        return cls(
+            shas=[c.sha for c in commits],
+            summaries=[c.summary for c in commits],
+            author_ts=column(c.author_ts for c in commits),
+            committer_ts=column(c.committer_ts for c in commits),
+            insertions=column(c.insertions for c in commits),
+            deletions=column(c.deletions for c in commits),
+            parent_count=column(len(c.parents) for c in commits),
+        )
+
+    def __len__(self) -> int:
+        return len(self.shas)
+
+
+def read_commit_timeline(path: Path, rev: str = 'HEAD',
+                         max_count: Optional[int] = None,
+                         paths: Optional[list[str]] = None) -> CommitTimeline:
+    """read_commit_log() as a CommitTimeline."""
+    return CommitTimeline.from_records(read_commit_log(path, rev, max_count, paths))
+
+
+def read_commit_log(path: Path, rev: str = 'HEAD',
+                    max_count: Optional[int] = None,
+                    paths: Optional[list[str]] = None) -> list[CommitRecord]:
+    """Read commits reachable from rev, newest first, with insertions/deletions.
+
+    Runs a single `git log --numstat` subprocess instead of one `git diff`
+    per commit. With paths (pathspecs), every commit is still listed but
+    line stats only count changes under those paths, which keeps blobless
+    clones from fetching blobs outside their sparse checkout.
+    Raises RuntimeError if git fails.
+    """
+    if not paths:
+        return parse_commit_log(_git_log(path, rev, max_count, ['--numstat']))
+
+    commits = parse_commit_log(_git_log(path, rev, max_count, []))
+    stats = {
+        c.sha: c
+        for c in parse_commit_log(_git_log(path, rev, max_count, ['--numstat', '--'] + paths))
+    }
+    for commit in commits:
+        if commit.sha in stats:
+            commit.insertions = stats[commit.sha].insertions
+            commit.deletions = stats[commit.sha].deletions
+    return commits
+
+
+def _git_log(path: Path, rev: str, max_count: Optional[int], extra: list[str]) -> str:
+    """Run `git log` with the record format and return its output."""
+    cmd = [
+        'git', '-C', str(path), '-c', 'core.quotepath=off',
+        'log', rev, '--no-renames', f'--format={_FORMAT}',
+    ]
+    if max_count:
+        cmd.append(f'--max-count={max_count}')
+    cmd.extend(extra)
+
+    proc = subprocess.run(cmd, capture_output=True, timeout=GIT_COMMAND_TIMEOUT)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.decode('utf-8', errors='replace').strip())
+
+    return proc.stdout.decode('utf-8', errors='replace')
+
+
+def parse_commit_log(output: str) -> list[CommitRecord]:
+    """Parse the output of `git log --numstat --format=<_FORMAT>`."""
+    commits = []
+
+    for chunk in output.split(_RECORD_SEP):
+        if not chunk.strip():
+            continue
+
+        header, _, body = chunk.partition('\n')
+        parts = header.split(_FIELD_SEP)
+        if len(parts) < 5:
+            continue
+
+        commit = CommitRecord(
+            sha=parts[0],
+            parents=parts[1].split(),
+            author_ts=int(parts[2] or 0),
+            committer_ts=int(parts[3] or 0),
+            summary=parts[4],
+        )
+
+        for line in body.splitlines():
+            cols = line.split('\t', 2)
+            if len(cols) < 3:
+                continue
+            # Binary files report "-" for both counts
+            if cols[0].isdigit():
+                commit.insertions += int(cols[0])
+            if cols[1].isdigit():
+                commit.deletions += int(cols[1])
+
+        commits.append(commit)
+
+    return commits
@@ -0,0 +1,143 @@
+"""Per-repository content budget: which files the analyzers may read."""
+
+import fnmatch
+import re
+from typing import Iterable, Optional
+
+from hackathon_judge.config import (
+    MAX_TOKENS_PER_REPO, CONTENT_BYTES_PER_TOKEN, CONTENT_MAX_FILE_BYTES,
+    CONTENT_MINIFIED_LINE_LENGTH, CONTENT_SKIPPED_REPORT_MAX,
+)
+
+
+# Files the analyzers read: source code, manifests and docs
+SOURCE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.py', '.rs', '.go', '.sol'}
+TEXT_EXTENSIONS = SOURCE_EXTENSIONS | {'.json', '.toml', '.md', '.txt'}
+
+MANIFEST_NAMES = {
+    'package.json', 'requirements.txt', 'pyproject.toml', 'cargo.toml', 'go.mod',
+    'anchor.toml', 'foundry.toml', '.gitattributes',
+}
+ENTRY_POINT_STEMS = {'index', 'main', 'app', 'server', 'api', 'lib', 'mod', 'handler', 'middleware'}
+RELEVANT_NAME = re.compile(r'x402|402|pay|wallet|checkout|paywall|facilitator', re.IGNORECASE)
+
+# Build output, lock files and generated code, recognised by name
+GENERATED_NAMES = [
+    '*.min.js', '*.min.css', '*.bundle.js', '*.chunk.js', '*.map',
+    'package-lock.json', 'yarn.lock', 'pnpm-lock.yaml', 'cargo.lock', '*.lock',
+    '*.generated.*', '*_generated.*', '*.pb.go', '*_pb2.py', '*.d.ts',
+]
+GENERATED_MARKERS = ('@generated', 'do not edit', 'auto-generated', 'autogenerated')
+
+
+def is_generated_name(name: str) -> bool:
+    name = name.lower()
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in GENERATED_NAMES)
+
+
+def looks_generated(text: str) -> bool:
+    """Minified (very long lines) or marked as generated in its header."""
+    lines = text.count('\n') + 1
+    if len(text) / lines > CONTENT_MINIFIED_LINE_LENGTH:
+        return True
+    header = text[:1000].lower()
+    return any(marker in header for marker in GENERATED_MARKERS)
+
+
+def _relevance(path: str, name: str, ext: str) -> tuple:
+    """Sort key: lower reads first."""
+    lower = name.lower()
+    stem = lower.rsplit('.', 1)[0]
+    depth = path.count('/')
+    if lower in MANIFEST_NAMES or (depth == 0 and lower.startswith('readme')):
+        tier = 0
+    elif RELEVANT_NAME.search(path):
+        tier = 1
+    elif stem in ENTRY_POINT_STEMS and ext in SOURCE_EXTENSIONS:
+        tier = 2
+    elif ext in SOURCE_EXTENSIONS:
+        tier = 3
+    else:
+        tier = 4
+    return tier, depth
+
+
+class ContentBudget:
+    """Decide, once per repository, which files may be read.
+
+    Readable files (source, manifests, READMEs) are ranked by relevance:
+    manifests and the root README, files with payment- or x402-related
+    names, entry points, other source, then other text; shallower and
+    smaller files first within a rank. Files are admitted in that order
+    until max_tokens worth of bytes is used. Files over max_file_bytes
+    and build output or generated files (by name) are never admitted,
+    and files whose content turns out minified or generated are skipped
+    when read.
+
+    The decision depends only on names and sizes, so every analyzer sees
+    the same files whether or not their facts are cached.
+    """
+
+    def __init__(self, max_tokens: int = MAX_TOKENS_PER_REPO,
+                 max_file_bytes: int = CONTENT_MAX_FILE_BYTES):
+        self.max_bytes = max_tokens * CONTENT_BYTES_PER_TOKEN
+        self.max_file_bytes = max_file_bytes
+        self.bytes_admitted = 0
+        self._admitted: Optional[set[str]] = None
+        self._skipped: dict[str, tuple[str, int]] = {}
+
+    def plan(self, files: Iterable) -> None:
+        """Rank an index's files and admit them within the budget."""
+        self._admitted = set()
+        candidates = []
+        for entry in files:
+            if entry.path in self._skipped:
+                continue  # already refused, e.g. vendored
+            name = entry.name
+            if entry.ext not in TEXT_EXTENSIONS and name.lower() not in MANIFEST_NAMES \
+                    and not name.lower().startswith('readme'):
+                continue
+            if is_generated_name(name):
+                self._skipped[entry.path] = ('generated or build output', entry.size)
+            elif entry.size > self.max_file_bytes:
+                self._skipped[entry.path] = ('file too large', entry.size)
+            else:
+                candidates.append(entry)
+
+        candidates.sort(key=lambda f: (*_relevance(f.path, f.name, f.ext), f.size, f.path))
+        for entry in candidates:
+            if self.bytes_admitted + entry.size > self.max_bytes:
+                self._skipped[entry.path] = ('repository budget exhausted', entry.size)
+                continue
+            self._admitted.add(entry.path)
+            self.bytes_admitted += entry.size
+
+    @property
+    def planned(self) -> bool:
+        return self._admitted is not None
+
+    def refusal(self, path: str) -> Optional[str]:
+        """Why a file may not be read, or None if it may."""
+        if path in self._skipped:
+            return self._skipped[path][0]
+        if self._admitted is not None and path not in self._admitted:
+            return 'not a source or text file'
+        return None
+
+    def skip(self, path: str, reason: str, size: int = 0):
+        """Record a file rejected after reading (e.g. minified content)."""
+        if self._admitted is not None:
+            self._admitted.discard(path)
+        self._skipped[path] = (reason, size)
+
+    def report(self, limit: int = CONTENT_SKIPPED_REPORT_MAX) -> list[dict]:
+        """Skipped files, largest first, at most limit of them."""
+        skipped = sorted(self._skipped.items(), key=lambda item: (-item[1][1], item[0]))
+        return [
+            {'path': path, 'reason': reason, 'bytes': size}
+            for path, (reason, size) in skipped[:limit]
+        ]
+
+    @property
+    def skipped_count(self) -> int:
+        return len(self._skipped)
@@ -0,0 +1,150 @@
+"""Per-file analysis facts, cached across repositories by git blob SHA."""
+
+import hashlib
+import json
+import sqlite3
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from hackathon_judge.config import GIT_COMMAND_TIMEOUT, FACT_CACHE_MAX_ROWS
+
+
+# Returned by FactStore.get when nothing is stored (facts may legitimately be None)
+MISSING = object()
+
+# Bump when the code computing any fact changes, to invalidate stored facts
+FACTS_VERSION = 1
+
+
+def fact_kind(name: str, *params: Any) -> str:
+    """Name a kind of fact, tagged with a digest of the inputs it depends on.
+
+    Changing the patterns a fact is computed from (or FACTS_VERSION)
+    changes its kind, so stale stored facts are never served.
+    """
+    digest = hashlib.sha1(repr((FACTS_VERSION,) + params).encode('utf-8')).hexdigest()[:10]
+    return f"{name}:{digest}"
+
+
+def git_blob_shas(root: Path) -> dict[str, str]:
+    """Map each tracked path to its blob SHA with one `git ls-files -s`.
+
+    Returns {} if root is not a git work tree.
+    """
+    try:
+        proc = subprocess.run(
+            ['git', '-C', str(root), 'ls-files', '-s', '-z'],
+            capture_output=True, timeout=GIT_COMMAND_TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return {}
+    if proc.returncode != 0:
+        return {}
+
+    shas = {}
+    for record in proc.stdout.split(b'\0'):
+        if not record:
+            continue
+        # "<mode> <sha> <stage>\t<path>"
+        meta, _, path = record.partition(b'\t')
+        parts = meta.split()
+        if len(parts) == 3:
+            shas[path.decode('utf-8', errors='surrogateescape')] = parts[1].decode('ascii')
+    return shas
+
+
+class FactStore:
+    """Facts the analyzers derived from file contents, keyed by (blob SHA, kind).
+
+    One store is shared by every repository on the machine: identical files
+    (SDK examples, starter templates, copied boilerplate) have the same blob
+    SHA in every repo, so each is read and scanned once, and a file
+    unchanged since the last run is never read again. Facts are kept in
+    SQLite; new facts are buffered and written in one transaction per
+    flush(). Lookups are counted for hit-rate reporting.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_rows: int = FACT_CACHE_MAX_ROWS,
+                 persist: bool = True):
+        self.counts = {'hits': 0, 'misses': 0}
+        self._pending: dict[tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+        self._db = None
+        if not persist:
+            return
+
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(tempfile.gettempdir()) / "hackathon_judge_facts"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.cache_dir / "facts.sqlite", check_same_thread=False,
+                                   timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS facts (
+                blob_sha TEXT,
+                kind TEXT,
+                value TEXT,
+                PRIMARY KEY (blob_sha, kind)
+            )"""
+        )
+        self._db.commit()
+        self._trim(max_rows)
+
+    def _trim(self, max_rows: int):
+        """Drop the oldest facts beyond max_rows."""
+        newest = self._db.execute("SELECT MAX(rowid) FROM facts").fetchone()[0]
+        if newest is not None and newest > max_rows:
+            self._db.execute("DELETE FROM facts WHERE rowid <= ?", (newest - max_rows,))
+            self._db.commit()
+
+    def get(self, blob_sha: str, kind: str, count: bool = True) -> Any:
+        """Return a stored fact, or MISSING.
+
+        count=False leaves the hit/miss counters alone, for internal
+        lookups that would otherwise skew the reported hit rate.
+        """
+        key = (blob_sha, kind)
+        with self._lock:
+            value = self._pending.get(key)
+            if value is None and self._db is not None:
+                row = self._db.execute(
+                    "SELECT value FROM facts WHERE blob_sha = ? AND kind = ?", key
+                ).fetchone()
+                value = row[0] if row else None
+
+            if value is None:
+                if count:
+                    self.counts['misses'] += 1
+                return MISSING
+            if count:
+                self.counts['hits'] += 1
+        return json.loads(value)
+
+    def put(self, blob_sha: str, kind: str, value: Any):
+        with self._lock:
+            self._pending[(blob_sha, kind)] = json.dumps(value)
+
+    def flush(self):
+        """Write buffered facts in one transaction."""
+        with self._lock:
+            if self._db is None or not self._pending:
+                return
+            self._db.executemany(
+                "INSERT OR REPLACE INTO facts (blob_sha, kind, value) VALUES (?, ?, ?)",
+                [(sha, kind, value) for (sha, kind), value in self._pending.items()]
+            )
+            self._db.commit()
+            self._pending.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits, misses = self.counts['hits'], self.counts['misses']
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / lookups if lookups else 0.0,
+        }
@@ -1,14 +1,44 @@
 """Git forensics analyzer for timeline validation."""
 
+from contextlib import closing
 from datetime import datetime, date
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
-from git import Repo
+import numpy as np
 
-from hackathon_judge.config import TIME_WINDOW
+from hackathon_judge.config import (
+    TIME_WINDOW, BULK_COMMIT_LINES, DATE_MISMATCH_SECONDS, DATE_MISMATCH_SHARE,
+    BURST_WINDOW_SECONDS, BURST_MIN_COMMITS, LINE_AGE_PRE_EXISTING_SHARE,
+)
 from hackathon_judge.models import ForensicsResult
 from hackathon_judge.fetcher import GitHubAPI
+from hackathon_judge.fetcher.cloner import is_partial_clone, sparse_pathspecs
+from .commit_log import CommitRecord, CommitTimeline, read_commit_timeline
+from .line_age import measure_line_age
+
+
+def _epoch(iso_date: str | None) -> int:
+    """Epoch seconds of a GitHub ISO 8601 date, 0 if missing."""
+    if not iso_date:
+        return 0
+    return int(datetime.fromisoformat(iso_date.replace('Z', '+00:00')).timestamp())
+
+
+def _timeline_from_api(commits: list[dict]) -> CommitTimeline:
+    """CommitTimeline of GitHub API commit payloads (without line stats)."""
+    records = []
+    for commit in commits:
+        commit_info = commit.get('commit', {})
+        records.append(CommitRecord(
+            sha=commit.get('sha', ''),
+            parents=[p.get('sha', '') for p in commit.get('parents', [])],
+            author_ts=_epoch(commit_info.get('author', {}).get('date')),
+            committer_ts=_epoch(commit_info.get('committer', {}).get('date')),
+            summary=commit_info.get('message', '').split('\n', 1)[0],
+        ))
+    return CommitTimeline.from_records(records)
 
 
 class GitForensics:
@@ -19,13 +49,18 @@ class GitForensics:
         self.window = time_window or TIME_WINDOW
 
     def analyze(self, project_id: str, github_url: str,
-                local_path: Optional[Path] = None) -> ForensicsResult:
-        """Analyze git history for timeline compliance."""
+                local_path: Optional[Path] = None,
+                timeline: Optional[CommitTimeline] = None) -> ForensicsResult:
+        """Analyze git history for timeline compliance.
+
+        A timeline already read with read_timeline() can be passed in to
+        avoid reading the history twice.
+        """
         result = ForensicsResult(project_id=project_id)
 
         try:
             if local_path and local_path.exists():
-                return self._analyze_local(result, local_path)
+                return self._analyze_local(result, local_path, timeline)
             else:
                 return self._analyze_remote(result, github_url)
         except Exception as e:
@@ -33,54 +68,59 @@ class GitForensics:
             result.verdict = "UNKNOWN"
             return result
 
-    def _analyze_local(self, result: ForensicsResult, path: Path) -> ForensicsResult:
-        """Analyze local git repository."""
-        try:
-            repo = Repo(path)
-        except Exception as e:
-            result.error = f"Could not open repo: {e}"
-            result.verdict = "UNKNOWN"
-            return result
+    def read_timeline(self, path: Path) -> CommitTimeline:
+        """Read the whole history of a clone and its line stats in one pass.
+
+        Raises RuntimeError if git fails.
+        """
+        # Partial clones only hold blobs for their sparse paths; count lines there
+        paths = sparse_pathspecs() if is_partial_clone(path) else None
+        return read_commit_timeline(path, paths=paths)
 
-        # Get all commits
+    def _analyze_local(self, result: ForensicsResult, path: Path,
+                       timeline: Optional[CommitTimeline] = None) -> ForensicsResult:
+        """Analyze local git repository."""
         try:
-            commits = list(repo.iter_commits('HEAD', max_count=500))
+            if timeline is None:
+                timeline = self.read_timeline(path)
         except Exception as e:
             result.error = f"Could not read commits: {e}"
             result.verdict = "UNKNOWN"
             return result
 
-        result.total_commits = len(commits)
+        result.total_commits = len(timeline)
 
-        # Parse window dates
-        window_start = datetime.combine(self.window.start, datetime.min.time())
-        window_end = datetime.combine(self.window.end, datetime.max.time())
-
-        in_window = []
-        before_window = []
+        # Window bounds as epoch seconds (local time, like datetime.fromtimestamp)
+        window_start = datetime.combine(self.window.start, datetime.min.time()).timestamp()
+        window_end = datetime.combine(self.window.end, datetime.max.time()).timestamp()
 
-        for commit in commits:
-            commit_date = datetime.fromtimestamp(commit.committed_date)
+        before_window = timeline.committer_ts < window_start
+        in_window = ~before_window & (timeline.committer_ts <= window_end)
 
-            if commit_date < window_start:
-                before_window.append({
-                    'sha': commit.hexsha[:7],
-                    'date': commit_date.isoformat(),
-                    'message': commit.message.split('\n')[0][:50],
-                })
-            elif commit_date <= window_end:
-                in_window.append(commit)
-
-        result.commits_in_window = len(in_window)
-        result.commits_before_window = len(before_window)
-        result.pre_window_commits = before_window[:10]  # Keep first 10
+        result.commits_in_window = int(np.count_nonzero(in_window))
+        result.commits_before_window = int(np.count_nonzero(before_window))
+        result.pre_window_commits = [  # Keep first 10
+            {
+                'sha': timeline.shas[i][:7],
+                'date': datetime.fromtimestamp(int(timeline.committer_ts[i])).isoformat(),
+                'message': timeline.summaries[i][:50],
+            }
+            for i in np.flatnonzero(before_window)[:10]
+        ]
 
         # Analyze patterns
-        result.timeline_flags = self._analyze_patterns(commits, in_window, before_window)
+        result.timeline_flags = self._analyze_patterns(timeline, in_window)
 
         # Calculate lines added
-        result.lines_added_in_window = self._estimate_lines_added(in_window)
-        result.lines_before_window = self._estimate_lines_added_commits(before_window, repo)
+        result.lines_added_in_window = int(timeline.insertions[in_window].sum())
+        result.lines_before_window = int(timeline.insertions[before_window].sum())
+
+        # How much code from before the window survives at HEAD (nothing to blame otherwise)
+        if result.commits_before_window:
+            age = measure_line_age(path, window_start)
+            result.surviving_lines = age.lines
+            result.surviving_lines_before_window = age.lines_before
+            result.line_age_files_skipped = age.files_skipped
 
         # Determine development pattern
         result.development_pattern = self._classify_pattern(result)
@@ -105,47 +145,42 @@ class GitForensics:
         owner = match.group(1)
         repo = match.group(2).rstrip('/').replace('.git', '')
 
-        # Get all commits
-        commits = self.api.get_commits(owner, repo, per_page=100)
-        if not commits:
-            result.notes = "Could not fetch commits from API"
-            result.verdict = "UNKNOWN"
-            return result
-
-        result.total_commits = len(commits)
-
         # Parse window dates
         window_start = self.window.start.isoformat() + "T00:00:00Z"
         window_end = self.window.end.isoformat() + "T23:59:59Z"
 
-        in_window = []
-        before_window = []
-
-        for commit in commits:
-            commit_info = commit.get('commit', {})
-            date_str = commit_info.get('committer', {}).get('date', '')
+        # Every in-window commit (filtered by the server), streamed page by page
+        in_window = list(self.api.iter_commits(owner, repo, since=window_start, until=window_end))
+        total = self.api.count_commits(owner, repo)
+        if not total:
+            result.notes = "Could not fetch commits from API"
+            result.verdict = "UNKNOWN"
+            return result
 
-            if date_str:
-                if date_str < window_start:
-                    before_window.append({
-                        'sha': commit.get('sha', '')[:7],
-                        'date': date_str,
-                        'message': commit_info.get('message', '')[:50],
-                    })
-                elif date_str <= window_end:
-                    in_window.append(commit)
+        # Only the newest pre-window commits are listed; the rest are just counted
+        before_window = []
+        with closing(self.api.iter_commits(owner, repo, until=window_start, per_page=10)) as commits:
+            for commit in islice(commits, 10):
+                commit_info = commit.get('commit', {})
+                before_window.append({
+                    'sha': commit.get('sha', '')[:7],
+                    'date': commit_info.get('committer', {}).get('date', ''),
+                    'message': commit_info.get('message', '')[:50],
+                })
 
+        result.total_commits = total
         result.commits_in_window = len(in_window)
-        result.commits_before_window = len(before_window)
-        result.pre_window_commits = before_window[:10]
-
-        # Simplified pattern analysis
-        result.timeline_flags = {
-            'history_manipulation_suspected': False,
-            'bulk_initial_commit': result.commits_in_window == 1 and result.total_commits <= 3,
-            'author_committer_mismatch': False,
-            'suspicious_patterns': [],
-        }
+        result.commits_before_window = (
+            self.api.count_commits(owner, repo, until=window_start) if before_window else 0
+        ) or 0
+        result.pre_window_commits = before_window
+
+        # The API gives no line stats, so the bulk-commit check stays a commit-count heuristic
+        timeline = _timeline_from_api(in_window)
+        result.timeline_flags = self._analyze_patterns(timeline, np.ones(len(timeline), dtype=bool))
+        result.timeline_flags['bulk_initial_commit'] = (
+            result.commits_in_window == 1 and result.total_commits <= 3
+        )
 
         # Determine pattern
         if result.commits_before_window > result.commits_in_window:
@@ -161,89 +196,64 @@ class GitForensics:
 
         return result
 
-    def _analyze_patterns(self, all_commits, in_window, before_window) -> dict:
-        """Analyze commit patterns for manipulation signs."""
+    def _analyze_patterns(self, timeline: CommitTimeline, in_window: np.ndarray) -> dict:
+        """Analyze commit patterns for manipulation signs.
+
+        in_window is a boolean mask over the timeline; every in-window
+        commit is considered.
+        """
         flags = {
             'history_manipulation_suspected': False,
             'bulk_initial_commit': False,
             'author_committer_mismatch': False,
+            'commit_burst': False,
             'suspicious_patterns': [],
         }
 
-        if not in_window:
+        committed = timeline.committer_ts[in_window]
+        if not committed.size:
             return flags
 
-        # Check for bulk initial commit
-        first_commit = in_window[-1] if in_window else None
-        if first_commit:
-            try:
-                stats = first_commit.stats.total
-                if stats.get('insertions', 0) > 5000:
-                    flags['bulk_initial_commit'] = True
-                    flags['suspicious_patterns'].append("Large initial commit (>5000 lines)")
-            except:
-                pass
+        # Check for bulk initial commit (history is newest first)
+        first_commit = np.flatnonzero(in_window)[-1]
+        if timeline.insertions[first_commit] > BULK_COMMIT_LINES:
+            flags['bulk_initial_commit'] = True
+            flags['suspicious_patterns'].append(f"Large initial commit (>{BULK_COMMIT_LINES} lines)")
 
         # Check for author/committer date mismatch
-        mismatches = 0
-        for commit in in_window[:20]:
-            try:
-                author_date = datetime.fromtimestamp(commit.authored_date)
-                committer_date = datetime.fromtimestamp(commit.committed_date)
-                diff = abs((author_date - committer_date).total_seconds())
-                if diff > 86400:  # More than 1 day difference
-                    mismatches += 1
-            except:
-                pass
-
-        if mismatches > 3:
+        gaps = np.abs(timeline.author_ts[in_window] - committed)
+        mismatches = int(np.count_nonzero(gaps > DATE_MISMATCH_SECONDS))
+
+        if mismatches > 3 and mismatches > committed.size * DATE_MISMATCH_SHARE:
             flags['author_committer_mismatch'] = True
             flags['suspicious_patterns'].append("Author/committer date mismatches detected")
 
         # Check for identical committer dates (batch rebase)
-        committer_dates = []
-        for commit in in_window[:20]:
-            try:
-                committer_dates.append(commit.committed_date)
-            except:
-                pass
-
-        if len(set(committer_dates)) < len(committer_dates) / 2 and len(committer_dates) > 5:
+        if np.unique(committed).size < committed.size / 2 and committed.size > 5:
             flags['history_manipulation_suspected'] = True
             flags['suspicious_patterns'].append("Many commits with identical timestamps")
 
-        return flags
+        # Check for bursts: the most commits inside any BURST_WINDOW_SECONDS span
+        ordered = np.sort(committed)
+        in_span = np.searchsorted(ordered, ordered + BURST_WINDOW_SECONDS, side='right')
+        burst = int((in_span - np.arange(ordered.size)).max())
+        if burst >= BURST_MIN_COMMITS:
+            flags['commit_burst'] = True
+            flags['suspicious_patterns'].append(
+                f"Burst of {burst} commits within {BURST_WINDOW_SECONDS // 60} minutes"
+            )
 
-    def _estimate_lines_added(self, commits) -> int:
-        """Estimate total lines added from commits."""
-        total = 0
-        for commit in commits[:50]:
-            try:
-                stats = commit.stats.total
-                total += stats.get('insertions', 0)
-            except:
-                pass
-        return total
-
-    def _estimate_lines_added_commits(self, commit_list, repo) -> int:
-        """Estimate lines from commit list (with SHA)."""
-        total = 0
-        for item in commit_list[:10]:
-            try:
-                sha = item.get('sha', '')
-                if sha:
-                    commit = repo.commit(sha)
-                    stats = commit.stats.total
-                    total += stats.get('insertions', 0)
-            except:
-                pass
-        return total
+        return flags
 
     def _classify_pattern(self, result: ForensicsResult) -> str:
         """Classify the development pattern."""
         if result.commits_before_window > result.commits_in_window * 2:
             return "likely_pre-existing"
 
+        if (result.surviving_lines and result.surviving_lines_before_window >=
+                result.surviving_lines * LINE_AGE_PRE_EXISTING_SHARE):
+            return "likely_pre-existing"
+
         if result.timeline_flags.get('history_manipulation_suspected'):
             return "suspicious"
 
@@ -290,6 +300,10 @@ class GitForensics:
         if result.commits_before_window > 0:
             notes.append(f"{result.commits_before_window} commits before hackathon start.")
 
+        if result.surviving_lines_before_window:
+            share = result.surviving_lines_before_window / result.surviving_lines
+            notes.append(f"{share:.0%} of surviving lines predate the hackathon.")
+
         if result.timeline_flags.get('bulk_initial_commit'):
             notes.append("Large initial commit detected - could be legitimate code dump.")
 
@@ -0,0 +1,144 @@
+"""Linguist-style language byte counts from a repository's file index."""
+
+import fnmatch
+import re
+from functools import lru_cache
+
+from .content_budget import is_generated_name
+from .file_facts import fact_kind
+from .repo_index import RepoIndex
+
+
+LANGUAGE_EXTENSIONS = {
+    '.js': 'javascript', '.jsx': 'javascript', '.mjs': 'javascript', '.cjs': 'javascript',
+    '.ts': 'typescript', '.tsx': 'typescript', '.mts': 'typescript', '.cts': 'typescript',
+    '.py': 'python',
+    '.rs': 'rust',
+    '.go': 'go',
+    '.sol': 'solidity',
+    '.move': 'move',
+    '.kt': 'kotlin', '.kts': 'kotlin',
+    '.java': 'java',
+}
+
+# Directories of third-party code the index does not already prune
+VENDORED_DIRS = {'third_party', 'third-party', 'external', 'extern', 'deps', 'pods', 'carthage'}
+
+# Attributes that exclude a file from the language statistics
+EXCLUDING_ATTRIBUTES = ('linguist-vendored', 'linguist-generated', 'linguist-documentation')
+
+_GITATTRIBUTES_KIND = fact_kind('gitattributes', EXCLUDING_ATTRIBUTES)
+
+
+def parse_gitattributes(content: str) -> list[list]:
+    """[pattern, {attribute: is set}] for the lines setting linguist attributes.
+
+    `attr` and `attr=true` set an attribute, `-attr`, `!attr` and
+    `attr=false` unset it.
+    """
+    rules = []
+    for line in content.splitlines():
+        parts = line.split()
+        if not parts or parts[0].startswith('#'):
+            continue
+        attrs = {}
+        for token in parts[1:]:
+            name, _, value = token.partition('=')
+            unset = name[:1] in '-!' or value.lower() == 'false'
+            name = name.lstrip('-!')
+            if name in EXCLUDING_ATTRIBUTES:
+                attrs[name] = not unset
+        if attrs:
+            rules.append([parts[0], attrs])
+    return rules
+
+
+@lru_cache(maxsize=1024)
+def path_pattern(pattern: str) -> re.Pattern:
+    """Compile a gitattributes-style path pattern: `*` and `?` stop at `/`,
+    `**/` matches any leading directories and `/**` everything inside.
+    Match it against the whole path with fullmatch()."""
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            parts.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i):
+            parts.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            parts.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            parts.append('[^/]')
+            i += 1
+        elif pattern[i] == '[' and ']' in pattern[i + 2:]:
+            end = pattern.index(']', i + 2)
+            body = pattern[i + 1:end].replace('\\', '\\\\')
+            if body[:1] == '!':
+                body = '^' + body[1:]
+            parts.append(f'[{body}]')
+            i = end + 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile(''.join(parts))
+
+
+def _attribute_match(path: str, pattern: str) -> bool:
+    """gitattributes pattern match: a pattern without a slash matches the
+    file name at any depth, one with a slash matches from the root."""
+    if pattern.endswith('/'):
+        return False  # gitattributes never match directories
+    if '/' not in pattern:
+        return fnmatch.fnmatchcase(path.rsplit('/', 1)[-1], pattern)
+    return path_pattern(pattern.lstrip('/')).fullmatch(path) is not None
+
+
+def _excluded(path: str, rules: list[list]) -> bool:
+    """Whether any excluding attribute is set on the file (the last matching rule wins)."""
+    state: dict[str, bool] = {}
+    for pattern, attrs in rules:
+        if _attribute_match(path, pattern):
+            state.update(attrs)
+    return any(state.values())
+
+
+def language_bytes(index: RepoIndex) -> dict[str, int]:
+    """Bytes of code per language, largest first.
+
+    Counted from file sizes in the index, so no file is read except the
+    root .gitattributes. Directories the index prunes (node_modules,
+    vendor, ...) and VENDORED_DIRS are left out, as are generated file
+    names and files marked linguist-vendored, -generated or -documentation.
+    """
+    rules: list[list] = []
+    if index.is_file('.gitattributes'):
+        try:
+            rules = index.fact('.gitattributes', _GITATTRIBUTES_KIND, parse_gitattributes,
+                               errors='replace', budgeted=False)
+        except (OSError, ValueError):
+            pass
+
+    counts: dict[str, int] = {}
+    for entry in index.files:
+        language = LANGUAGE_EXTENSIONS.get(entry.ext)
+        if language is None:
+            continue
+        dirs = entry.path.lower().split('/')[:-1]
+        if any(part in VENDORED_DIRS for part in dirs) or is_generated_name(entry.name):
+            continue
+        if rules and _excluded(entry.path, rules):
+            continue
+        counts[language] = counts.get(language, 0) + entry.size
+
+    return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+
+
+def language_shares(counts: dict[str, int]) -> dict[str, float]:
+    """Share of the code bytes per language, rounded to 3 digits."""
+    total = sum(counts.values())
+    if not total:
+        return {}
+    return {language: round(size / total, 3) for language, size in counts.items()}
\ No newline at end of file
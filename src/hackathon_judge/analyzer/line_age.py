@@ -0,0 +1,103 @@
+"""Age of the surviving lines of a repository, from `git blame --incremental`."""
+
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from hackathon_judge.config import LINE_AGE_JOBS, LINE_AGE_BUDGET, LINE_AGE_MAX_FILE_BYTES
+from hackathon_judge.fetcher.cloner import sparse_match
+from .repo_index import RepoIndex
+
+
+@dataclass
+class LineAge:
+    """Surviving lines of the blamed files, and how many were last changed before a cutoff."""
+    lines: int = 0
+    lines_before: int = 0
+    files_blamed: int = 0
+    files_skipped: int = 0  # too large, failed, or left over when the time budget ran out
+
+
+def _is_sha(token: bytes) -> bool:
+    return len(token) in (40, 64) and all(c in b'0123456789abcdef' for c in token)
+
+
+def blame_file(path: Path, rel_path: str, cutoff: float, rev: str = 'HEAD',
+               timeout: Optional[float] = None) -> tuple[int, int]:
+    """Blame one file. Returns (lines, lines last changed before cutoff).
+
+    Raises RuntimeError if git fails and subprocess.TimeoutExpired.
+    """
+    proc = subprocess.run(
+        ['git', '-C', str(path), 'blame', '--incremental', rev, '--', rel_path],
+        capture_output=True, timeout=timeout,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.decode('utf-8', errors='replace').strip())
+
+    # Each hunk starts "<sha> <orig line> <final line> <count>"; the first hunk
+    # of a commit is followed by its headers, including committer-time
+    counts: dict[bytes, int] = {}
+    times: dict[bytes, int] = {}
+    sha = None
+    for line in proc.stdout.splitlines():
+        parts = line.split(b' ')
+        if len(parts) == 4 and _is_sha(parts[0]):
+            sha = parts[0]
+            counts[sha] = counts.get(sha, 0) + int(parts[3])
+        elif sha is not None and line.startswith(b'committer-time '):
+            times[sha] = int(parts[1])
+
+    lines = sum(counts.values())
+    before = sum(n for sha, n in counts.items() if times.get(sha, 0) < cutoff)
+    return lines, before
+
+
+def measure_line_age(path: Path, cutoff: float, rev: str = 'HEAD',
+                     jobs: int = LINE_AGE_JOBS, budget: float = LINE_AGE_BUDGET) -> LineAge:
+    """Count the surviving lines at rev that were last changed before cutoff (epoch seconds).
+
+    Files matching the sparse checkout patterns are blamed, largest first,
+    by a pool of jobs workers, each running one `git blame --incremental`
+    at a time. Blame stops after budget seconds; files not reached are
+    counted as skipped. In shallow clones, lines older than the shallow
+    boundary are attributed to the boundary commit.
+    """
+    result = LineAge()
+    try:
+        index = RepoIndex.from_git(path, rev=rev, include=sparse_match)
+    except (RuntimeError, OSError, subprocess.TimeoutExpired):
+        return result
+    index.close()
+
+    files = []
+    for entry in sorted(index.files, key=lambda f: f.size, reverse=True):
+        if entry.size > LINE_AGE_MAX_FILE_BYTES:
+            result.files_skipped += 1
+        else:
+            files.append(entry.path)
+
+    deadline = time.monotonic() + budget
+
+    def blame(rel_path: str) -> Optional[tuple[int, int]]:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        try:
+            return blame_file(path, rel_path, cutoff, rev, timeout=remaining)
+        except (RuntimeError, OSError, subprocess.TimeoutExpired):
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(jobs, 1)) as pool:
+        for counts in pool.map(blame, files):
+            if counts is None:
+                result.files_skipped += 1
+                continue
+            result.files_blamed += 1
+            result.lines += counts[0]
+            result.lines_before += counts[1]
+
+    return result
@@ -0,0 +1,93 @@
+"""Compiled multi-category regex scanner."""
+
+import re
+import threading
+from typing import Iterable, Optional
+
+
+def fold_pattern(pattern: str) -> str:
+    """Lowercase a regex's literals, leaving backslash escapes (\\S, \\W, ...) intact."""
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern[i] == '\\':
+            out.append(pattern[i:i + 2])
+            i += 2
+        else:
+            out.append(pattern[i].lower())
+            i += 1
+    return ''.join(out)
+
+
+class PatternScanner:
+    """Report which pattern categories match a text, in a single scan.
+
+    All patterns of the categories still missing are combined into one
+    alternation. A scan searches for the leftmost match, resolves which
+    categories match at that position with an anchored per-category regex,
+    drops them and resumes from the next position. Every category is thus
+    reported exactly when one of its patterns matches somewhere in the text,
+    and the scan stops as soon as every category has been seen.
+
+    The combined regex deliberately has no capturing (named) groups, and
+    case-insensitive matching lowercases the patterns once and the text once
+    per scan instead of using re.IGNORECASE: both groups and IGNORECASE
+    disable the regex engine's literal prefix search and make the scan
+    several times slower.
+    """
+
+    def __init__(self, categories: dict[str, Iterable[str]], ignore_case: bool = True):
+        self.ignore_case = ignore_case
+        self.categories = {
+            name: [fold_pattern(p) if ignore_case else p for p in patterns]
+            for name, patterns in categories.items()
+        }
+        self._order = list(self.categories)
+        self._anchored = {
+            name: re.compile('|'.join(f'(?:{p})' for p in patterns))
+            for name, patterns in self.categories.items()
+        }
+        self._combined: dict[frozenset, re.Pattern] = {}
+        self._lock = threading.Lock()
+
+    def _pattern_for(self, remaining: frozenset) -> re.Pattern:
+        """Combined regex for a set of categories, compiled once per set."""
+        compiled = self._combined.get(remaining)
+        if compiled is None:
+            compiled = re.compile('|'.join(
+                f'(?:{p})'
+                for name in self._order if name in remaining
+                for p in self.categories[name]
+            ))
+            with self._lock:
+                self._combined[remaining] = compiled
+        return compiled
+
+    def scan(self, text: str, categories: Optional[Iterable[str]] = None) -> set[str]:
+        """Return the categories with at least one match in text."""
+        remaining = frozenset(categories) if categories is not None else frozenset(self._order)
+        found: set[str] = set()
+        pos = 0
+
+        if self.ignore_case:
+            text = text.lower()
+
+        while remaining:
+            match = self._pattern_for(remaining).search(text, pos)
+            if not match:
+                break
+            start = match.start()
+            hits = {name for name in remaining if self._anchored[name].match(text, start)}
+            found |= hits
+            remaining = remaining - hits
+            pos = start + 1
+
+        return found
+
+    def last(self, text: str) -> Optional[str]:
+        """Return the last category, in declaration order, that matches."""
+        found = self.scan(text)
+        for name in reversed(self._order):
+            if name in found:
+                return name
+        return None
@@ -0,0 +1,242 @@
+"""Cross-submission code provenance from winnowed k-gram fingerprints."""
+
+import subprocess
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from hackathon_judge.config import (
+    TIME_WINDOW, GIT_COMMAND_TIMEOUT, PROVENANCE_KGRAM, PROVENANCE_WINDOW,
+    PROVENANCE_MAX_FILE_BYTES, PROVENANCE_COMMON_REPOS, PROVENANCE_PAIR_SHARE,
+)
+from hackathon_judge.fetcher.cloner import is_partial_clone, sparse_match
+from .file_facts import MISSING, FactStore, fact_kind
+from .repo_index import RepoIndex
+
+
+SOURCE_EXTENSIONS = ['.js', '.ts', '.jsx', '.tsx', '.py', '.rs', '.go', '.sol']
+
+_BASE = np.uint64(1_000_003)
+_EMPTY = np.empty(0, dtype=np.uint64)
+
+
+def _mix(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer, so every bit of a k-gram hash depends on every byte."""
+    x = x ^ (x >> np.uint64(30))
+    x = x * np.uint64(0xBF58476D1CE4E5B9)
+    x = x ^ (x >> np.uint64(27))
+    x = x * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def winnow(text: str, k: int = PROVENANCE_KGRAM, w: int = PROVENANCE_WINDOW) -> np.ndarray:
+    """Winnowing fingerprints of text: sorted, unique uint64 hashes.
+
+    Whitespace is dropped and case folded first, so reformatting does not
+    hide a copy. Of every w consecutive k-gram hashes the smallest is kept,
+    which guarantees that any shared run of w + k - 1 normalized characters
+    yields a shared fingerprint.
+    """
+    normalized = ''.join(text.split()).lower().encode('utf-8', errors='surrogateescape')
+    data = np.frombuffer(normalized, dtype=np.uint8)
+    n = data.size - k + 1
+    if n <= 0:
+        return _EMPTY
+
+    # Polynomial hash of every k-gram at once, modulo 2**64 by overflow
+    hashes = np.zeros(n, dtype=np.uint64)
+    for j in range(k):
+        hashes = hashes * _BASE + data[j:j + n]
+    hashes = _mix(hashes)
+
+    if n <= w:
+        return hashes[[hashes.argmin()]]
+    windows = sliding_window_view(hashes, w)
+    picks = np.arange(len(windows)) + windows.argmin(axis=1)
+    return np.unique(hashes[picks])
+
+
+def _winnow_fact(text: str) -> list[int]:
+    return winnow(text).tolist()
+
+
+@dataclass
+class RepoFingerprints:
+    """Fingerprints of a submission's current code and of its code before the window."""
+    code: np.ndarray
+    pre_window: np.ndarray
+
+    def to_json(self) -> dict:
+        return {'code': self.code.tolist(), 'pre_window': self.pre_window.tolist()}
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'RepoFingerprints':
+        return cls(
+            code=np.asarray(data['code'], dtype=np.uint64),
+            pre_window=np.asarray(data['pre_window'], dtype=np.uint64),
+        )
+
+
+class ProvenanceIndex:
+    """Inverted index from code fingerprints to the submissions holding them.
+
+    Adding a submission costs time proportional to its own fingerprints,
+    never a comparison against every other submission: each fingerprint is
+    looked up in a hash table of postings. The index records both current
+    code and the code of each repository's newest commit before the
+    hackathon window, so report() can say which share of a project's code
+    already existed, before the window, in another submission.
+
+    Per-file fingerprints are cached by blob SHA and whole-repo
+    fingerprints by HEAD SHA in the FactStore, so unchanged repos (and
+    repos skipped on resume) are indexed without reading any files.
+    """
+
+    def __init__(self, facts: Optional[FactStore] = None, time_window=None):
+        self.facts = facts if facts is not None else FactStore(persist=False)
+        self.window = time_window or TIME_WINDOW
+        self._file_kind = fact_kind('winnow', PROVENANCE_KGRAM, PROVENANCE_WINDOW)
+        self._repo_kind = fact_kind(
+            'provenance', PROVENANCE_KGRAM, PROVENANCE_WINDOW, SOURCE_EXTENSIONS,
+            PROVENANCE_MAX_FILE_BYTES, self.window.start.isoformat(),
+        )
+        self._ids: list[str] = []
+        self._slots: dict[str, int] = {}
+        self._sizes: list[int] = []
+        self._fingerprints: list[RepoFingerprints] = []
+        self._code: dict[int, list[int]] = {}
+        self._pre_window: dict[int, list[int]] = {}
+
+    def __contains__(self, project_id: str) -> bool:
+        return project_id in self._slots
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def fingerprint(self, index: RepoIndex, local_path: Optional[Path] = None,
+                    head_sha: Optional[str] = None) -> RepoFingerprints:
+        """Fingerprint a repository and remember the result under its HEAD SHA."""
+        fingerprints = RepoFingerprints(
+            code=self._fingerprint_index(index),
+            pre_window=self._pre_window_fingerprints(local_path) if local_path else _EMPTY,
+        )
+        if head_sha:
+            self.facts.put(head_sha, self._repo_kind, fingerprints.to_json())
+        return fingerprints
+
+    def lookup(self, head_sha: Optional[str]) -> Optional[RepoFingerprints]:
+        """Fingerprints stored for a HEAD SHA by an earlier fingerprint() call."""
+        if not head_sha:
+            return None
+        data = self.facts.get(head_sha, self._repo_kind)
+        return None if data is MISSING else RepoFingerprints.from_json(data)
+
+    def _fingerprint_index(self, index: RepoIndex) -> np.ndarray:
+        """Union of the fingerprints of every source file in the index."""
+        parts = []
+        for ext in SOURCE_EXTENSIONS:
+            for entry in index.files_with_ext(ext):
+                if entry.size > PROVENANCE_MAX_FILE_BYTES:
+                    continue
+                try:
+                    # Every source file counts, not just the analyzers' content budget
+                    parts.append(index.fact(entry.path, self._file_kind, _winnow_fact,
+                                            errors='ignore', budgeted=False))
+                except (OSError, ValueError):
+                    continue
+        if not parts:
+            return _EMPTY
+        return np.unique(np.concatenate([np.asarray(p, dtype=np.uint64) for p in parts]))
+
+    def _pre_window_fingerprints(self, path: Path) -> np.ndarray:
+        """Fingerprints of the newest commit before the window, read from git objects."""
+        window_start = datetime.combine(self.window.start, datetime.min.time()).timestamp()
+        try:
+            proc = subprocess.run(
+                ['git', '-C', str(path), 'rev-list', '-1', f'--before={int(window_start)}', 'HEAD'],
+                capture_output=True, text=True, timeout=GIT_COMMAND_TIMEOUT,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return _EMPTY
+        sha = proc.stdout.strip()
+        if proc.returncode != 0 or not sha:
+            return _EMPTY
+
+        # Partial clones hold history blobs for their sparse paths only
+        include = sparse_match if is_partial_clone(path) else None
+        try:
+            snapshot = RepoIndex.from_git(path, rev=sha, facts=self.facts, include=include)
+        except (RuntimeError, OSError, subprocess.TimeoutExpired):
+            return _EMPTY
+        try:
+            return self._fingerprint_index(snapshot)
+        finally:
+            snapshot.close()
+
+    def add(self, project_id: str, fingerprints: Optional[RepoFingerprints]):
+        """Index a submission. Submissions already indexed, or without fingerprints, are ignored."""
+        if fingerprints is None or project_id in self._slots:
+            return
+
+        slot = len(self._ids)
+        self._ids.append(project_id)
+        self._slots[project_id] = slot
+        self._sizes.append(len(fingerprints.code))
+        self._fingerprints.append(fingerprints)
+        for fp in fingerprints.code.tolist():
+            self._code.setdefault(fp, []).append(slot)
+        for fp in fingerprints.pre_window.tolist():
+            self._pre_window.setdefault(fp, []).append(slot)
+
+    def report(self, project_id: str) -> dict:
+        """Overlap of a submission's code with every other indexed submission.
+
+        Returns code_overlaps (other submissions sharing at least
+        PROVENANCE_PAIR_SHARE of the smaller code base), pre_window_code_share
+        (share of this submission's fingerprints present in another
+        submission's pre-window commit) and pre_window_code_sources.
+        Fingerprints held by more than PROVENANCE_COMMON_REPOS submissions
+        are treated as boilerplate and ignored.
+        """
+        slot = self._slots[project_id]
+        shared: Counter = Counter()
+        sources: Counter = Counter()
+        counted = pre_window_hits = 0
+
+        for fp in self._fingerprints[slot].code.tolist():
+            holders = self._code[fp]
+            if len(holders) > PROVENANCE_COMMON_REPOS:
+                continue
+            counted += 1
+            shared.update(other for other in holders if other != slot)
+
+            earlier = [other for other in self._pre_window.get(fp, ()) if other != slot]
+            if earlier:
+                pre_window_hits += 1
+                sources.update(earlier)
+
+        overlaps = []
+        for other, count in shared.items():
+            share = count / max(min(self._sizes[slot], self._sizes[other]), 1)
+            if share >= PROVENANCE_PAIR_SHARE:
+                overlaps.append({'project_id': self._ids[other], 'overlap': round(share, 3)})
+        overlaps.sort(key=lambda o: o['overlap'], reverse=True)
+
+        return {
+            'code_overlaps': overlaps,
+            'pre_window_code_share': round(pre_window_hits / counted, 3) if counted else 0.0,
+            'pre_window_code_sources': [self._ids[other] for other, _ in sources.most_common()],
+        }
+
+    def stats(self) -> dict:
+        pairs = sum(len(self.report(pid)['code_overlaps']) for pid in self._ids) // 2
+        return {
+            'indexed': len(self._ids),
+            'fingerprints': len(self._code),
+            'overlapping_pairs': pairs,
+        }
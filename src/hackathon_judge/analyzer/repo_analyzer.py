@@ -7,6 +7,9 @@ from typing import Optional
 
 from hackathon_judge.models import AnalysisResult, RepoMetadata
 from hackathon_judge.fetcher import GitHubAPI
+from .repo_index import RepoIndex
+from .file_facts import fact_kind
+from .languages import language_bytes, language_shares
 
 
 class RepoAnalyzer:
@@ -26,6 +29,7 @@ class RepoAnalyzer:
         'ethereum': [r'ethers', r'web3', r'hardhat', r'foundry'],
     }
 
+    # Marker files and extensions, for repos without any counted code
     LANGUAGE_FILES = {
         'javascript': ['package.json', '.js', '.jsx'],
         'typescript': ['tsconfig.json', '.ts', '.tsx'],
@@ -49,56 +53,80 @@ class RepoAnalyzer:
     def __init__(self, github_api: GitHubAPI):
         self.api = github_api
 
+        # Per-file facts, cached by blob SHA in the repo index
+        self._package_kind = fact_kind('frameworks-package', self.FRAMEWORK_PATTERNS)
+        self._requirements_kind = fact_kind('frameworks-requirements')
+        self._cargo_kind = fact_kind('frameworks-cargo')
+        self._readme_kind = fact_kind('readme-quality')
+        self._demo_url_kind = fact_kind('demo-url')
+        self._error_handling_kind = fact_kind('error-handling')
+
     def analyze(self, project_id: str, github_url: str,
                 metadata: Optional[RepoMetadata] = None,
-                local_path: Optional[Path] = None) -> AnalysisResult:
-        """Analyze a repository."""
+                local_path: Optional[Path] = None,
+                index: Optional[RepoIndex] = None) -> AnalysisResult:
+        """Analyze a repository.
+
+        Pass a prebuilt index to share one tree walk between analyzers, or an
+        index built from the GitHub tree to analyze without a clone.
+        """
         result = AnalysisResult(project_id=project_id)
 
         try:
-            if local_path and local_path.exists():
-                return self._analyze_local(result, local_path, metadata)
+            if index is None and local_path and local_path.exists():
+                index = RepoIndex.build(local_path)
+
+            if index is not None:
+                return self._analyze_index(result, index, metadata)
             else:
                 return self._analyze_remote(result, github_url, metadata)
         except Exception as e:
             result.error = str(e)
             return result
 
-    def _analyze_local(self, result: AnalysisResult, path: Path,
+    def _analyze_index(self, result: AnalysisResult, index: RepoIndex,
                        metadata: Optional[RepoMetadata]) -> AnalysisResult:
-        """Analyze a locally cloned repository."""
-        # Detect languages
-        result.languages = self._detect_languages_local(path)
+        """Analyze a repository through its file index (clone or remote tree)."""
+        if index.truncated:
+            result.concerns.append(
+                "GitHub truncated the file tree: languages, tests and deployment "
+                "were detected from a partial file list"
+            )
+
+        # Detect languages, by bytes of code
+        result.language_bytes = language_bytes(index)
+        result.language_shares = language_shares(result.language_bytes)
+        result.languages = list(result.language_bytes) or self._detect_languages_local(index)
 
         # Detect frameworks from package files
-        result.frameworks = self._detect_frameworks_local(path)
+        result.frameworks = self._detect_frameworks_local(index)
 
         # Check README
-        readme_path = self._find_readme(path)
+        readme_path = self._find_readme(index)
         if readme_path:
             result.has_readme = True
-            result.readme_quality = self._evaluate_readme(readme_path)
+            result.readme_quality = self._evaluate_readme(index, readme_path)
         else:
             result.readme_quality = 0
 
         # Check for tests
-        result.has_tests, result.test_coverage_estimate = self._detect_tests_local(path)
+        result.has_tests, result.test_coverage_estimate = self._detect_tests_local(index)
 
         # Check for demo URL in README
         if readme_path:
-            demo_url = self._extract_demo_url(readme_path)
+            demo_url = self._extract_demo_url(index, readme_path)
             if demo_url:
                 result.has_demo = True
                 result.demo_url = demo_url
 
         # Check deployment config
-        result.has_deployment_config, result.deployment_target = self._detect_deployment_local(path)
+        result.has_deployment_config, result.deployment_target = self._detect_deployment_local(index)
 
         # Evaluate code quality signals
-        result.code_quality_signals = self._evaluate_quality_signals_local(path)
+        result.code_quality_signals = self._evaluate_quality_signals_local(index)
 
         # Determine architecture
-        result.architecture = self._detect_architecture_local(path)
+        result.architecture = self._detect_architecture_local(index)
 
         # Add notable findings
         result.notable_findings = self._gather_findings(result)
@@ -122,9 +150,14 @@ class RepoAnalyzer:
         owner = match.group(1)
         repo = match.group(2).rstrip('/').replace('.git', '')
 
-        # Get languages
+        # Get languages (GitHub's linguist byte counts)
         languages = self.api.get_languages(owner, repo)
-        result.languages = list(languages.keys())
+        result.language_bytes = {
+            name.lower(): size
+            for name, size in sorted(languages.items(), key=lambda item: item[1], reverse=True)
+        }
+        result.language_shares = language_shares(result.language_bytes)
+        result.languages = list(result.language_bytes)
 
         # Get root contents
         contents = self.api.get_repo_contents(owner, repo)
@@ -182,64 +215,64 @@ class RepoAnalyzer:
 
         return result
 
-    def _detect_languages_local(self, path: Path) -> list[str]:
-        """Detect languages from local files."""
+    def _detect_languages_local(self, index: RepoIndex) -> list[str]:
+        """Detect languages from marker files and extensions."""
         languages = set()
 
         for lang, patterns in self.LANGUAGE_FILES.items():
             for pattern in patterns:
                 if pattern.startswith('.'):
                     # File extension
-                    if list(path.rglob(f'*{pattern}'))[:1]:
+                    if index.files_with_ext(pattern):
                         languages.add(lang)
                 else:
                     # Specific file
-                    if (path / pattern).exists():
+                    if index.exists(pattern):
                         languages.add(lang)
 
         return list(languages)
 
-    def _detect_frameworks_local(self, path: Path) -> list[str]:
+    def _detect_frameworks_local(self, index: RepoIndex) -> list[str]:
         """Detect frameworks from local package files."""
         frameworks = set()
 
         # Check package.json
-        pkg_path = path / 'package.json'
-        if pkg_path.exists():
+        if index.is_file('package.json'):
             try:
-                content = pkg_path.read_text()
-                frameworks.update(self._detect_frameworks_from_content(content))
+                frameworks.update(index.fact(
+                    'package.json', self._package_kind,
+                    lambda content: sorted(self._detect_frameworks_from_content(content))
+                ))
             except:
                 pass
 
         # Check requirements.txt
-        req_path = path / 'requirements.txt'
-        if req_path.exists():
+        if index.is_file('requirements.txt'):
             try:
-                content = req_path.read_text().lower()
-                if 'fastapi' in content:
-                    frameworks.add('fastapi')
-                if 'django' in content:
-                    frameworks.add('django')
-                if 'flask' in content:
-                    frameworks.add('flask')
+                frameworks.update(index.fact(
+                    'requirements.txt', self._requirements_kind,
+                    lambda content: self._frameworks_named(content, ['fastapi', 'django', 'flask'])
+                ))
             except:
                 pass
 
         # Check Cargo.toml for Rust frameworks
-        cargo_path = path / 'Cargo.toml'
-        if cargo_path.exists():
+        if index.is_file('Cargo.toml'):
             try:
-                content = cargo_path.read_text().lower()
-                if 'actix' in content:
-                    frameworks.add('actix')
-                if 'anchor' in content:
-                    frameworks.add('anchor')
+                frameworks.update(index.fact(
+                    'Cargo.toml', self._cargo_kind,
+                    lambda content: self._frameworks_named(content, ['actix', 'anchor'])
+                ))
             except:
                 pass
 
         return list(frameworks)
 
+    def _frameworks_named(self, content: str, names: list[str]) -> list[str]:
+        """Frameworks whose name appears in a manifest."""
+        content = content.lower()
+        return [name for name in names if name in content]
+
     def _detect_frameworks_from_content(self, content: str) -> list[str]:
         """Detect frameworks from package.json content."""
         frameworks = set()
@@ -253,19 +286,17 @@ class RepoAnalyzer:
 
         return list(frameworks)
 
-    def _find_readme(self, path: Path) -> Optional[Path]:
+    def _find_readme(self, index: RepoIndex) -> Optional[str]:
         """Find README file in repository."""
         for name in ['README.md', 'README.MD', 'readme.md', 'README', 'Readme.md']:
-            readme = path / name
-            if readme.exists():
-                return readme
+            if index.is_file(name):
+                return name
         return None
 
-    def _evaluate_readme(self, readme_path: Path) -> int:
+    def _evaluate_readme(self, index: RepoIndex, readme_path: str) -> int:
         """Evaluate README quality (1-10)."""
         try:
-            content = readme_path.read_text()
-            return self._evaluate_readme_content(content)
+            return index.fact(readme_path, self._readme_kind, self._evaluate_readme_content)
         except:
             return 0
 
@@ -313,11 +344,10 @@ class RepoAnalyzer:
 
         return min(score, 10)
 
-    def _extract_demo_url(self, readme_path: Path) -> Optional[str]:
+    def _extract_demo_url(self, index: RepoIndex, readme_path: str) -> Optional[str]:
         """Extract demo URL from README."""
         try:
-            content = readme_path.read_text()
-            return self._extract_demo_url_from_content(content)
+            return index.fact(readme_path, self._demo_url_kind, self._extract_demo_url_from_content)
         except:
             return None
 
@@ -344,17 +374,17 @@ class RepoAnalyzer:
 
         return None
 
-    def _detect_tests_local(self, path: Path) -> tuple[bool, str]:
+    def _detect_tests_local(self, index: RepoIndex) -> tuple[bool, str]:
         """Detect tests and estimate coverage."""
         test_dirs = ['test', 'tests', '__tests__', 'spec']
-        test_files = list(path.rglob('*test*.py')) + list(path.rglob('*.test.js')) + \
-                     list(path.rglob('*.spec.js')) + list(path.rglob('*test*.ts'))
+        test_files = index.match('*test*.py') + index.match('*.test.js') + \
+                     index.match('*.spec.js') + index.match('*test*.ts')
 
         has_tests = False
         coverage = "none"
 
         for td in test_dirs:
-            if (path / td).exists():
+            if index.exists(td):
                 has_tests = True
                 break
 
@@ -369,20 +399,20 @@ class RepoAnalyzer:
 
         return has_tests, coverage
 
-    def _detect_deployment_local(self, path: Path) -> tuple[bool, Optional[str]]:
+    def _detect_deployment_local(self, index: RepoIndex) -> tuple[bool, Optional[str]]:
         """Detect deployment configuration."""
         for target, patterns in self.DEPLOYMENT_CONFIGS.items():
             for pattern in patterns:
                 if '/' in pattern:
-                    if (path / pattern.rstrip('/')).is_dir():
+                    if index.is_dir(pattern):
                         return True, target
                 else:
-                    if (path / pattern).exists():
+                    if index.exists(pattern):
                         return True, target
 
         return False, None
 
-    def _evaluate_quality_signals_local(self, path: Path) -> dict:
+    def _evaluate_quality_signals_local(self, index: RepoIndex) -> dict:
         """Evaluate code quality signals."""
         signals = {
             'linting': False,
@@ -394,25 +424,25 @@ class RepoAnalyzer:
         # Check for linting config
         lint_files = ['.eslintrc', '.eslintrc.js', '.eslintrc.json', 'eslint.config.js', '.pylintrc', 'ruff.toml']
         for lf in lint_files:
-            if (path / lf).exists():
+            if index.exists(lf):
                 signals['linting'] = True
                 break
 
         # Check for formatting config
         format_files = ['.prettierrc', '.prettierrc.js', 'prettier.config.js', 'pyproject.toml', '.editorconfig']
         for ff in format_files:
-            if (path / ff).exists():
+            if index.exists(ff):
                 signals['formatting'] = True
                 break
 
         # Error handling - check for try/catch patterns
         try:
-            sample_files = list(path.rglob('*.py'))[:5] + list(path.rglob('*.js'))[:5] + list(path.rglob('*.ts'))[:5]
+            sample_files = index.files_with_ext('.py')[:5] + index.files_with_ext('.js')[:5] + \
+                           index.files_with_ext('.ts')[:5]
             error_patterns = 0
             for sf in sample_files:
                 try:
-                    content = sf.read_text()
-                    if 'try' in content and ('catch' in content or 'except' in content):
+                    if index.fact(sf.path, self._error_handling_kind, self._has_error_handling):
                         error_patterns += 1
                 except:
                     pass
@@ -424,9 +454,9 @@ class RepoAnalyzer:
             pass
 
         # Documentation check
-        readme = self._find_readme(path)
+        readme = self._find_readme(index)
         if readme:
-            quality = self._evaluate_readme(readme)
+            quality = self._evaluate_readme(index, readme)
             if quality >= 7:
                 signals['documentation'] = 'good'
             elif quality >= 4:
@@ -434,16 +464,19 @@ class RepoAnalyzer:
 
         return signals
 
-    def _detect_architecture_local(self, path: Path) -> str:
+    def _has_error_handling(self, content: str) -> bool:
+        return 'try' in content and ('catch' in content or 'except' in content)
+
+    def _detect_architecture_local(self, index: RepoIndex) -> str:
         """Detect project architecture."""
-        dirs = [d.name for d in path.iterdir() if d.is_dir() and not d.name.startswith('.')]
+        dirs = [d for d in index.top_level_dirs() if not d.startswith('.')]
 
         if 'frontend' in dirs and 'backend' in dirs:
             return 'frontend/backend split'
         if 'client' in dirs and 'server' in dirs:
             return 'client/server split'
         if 'src' in dirs:
-            if (path / 'src' / 'components').exists():
+            if index.exists('src/components'):
                 return 'frontend SPA'
             return 'monolith'
         if 'packages' in dirs or 'apps' in dirs:
@@ -0,0 +1,456 @@
+"""Single-pass file index shared by all analyzers."""
+
+import fnmatch
+import os
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from hackathon_judge.config import (
+    REMOTE_BYTE_BUDGET, REMOTE_MAX_FILES, GIT_COMMAND_TIMEOUT, CONTENT_MINIFIED_LINE_LENGTH,
+)
+from .content_budget import (
+    GENERATED_MARKERS, ContentBudget, looks_generated,
+)
+from .file_facts import MISSING, FactStore, fact_kind, git_blob_shas
+
+if TYPE_CHECKING:
+    from hackathon_judge.fetcher import GitHubAPI
+    from .vendored import VendoredFiles
+
+
+def _parent_dirs(path: str) -> list[str]:
+    """'a/b/c.js' -> ['a', 'a/b']."""
+    parts = path.split('/')[:-1]
+    return ['/'.join(parts[:i]) for i in range(1, len(parts) + 1)]
+
+
+@dataclass
+class FileEntry:
+    """A file in the repository index."""
+    path: str  # POSIX path relative to the repo root
+    ext: str  # lowercased suffix including the dot, '' if none
+    size: int = 0
+    mtime: float = 0.0
+    blob_sha: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return self.path.rsplit('/', 1)[-1]
+
+
+class ContentBudgetExceeded(OSError):
+    """Raised when reading a file would exceed the source's download budget,
+    or the file is outside the index's content budget."""
+
+
+_GENERATED_KIND = fact_kind('generated', CONTENT_MINIFIED_LINE_LENGTH, GENERATED_MARKERS)
+
+
+class WorkTreeSource:
+    """Read file contents from a checked-out working tree."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def read_bytes(self, rel_path: str) -> bytes:
+        return (self.root / rel_path).read_bytes()
+
+    def close(self):
+        pass
+
+
+class GitObjectSource:
+    """Read file contents straight from a repository's object database.
+
+    Blobs are streamed through one long-lived `git cat-file --batch`
+    process, so no working tree is needed.
+    """
+
+    def __init__(self, root: Path, shas: dict[str, str]):
+        self.root = Path(root)
+        self.shas = shas
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def read_bytes(self, rel_path: str) -> bytes:
+        sha = self.shas.get(rel_path)
+        if sha is None:
+            raise FileNotFoundError(rel_path)
+
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._proc = subprocess.Popen(
+                    ['git', '-C', str(self.root), 'cat-file', '--batch'],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                )
+            self._proc.stdin.write(sha.encode('ascii') + b'\n')
+            self._proc.stdin.flush()
+
+            # "<sha> blob <size>\n<content>\n", or "<sha> missing\n"
+            header = self._proc.stdout.readline().split()
+            if len(header) != 3:
+                raise FileNotFoundError(rel_path)
+            data = self._proc.stdout.read(int(header[2]))
+            self._proc.stdout.read(1)
+            return data
+
+    def close(self):
+        with self._lock:
+            if self._proc is not None:
+                self._proc.stdin.close()
+                try:
+                    self._proc.wait(timeout=GIT_COMMAND_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    self._proc.kill()
+                self._proc = None
+
+
+class GitHubBlobSource:
+    """Read file contents from raw.githubusercontent.com, within a budget.
+
+    Each file is downloaded at most once. Files that would take the repo past
+    max_bytes or max_files raise ContentBudgetExceeded without a request, so
+    callers that already skip unreadable files need no special handling.
+    """
+
+    def __init__(self, api: 'GitHubAPI', owner: str, repo: str, ref: str,
+                 sizes: dict[str, int], max_bytes: int = REMOTE_BYTE_BUDGET,
+                 max_files: int = REMOTE_MAX_FILES):
+        self.api = api
+        self.owner = owner
+        self.repo = repo
+        self.ref = ref
+        self.sizes = sizes
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.bytes_read = 0
+        self.files_read = 0
+        self._cache: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def read_bytes(self, rel_path: str) -> bytes:
+        with self._lock:
+            if rel_path in self._cache:
+                return self._cache[rel_path]
+
+            size = self.sizes.get(rel_path, 0)
+            if (self.files_read >= self.max_files
+                    or self.bytes_read + size > self.max_bytes):
+                raise ContentBudgetExceeded(f"Download budget exhausted before {rel_path}")
+            self.files_read += 1
+            self.bytes_read += size
+
+        content = self.api.get_raw_file(self.owner, self.repo, self.ref, rel_path)
+        if content is None:
+            raise FileNotFoundError(rel_path)
+
+        with self._lock:
+            self._cache[rel_path] = content
+        return content
+
+    def close(self):
+        self._cache.clear()
+
+
+class RepoIndex:
+    """Every file in a repository, collected by one pruned directory walk.
+
+    Analyzers query the index instead of calling Path.rglob, so the tree is
+    walked once per repo and vendored directories are never descended into.
+    The same index can be built from the git object database of a clone
+    without a checkout, or from a GitHub tree listing instead of a clone;
+    file contents are then read with `git cat-file --batch` or through a
+    budgeted remote source.
+
+    Facts derived from a file's content are obtained through fact(), which
+    caches them by blob SHA in a FactStore, usually one shared by all repos.
+    fact() only reads the files admitted by the index's ContentBudget; the
+    others raise ContentBudgetExceeded and are listed by budget.report().
+    Readers that must see every file (provenance, .gitattributes) pass
+    budgeted=False.
+    """
+
+    # Directories that are recorded but never descended into
+    PRUNED_DIRS = {
+        '.git', 'node_modules', 'bower_components', 'dist', 'build', '.next',
+        'target', 'vendor', 'venv', '.venv', '__pycache__',
+    }
+
+    def __init__(self, files: list[FileEntry], dirs: set[str],
+                 source: 'WorkTreeSource | GitObjectSource | GitHubBlobSource',
+                 facts: Optional[FactStore] = None):
+        self.source = source
+        self.facts = facts if facts is not None else FactStore(persist=False)
+        self.root: Optional[Path] = getattr(source, 'root', None)
+        self.truncated = False
+        self.budget = ContentBudget()
+        self.dirs = dirs
+        self._set_files(sorted(files, key=lambda f: f.path))
+
+    def _set_files(self, files: list[FileEntry]):
+        self.files = files
+        self._by_path = {f.path: f for f in self.files}
+        self._by_ext: dict[str, list[FileEntry]] = {}
+        for f in self.files:
+            self._by_ext.setdefault(f.ext, []).append(f)
+
+    @classmethod
+    def build(cls, root: Path, facts: Optional[FactStore] = None) -> 'RepoIndex':
+        """Walk the tree under root once with os.scandir.
+
+        In a git work tree, files get their blob SHA from the git index so
+        their content facts can be cached in facts.
+        """
+        root = Path(root)
+        files: list[FileEntry] = []
+        dirs: set[str] = set()
+        stack = ['']
+
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                with os.scandir(root / rel_dir) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            for entry in entries:
+                rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.add(rel)
+                        if entry.name not in cls.PRUNED_DIRS:
+                            stack.append(rel)
+                    elif entry.is_file():
+                        st = entry.stat()
+                        files.append(FileEntry(
+                            path=rel,
+                            ext=os.path.splitext(entry.name)[1].lower(),
+                            size=st.st_size,
+                            mtime=st.st_mtime,
+                        ))
+                except OSError:
+                    continue
+
+        if (root / '.git').is_dir():
+            shas = git_blob_shas(root)
+            for f in files:
+                f.blob_sha = shas.get(f.path)
+
+        return cls(files, dirs, WorkTreeSource(root), facts)
+
+    @classmethod
+    def from_github(cls, api: 'GitHubAPI', owner: str, repo: str, ref: str,
+                    max_bytes: int = REMOTE_BYTE_BUDGET,
+                    max_files: int = REMOTE_MAX_FILES,
+                    facts: Optional[FactStore] = None) -> Optional['RepoIndex']:
+        """Build the index from one recursive Git Trees API call.
+
+        Entries below pruned directories are dropped, exactly as the local
+        walk never descends into them. Returns None if the tree is unavailable.
+        """
+        tree = api.get_tree(owner, repo, ref)
+        if not tree.get('tree'):
+            return None
+
+        files, dirs = cls._from_tree_entries(
+            (e.get('path', ''), e.get('type'), e.get('size', 0), e.get('sha'))
+            for e in tree['tree']
+        )
+        source = GitHubBlobSource(
+            api, owner, repo, ref,
+            sizes={f.path: f.size for f in files},
+            max_bytes=max_bytes,
+            max_files=max_files,
+        )
+        index = cls(files, dirs, source, facts)
+        index.truncated = bool(tree.get('truncated'))
+        return index
+
+    @classmethod
+    def from_git(cls, root: Path, rev: str = 'HEAD', facts: Optional[FactStore] = None,
+                 include: Optional[Callable[[str], bool]] = None) -> 'RepoIndex':
+        """Build the index from `git ls-tree` of rev, without a working tree.
+
+        include, if given, limits the index to matching paths (e.g. the
+        sparse patterns of a partial clone, whose other blobs are absent).
+        Raises RuntimeError if git fails.
+        """
+        proc = subprocess.run(
+            ['git', '-C', str(root), 'ls-tree', '-r', '-t', '-l', '-z', rev],
+            capture_output=True, timeout=GIT_COMMAND_TIMEOUT,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.decode('utf-8', errors='replace').strip())
+
+        def entries():
+            for record in proc.stdout.split(b'\0'):
+                # "<mode> <type> <sha> <size>\t<path>"
+                meta, _, raw_path = record.partition(b'\t')
+                parts = meta.split()
+                if len(parts) != 4:
+                    continue
+                path = raw_path.decode('utf-8', errors='surrogateescape')
+                kind = parts[1].decode('ascii')
+                if kind == 'blob' and include is not None and not include(path):
+                    continue
+                size = int(parts[3]) if parts[3].isdigit() else 0
+                yield path, kind, size, parts[2].decode('ascii')
+
+        files, dirs = cls._from_tree_entries(entries())
+        if include is not None:
+            # A sparse checkout only creates directories that hold included files
+            dirs = {d for f in files for d in _parent_dirs(f.path)}
+        source = GitObjectSource(root, {f.path: f.blob_sha for f in files})
+        return cls(files, dirs, source, facts)
+
+    @classmethod
+    def open(cls, root: Path, facts: Optional[FactStore] = None,
+             checkout: bool = True) -> 'RepoIndex':
+        """Index a clone: walk its working tree, or read the object database
+        directly when it was cloned without a checkout."""
+        if checkout:
+            return cls.build(root, facts)
+
+        from hackathon_judge.fetcher.cloner import is_partial_clone, sparse_match
+        include = sparse_match if is_partial_clone(root) else None
+        return cls.from_git(root, facts=facts, include=include)
+
+    @classmethod
+    def _from_tree_entries(cls, entries) -> tuple[list[FileEntry], set[str]]:
+        """Files and dirs from (path, type, size, blob sha) tree entries.
+
+        Entries below pruned directories are dropped, as in the local walk.
+        """
+        files: list[FileEntry] = []
+        dirs: set[str] = set()
+        for path, kind, size, sha in entries:
+            parents = path.split('/')[:-1]
+            if any(part in cls.PRUNED_DIRS for part in parents):
+                continue
+
+            if kind == 'tree':
+                dirs.add(path)
+            elif kind == 'blob':
+                name = path.rsplit('/', 1)[-1]
+                files.append(FileEntry(
+                    path=path,
+                    ext=os.path.splitext(name)[1].lower(),
+                    size=size,
+                    blob_sha=sha,
+                ))
+        return files, dirs
+
+    def exclude_vendored(self, vendored: 'VendoredFiles') -> list[FileEntry]:
+        """Drop the files vendored recognises as third-party from the index.
+
+        Call before analysis: excluded files are neither queried nor read,
+        and are listed in the content budget's report. Files only matched
+        by a learned blob SHA stay indexed but outside the content budget,
+        so provenance (budgeted=False) still fingerprints them. Returns
+        the excluded files.
+        """
+        kept, excluded = [], []
+        for entry in self.files:
+            label = vendored.match(entry.path, entry.blob_sha)
+            if label:
+                excluded.append(entry)
+                self.budget.skip(entry.path, f"vendored ({label})", entry.size)
+                if vendored.match(entry.path, entry.blob_sha, learned=False) is None:
+                    kept.append(entry)
+            else:
+                kept.append(entry)
+        if len(kept) < len(self.files):
+            self._set_files(kept)
+        return excluded
+
+    def close(self):
+        """Release the content source (e.g. its git process)."""
+        self.source.close()
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def files_with_ext(self, *exts: str) -> list[FileEntry]:
+        """Files with any of the given extensions ('.ts'), in path order."""
+        if len(exts) == 1:
+            return list(self._by_ext.get(exts[0].lower(), []))
+        wanted = {e.lower() for e in exts}
+        return [f for f in self.files if f.ext in wanted]
+
+    def match(self, pattern: str) -> list[FileEntry]:
+        """Files whose name matches a glob pattern (case-sensitive)."""
+        return [f for f in self.files if fnmatch.fnmatchcase(f.name, pattern)]
+
+    def get(self, rel_path: str) -> Optional[FileEntry]:
+        return self._by_path.get(rel_path.strip('/'))
+
+    def is_file(self, rel_path: str) -> bool:
+        return rel_path.strip('/') in self._by_path
+
+    def is_dir(self, rel_path: str) -> bool:
+        return rel_path.strip('/') in self.dirs
+
+    def exists(self, rel_path: str) -> bool:
+        return self.is_file(rel_path) or self.is_dir(rel_path)
+
+    def top_level_dirs(self) -> list[str]:
+        """Names of directories directly under the root."""
+        return sorted(d for d in self.dirs if '/' not in d)
+
+    def read_bytes(self, rel_path: str) -> bytes:
+        """Read a file from the index's content source."""
+        return self.source.read_bytes(rel_path.strip('/'))
+
+    def read_text(self, rel_path: str, errors: str = 'strict') -> str:
+        """Read a file from the index as UTF-8 text."""
+        return self.read_bytes(rel_path).decode('utf-8', errors=errors)
+
+    def fact(self, rel_path: str, kind: str, compute: Callable[[str], Any],
+             errors: str = 'strict', budgeted: bool = True) -> Any:
+        """Return compute(file text), cached by the file's blob SHA.
+
+        compute must return a JSON-serializable value. Read errors and
+        exceptions from compute propagate and are not cached. Files outside
+        the content budget (unless budgeted=False), or found to be minified
+        or generated, raise ContentBudgetExceeded.
+        """
+        entry = self.get(rel_path)
+        if entry is None:
+            raise FileNotFoundError(rel_path)
+        if budgeted:
+            if not self.budget.planned:
+                self.budget.plan(self.files)
+            refusal = self.budget.refusal(entry.path)
+            if refusal:
+                raise ContentBudgetExceeded(f"{entry.path}: {refusal}")
+
+        blob_sha = entry.blob_sha
+        if blob_sha:
+            value = self.facts.get(blob_sha, kind)
+            if value is not MISSING:
+                return value
+            if self.facts.get(blob_sha, _GENERATED_KIND, count=False) is True:
+                return self._skip_generated(entry)
+
+        text = self.read_text(entry.path, errors=errors)
+        if looks_generated(text):
+            if blob_sha:
+                self.facts.put(blob_sha, _GENERATED_KIND, True)
+            return self._skip_generated(entry)
+
+        value = compute(text)
+        if blob_sha:
+            self.facts.put(blob_sha, kind, value)
+        return value
+
+    def _skip_generated(self, entry: FileEntry):
+        self.budget.skip(entry.path, 'minified or generated', entry.size)
+        raise ContentBudgetExceeded(f"{entry.path}: minified or generated")
+
+    def save_facts(self):
+        """Write the facts computed for this repo to the fact store."""
+        self.facts.flush()
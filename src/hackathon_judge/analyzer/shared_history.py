@@ -0,0 +1,167 @@
+"""Shared-history (fork and template) detection from commit SHAs across submissions."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+from hackathon_judge.config import TIME_WINDOW
+from .commit_log import CommitTimeline
+from .file_facts import MISSING, FactStore, fact_kind
+
+
+def sha_keys(shas: list[str]) -> np.ndarray:
+    """The first 64 bits of each hex SHA as uint64.
+
+    Collisions between unrelated commits are vanishingly unlikely at the
+    scale of a hackathon, and the keys sort and compare as plain integers.
+    """
+    if not shas:
+        return np.empty(0, dtype=np.uint64)
+    raw = bytes.fromhex(''.join(sha[:16] for sha in shas))
+    return np.frombuffer(raw, dtype='>u8').astype(np.uint64)
+
+
+@dataclass
+class RepoHistory:
+    """Commit keys of one repository, sorted, with their committer timestamps."""
+    keys: np.ndarray
+    committer_ts: np.ndarray
+    roots: np.ndarray
+
+    @classmethod
+    def from_timeline(cls, timeline: CommitTimeline) -> 'RepoHistory':
+        keys = sha_keys(timeline.shas)
+        order = np.argsort(keys)
+        return cls(
+            keys=keys[order],
+            committer_ts=timeline.committer_ts[order],
+            roots=np.unique(keys[timeline.parent_count == 0]),
+        )
+
+    def to_json(self) -> dict:
+        return {
+            'keys': self.keys.tolist(),
+            'committer_ts': self.committer_ts.tolist(),
+            'roots': self.roots.tolist(),
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'RepoHistory':
+        return cls(
+            keys=np.asarray(data['keys'], dtype=np.uint64),
+            committer_ts=np.asarray(data['committer_ts'], dtype=np.int64),
+            roots=np.asarray(data['roots'], dtype=np.uint64),
+        )
+
+
+class SharedHistoryIndex:
+    """Every commit of every evaluated repository, as one sorted key array.
+
+    Submissions are added as their forensics finish; the merged arrays
+    (keys, owning submission, committer time) are sorted once when first
+    queried. Keys that occur under more than one submission are shared
+    history: the repos are forks or copies of each other, or of a common
+    template. Histories are stored in the FactStore under the repo's HEAD
+    SHA, so submissions whose analysis is reused are still indexed.
+    """
+
+    def __init__(self, facts: Optional[FactStore] = None, time_window=None):
+        self.facts = facts if facts is not None else FactStore(persist=False)
+        self.window = time_window or TIME_WINDOW
+        self._kind = fact_kind('history')
+        self._ids: list[str] = []
+        self._slots: dict[str, int] = {}
+        self._histories: list[RepoHistory] = []
+        self._merged: Optional[tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+    def __contains__(self, project_id: str) -> bool:
+        return project_id in self._slots
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def record(self, timeline: CommitTimeline, head_sha: Optional[str] = None) -> RepoHistory:
+        """History of a repository from its forensics timeline, stored under its HEAD SHA."""
+        history = RepoHistory.from_timeline(timeline)
+        if head_sha:
+            self.facts.put(head_sha, self._kind, history.to_json())
+        return history
+
+    def lookup(self, head_sha: Optional[str]) -> Optional[RepoHistory]:
+        """History stored for a HEAD SHA by an earlier record() call."""
+        if not head_sha:
+            return None
+        data = self.facts.get(head_sha, self._kind)
+        return None if data is MISSING else RepoHistory.from_json(data)
+
+    def add(self, project_id: str, history: Optional[RepoHistory]):
+        """Index a submission. Submissions already indexed, or without history, are ignored."""
+        if history is None or project_id in self._slots:
+            return
+        self._slots[project_id] = len(self._ids)
+        self._ids.append(project_id)
+        self._histories.append(history)
+        self._merged = None
+
+    def _shared(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Keys, owners and committer times of the commits held by several submissions."""
+        if self._merged is None:
+            keys = np.concatenate([h.keys for h in self._histories])
+            owners = np.concatenate([
+                np.full(len(h.keys), slot, dtype=np.int32) for slot, h in enumerate(self._histories)
+            ])
+            times = np.concatenate([h.committer_ts for h in self._histories])
+            order = np.argsort(keys, kind='stable')
+            keys, owners, times = keys[order], owners[order], times[order]
+
+            repeated = keys[1:] == keys[:-1]
+            shared = np.zeros(len(keys), dtype=bool)
+            shared[1:] |= repeated
+            shared[:-1] |= repeated
+            self._merged = (keys[shared], owners[shared], times[shared])
+        return self._merged
+
+    def report(self, project_id: str) -> list[dict]:
+        """Other submissions whose history intersects this one's.
+
+        One entry per submission: the number of shared commits, how many
+        of them precede the window (with a few abbreviated SHAs), and
+        whether the repositories share a root commit.
+        """
+        slot = self._slots[project_id]
+        keys, owners, times = self._shared()
+        mine = keys[owners == slot]
+        if not mine.size:
+            return []
+
+        window_start = datetime.combine(self.window.start, datetime.min.time()).timestamp()
+        related = np.isin(keys, mine) & (owners != slot)
+        before = times < window_start
+
+        shared = []
+        for other in np.unique(owners[related]).tolist():
+            with_other = related & (owners == other)
+            early = keys[with_other & before]
+            shared.append({
+                'project_id': self._ids[other],
+                'shared_commits': int(np.count_nonzero(with_other)),
+                'shared_before_window': int(early.size),
+                'before_window_shas': [format(key, '016x')[:7] for key in early[:5].tolist()],
+                'shared_root': bool(np.intersect1d(
+                    self._histories[slot].roots, self._histories[other].roots
+                ).size),
+            })
+        shared.sort(key=lambda s: s['shared_commits'], reverse=True)
+        return shared
+
+    def stats(self) -> dict:
+        if not self._ids:
+            return {'indexed': 0, 'commits': 0, 'shared_commits': 0}
+        keys, _, _ = self._shared()
+        return {
+            'indexed': len(self._ids),
+            'commits': sum(len(h.keys) for h in self._histories),
+            'shared_commits': int(np.unique(keys).size),
+        }
@@ -0,0 +1,177 @@
+"""Database of vendored and third-party files, excluded from scanning and scoring."""
+
+import hashlib
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+from hackathon_judge.config import VENDORED_MIN_REPOS, VENDORED_MIN_BYTES
+from .languages import path_pattern
+
+
+# (label, path pattern on the lowercased path) for libraries recognisable by
+# path alone; `*` stops at `/`, `**/` matches any leading directories
+VENDORED_PATHS = [
+    ('jquery', '**/*jquery.js'),
+    ('jquery', '**/*jquery-[0-9]*.js'),
+    ('jquery', '**/*jquery.min.js'),
+    ('bootstrap', '**/*bootstrap.bundle*.js'),
+    ('bootstrap', '**/bootstrap/js/*.js'),
+    ('openzeppelin', '**/*openzeppelin*/**'),
+    ('forge-std', '**/forge-std/**'),
+    ('solmate', '**/solmate/**'),
+    ('ds-test', '**/ds-test/**'),
+    ('anchor idl', '**/idl/*.json'),
+    ('anchor idl', '**/idl/*.ts'),
+    ('bundled sdk', '**/*.umd.js'),
+    ('bundled sdk', '**/*.umd.min.js'),
+]
+_VENDORED_PATTERNS = [(label, path_pattern(pattern)) for label, pattern in VENDORED_PATHS]
+
+# Library-like files that may be learned as vendored when many submissions
+# share them: bundles, minified builds, lock files and copies under asset or
+# third-party directories. Shared application code is never learned, so
+# copied code stays visible to the detectors and the provenance index.
+LEARNABLE_PATHS = [
+    '**/*.min.*', '**/*-min.js', '**/*.bundle.*', '**/*.umd.*', '**/*.lock',
+    '**/package-lock.json', '**/pnpm-lock.yaml',
+    '**/dist/**', '**/public/**/*.js', '**/static/**/*.js', '**/assets/**/*.js',
+    '**/third_party/**', '**/third-party/**', '**/external/**',
+]
+_LEARNABLE_PATTERNS = [path_pattern(pattern) for pattern in LEARNABLE_PATHS]
+
+
+def is_learnable(path: str) -> bool:
+    """Whether a file looks like a library copy that may be learned as vendored."""
+    lower = path.lower()
+    return any(pattern.fullmatch(lower) for pattern in _LEARNABLE_PATTERNS)
+
+
+def blob_sha(data: bytes) -> str:
+    """Git blob SHA of file content, as `git hash-object` computes it."""
+    return hashlib.sha1(b'blob %d\0' % len(data) + data).hexdigest()
+
+
+class VendoredFiles:
+    """Known third-party files by git blob SHA, plus path heuristics.
+
+    RepoIndex.exclude_vendored() consults it, so matching files are never
+    scanned or counted as the submission's code. Known files are seeded
+    with add() (e.g. `vendored add` on library builds) or learned: the
+    library-like blobs (is_learnable()) of every submission in a run are
+    recorded with observe(), and learn() marks blobs found identical in
+    VENDORED_MIN_REPOS or more of them as vendored. Sightings are kept per
+    instance, so only the current submission set counts. Learned files
+    only apply to library-like paths, are still fingerprinted for
+    provenance, and take effect from the next instance, so every
+    submission of a run is judged against the same set.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, persist: bool = True,
+                 min_repos: int = VENDORED_MIN_REPOS, min_bytes: int = VENDORED_MIN_BYTES):
+        self.min_repos = min_repos
+        self.min_bytes = min_bytes
+        self.counts = {'excluded': 0, 'learned': 0}
+        self._sightings: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+        if persist:
+            self.cache_dir = Path(cache_dir) if cache_dir else Path(tempfile.gettempdir()) / "hackathon_judge_facts"
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            db_path = str(self.cache_dir / "vendored.sqlite")
+        else:
+            db_path = ':memory:'
+        self._db = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS known (
+                blob_sha TEXT PRIMARY KEY,
+                label TEXT,
+                source TEXT,
+                added_at REAL
+            )"""
+        )
+        self._db.commit()
+        self._known: dict[str, str] = {}
+        self._learned: set[str] = set()
+        for sha, label, source in self._db.execute("SELECT blob_sha, label, source FROM known"):
+            self._known[sha] = label
+            if source == 'learned':
+                self._learned.add(sha)
+
+    def match(self, path: str, sha: Optional[str] = None, learned: bool = True) -> Optional[str]:
+        """Label of a vendored file, or None.
+
+        Learned blobs only match library-like paths; learned=False ignores
+        them altogether.
+        """
+        if sha and sha in self._known:
+            if sha not in self._learned:
+                return self._known[sha]
+            if learned and is_learnable(path):
+                return self._known[sha]
+        lower = path.lower()
+        for label, pattern in _VENDORED_PATTERNS:
+            if pattern.fullmatch(lower):
+                return label
+        return None
+
+    def observe(self, project_id: str, files: Iterable):
+        """Record the library-like blobs of a submission, for learn()."""
+        shas = {
+            entry.blob_sha for entry in files
+            if entry.blob_sha and entry.size >= self.min_bytes and is_learnable(entry.path)
+        }
+        with self._lock:
+            for sha in shas:
+                self._sightings.setdefault(sha, set()).add(project_id)
+
+    def learn(self) -> int:
+        """Mark blobs seen in min_repos submissions of this run as vendored.
+        Returns the number of newly learned files."""
+        with self._lock:
+            now = time.time()
+            shared = [
+                (sha, 'shared by submissions', 'learned', now)
+                for sha, projects in self._sightings.items()
+                if len(projects) >= self.min_repos and sha not in self._known
+            ]
+            self._db.executemany(
+                "INSERT OR IGNORE INTO known (blob_sha, label, source, added_at) VALUES (?, ?, ?, ?)",
+                shared,
+            )
+            self._db.commit()
+            self.counts['learned'] += len(shared)
+            return len(shared)
+
+    def add(self, sha: str, label: str, source: str = 'seed'):
+        """Mark a blob as vendored."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO known (blob_sha, label, source, added_at) VALUES (?, ?, ?, ?)",
+                (sha, label, source, time.time()),
+            )
+            self._db.commit()
+            self._known[sha] = label
+            if source == 'learned':
+                self._learned.add(sha)
+            else:
+                self._learned.discard(sha)
+
+    def record_excluded(self, count: int):
+        with self._lock:
+            self.counts['excluded'] += count
+
+    def stats(self) -> dict:
+        with self._lock:
+            by_source = dict(self._db.execute("SELECT source, COUNT(*) FROM known GROUP BY source"))
+            return {
+                'known': sum(by_source.values()),
+                'seeded': by_source.get('seed', 0),
+                'learned_total': by_source.get('learned', 0),
+                'learned': self.counts['learned'],
+                'excluded': self.counts['excluded'],
+            }
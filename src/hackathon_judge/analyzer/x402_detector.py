@@ -6,6 +6,9 @@ from typing import Optional
 
 from hackathon_judge.models import X402Result, Project
 from hackathon_judge.fetcher import GitHubAPI
+from .repo_index import RepoIndex
+from .patterns import PatternScanner
+from .file_facts import fact_kind
 
 
 class X402Detector:
@@ -53,12 +56,52 @@ class X402Detector:
         'streaming': [r'streaming.*payment', r'pay.*per.*byte', r'pay.*per.*stream'],
     }
 
+    # Keyword counts used to tell API monetization from content paywalls
+    API_INDICATORS = ['api', 'endpoint', 'route', 'handler']
+    CONTENT_INDICATORS = ['article', 'content', 'media', 'paywall']
+
+    # Innovative elements and the labels reported for them
+    INNOVATION_PATTERNS = [
+        (r'streaming.*payment', "Streaming payments"),
+        (r'dynamic.*pric', "Dynamic pricing"),
+        (r'multi.*party', "Multi-party payments"),
+        (r'privacy', "Privacy features"),
+        (r'cross.*chain', "Cross-chain support"),
+        (r'subscription', "Subscription model"),
+        (r'oracle', "Oracle integration"),
+        (r'vrf|random', "Verifiable randomness"),
+    ]
+
     def __init__(self, github_api: GitHubAPI):
         self.api = github_api
+        self._code_scanner = PatternScanner({
+            'x402': self.X402_PATTERNS,
+            'wallet': self.WALLET_PATTERNS,
+            'verification': self.VERIFICATION_PATTERNS,
+        })
+        self._use_case_scanner = PatternScanner(self.USE_CASE_PATTERNS)
+        self._innovation_scanner = PatternScanner(
+            {label: [pattern] for pattern, label in self.INNOVATION_PATTERNS}
+        )
+
+        # Per-file facts, cached by blob SHA in the repo index
+        self._code_kind = fact_kind(
+            'x402-code', self.X402_PATTERNS, self.WALLET_PATTERNS, self.VERIFICATION_PATTERNS
+        )
+        self._sdk_kind = fact_kind('x402-sdk')
+        self._indicator_kind = fact_kind(
+            'x402-indicators', self.API_INDICATORS, self.CONTENT_INDICATORS
+        )
+        self._innovation_kind = fact_kind('x402-innovation', self.INNOVATION_PATTERNS)
 
     def analyze(self, project_id: str, project: Project,
-                local_path: Optional[Path] = None) -> X402Result:
-        """Analyze X402 integration in a project."""
+                local_path: Optional[Path] = None,
+                index: Optional[RepoIndex] = None) -> X402Result:
+        """Analyze X402 integration in a project.
+
+        Pass a prebuilt index to share one tree walk between analyzers, or an
+        index built from the GitHub tree to analyze without a clone.
+        """
         result = X402Result(project_id=project_id)
 
         try:
@@ -66,8 +109,11 @@ class X402Detector:
             if project.description:
                 self._analyze_description(result, project.description)
 
-            if local_path and local_path.exists():
-                return self._analyze_local(result, local_path, project)
+            if index is None and local_path and local_path.exists():
+                index = RepoIndex.build(local_path)
+
+            if index is not None:
+                return self._analyze_index(result, index, project)
             else:
                 return self._analyze_remote(result, project)
         except Exception as e:
@@ -82,57 +128,38 @@ class X402Detector:
         if 'x402' in desc_lower or '402' in desc_lower:
             result.uses_x402 = True
 
-        # Detect use case from description
-        for use_case, patterns in self.USE_CASE_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, desc_lower):
-                    result.use_case = use_case.replace('_', ' ')
-                    break
+        # Detect use case from description (the last matching use case wins)
+        use_case = self._use_case_scanner.last(desc_lower)
+        if use_case:
+            result.use_case = use_case.replace('_', ' ')
 
-    def _analyze_local(self, result: X402Result, path: Path, project: Project) -> X402Result:
-        """Analyze local repository for X402 integration."""
-        # Search for X402 patterns in source files
+    def _analyze_index(self, result: X402Result, index: RepoIndex, project: Project) -> X402Result:
+        """Analyze a repository's file index for X402 integration."""
+        # Search for X402 patterns in source files (vendored dirs are pruned by the index)
         source_extensions = ['.js', '.ts', '.jsx', '.tsx', '.py', '.rs', '.go', '.sol']
         x402_files = []
         wallet_files = []
         verification_files = []
 
         for ext in source_extensions:
-            for file_path in path.rglob(f'*{ext}'):
-                if any(skip in str(file_path) for skip in ['node_modules', '.git', 'dist', 'build']):
-                    continue
-
+            for entry in index.files_with_ext(ext):
                 try:
-                    content = file_path.read_text(errors='replace')
-                    content_lower = content.lower()
-
-                    # Check X402 patterns
-                    for pattern in self.X402_PATTERNS:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            x402_files.append(str(file_path.relative_to(path)))
-                            break
-
-                    # Check wallet patterns
-                    for pattern in self.WALLET_PATTERNS:
-                        if re.search(pattern, content_lower):
-                            wallet_files.append(str(file_path.relative_to(path)))
-                            break
-
-                    # Check verification patterns
-                    for pattern in self.VERIFICATION_PATTERNS:
-                        if re.search(pattern, content_lower):
-                            verification_files.append(str(file_path.relative_to(path)))
-                            break
-
+                    matched = index.fact(entry.path, self._code_kind, self._code_facts,
+                                         errors='replace')
                 except Exception:
                     continue
 
+                if 'x402' in matched:
+                    x402_files.append(entry.path)
+                if 'wallet' in matched:
+                    wallet_files.append(entry.path)
+                if 'verification' in matched:
+                    verification_files.append(entry.path)
+
         # Also check package.json for X402 SDK
-        pkg_path = path / 'package.json'
-        if pkg_path.exists():
+        if index.is_file('package.json'):
             try:
-                content = pkg_path.read_text()
-                if '@coinbase/x402' in content or 'x402' in content.lower():
+                if index.fact('package.json', self._sdk_kind, self._mentions_sdk):
                     result.uses_x402 = True
                     result.creative_elements.append("Uses official X402 SDK")
             except:
@@ -157,13 +184,33 @@ class X402Detector:
 
         # Determine use case if not already set
         if not result.use_case:
-            result.use_case = self._detect_use_case(path)
+            result.use_case = self._detect_use_case(index)
 
         # Assess novelty and innovation
-        result = self._assess_innovation(result, path, project)
+        result = self._assess_innovation(result, index, project)
 
         return result
 
+    def _code_facts(self, content: str) -> list[str]:
+        """One pass over a file for X402, wallet and verification patterns."""
+        return sorted(self._code_scanner.scan(content))
+
+    def _mentions_sdk(self, content: str) -> bool:
+        return '@coinbase/x402' in content or 'x402' in content.lower()
+
+    def _count_indicators(self, content: str) -> list[int]:
+        """Occurrences of API and content keywords in a file."""
+        content = content.lower()
+        return [
+            sum(content.count(ind) for ind in self.API_INDICATORS),
+            sum(content.count(ind) for ind in self.CONTENT_INDICATORS),
+        ]
+
+    def _innovation_facts(self, content: str) -> list[str]:
+        """Innovation labels matched in a file, in declaration order."""
+        matched = self._innovation_scanner.scan(content)
+        return [label for _, label in self.INNOVATION_PATTERNS if label in matched]
+
     def _analyze_remote(self, result: X402Result, project: Project) -> X402Result:
         """Analyze via GitHub API."""
         import re
@@ -178,18 +225,13 @@ class X402Detector:
         # Check README for X402 mentions
         readme_content = self.api.get_file_content(owner, repo, 'README.md')
         if readme_content:
-            for pattern in self.X402_PATTERNS:
-                if re.search(pattern, readme_content, re.IGNORECASE):
-                    result.uses_x402 = True
-                    break
+            if self._code_scanner.scan(readme_content, ['x402']):
+                result.uses_x402 = True
 
             # Check for use cases
-            readme_lower = readme_content.lower()
-            for use_case, patterns in self.USE_CASE_PATTERNS.items():
-                for pattern in patterns:
-                    if re.search(pattern, readme_lower):
-                        result.use_case = use_case.replace('_', ' ')
-                        break
+            use_case = self._use_case_scanner.last(readme_content)
+            if use_case:
+                result.use_case = use_case.replace('_', ' ')
 
         # Check package.json for X402 SDK
         pkg_content = self.api.get_file_content(owner, repo, 'package.json')
@@ -260,26 +302,18 @@ class X402Detector:
 
         return result
 
-    def _detect_use_case(self, path: Path) -> str:
+    def _detect_use_case(self, index: RepoIndex) -> str:
         """Detect the primary use case from code patterns."""
-        # Look for API patterns
-        api_indicators = ['api', 'endpoint', 'route', 'handler']
-        content_indicators = ['article', 'content', 'media', 'paywall']
-        payment_indicators = ['pay', 'price', 'cost', 'charge']
-
         api_count = 0
         content_count = 0
 
         for ext in ['.js', '.ts', '.py']:
-            for f in list(path.rglob(f'*{ext}'))[:20]:
-                if 'node_modules' in str(f):
-                    continue
+            for f in index.files_with_ext(ext)[:20]:
                 try:
-                    content = f.read_text(errors='replace').lower()
-                    for ind in api_indicators:
-                        api_count += content.count(ind)
-                    for ind in content_indicators:
-                        content_count += content.count(ind)
+                    api, content = index.fact(f.path, self._indicator_kind,
+                                              self._count_indicators, errors='replace')
+                    api_count += api
+                    content_count += content
                 except:
                     pass
 
@@ -290,42 +324,28 @@ class X402Detector:
         else:
             return "general payments"
 
-    def _assess_innovation(self, result: X402Result, path: Path, project: Project) -> X402Result:
+    def _assess_innovation(self, result: X402Result, index: RepoIndex, project: Project) -> X402Result:
         """Assess innovation and novelty."""
         novelty = 3  # Base score
 
-        # Check for innovative elements
-        innovative_patterns = [
-            (r'streaming.*payment', "Streaming payments"),
-            (r'dynamic.*pric', "Dynamic pricing"),
-            (r'multi.*party', "Multi-party payments"),
-            (r'privacy', "Privacy features"),
-            (r'cross.*chain', "Cross-chain support"),
-            (r'subscription', "Subscription model"),
-            (r'oracle', "Oracle integration"),
-            (r'vrf|random', "Verifiable randomness"),
-        ]
-
         # Search in key files
-        search_files = [
-            path / 'README.md',
-            path / 'package.json',
-        ]
-        search_files.extend(list(path.rglob('*.ts'))[:10])
-        search_files.extend(list(path.rglob('*.js'))[:10])
+        search_files = ['README.md', 'package.json']
+        search_files.extend(f.path for f in index.files_with_ext('.ts')[:10])
+        search_files.extend(f.path for f in index.files_with_ext('.js')[:10])
 
         for f in search_files:
-            if not f.exists():
+            if not index.is_file(f):
                 continue
             try:
-                content = f.read_text(errors='replace').lower()
-                for pattern, label in innovative_patterns:
-                    if re.search(pattern, content):
-                        if label not in result.creative_elements:
-                            result.creative_elements.append(label)
-                            novelty += 1
+                matched = index.fact(f, self._innovation_kind, self._innovation_facts,
+                                     errors='replace')
             except:
-                pass
+                continue
+
+            for label in matched:
+                if label not in result.creative_elements:
+                    result.creative_elements.append(label)
+                    novelty += 1
 
         # Cap novelty score
         result.novelty_score = min(novelty, 10)
@@ -11,13 +11,21 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.table import Table
 
-from hackathon_judge.config import WEIGHTS, TIME_WINDOW
-from hackathon_judge.models import Project, EvaluationRun, ScoredProject
+from hackathon_judge.config import (
+    WEIGHTS, TIME_WINDOW, PIPELINE_JOBS, PIPELINE_CLONE_JOBS, CLONE_STRATEGY
+)
+from hackathon_judge.models import Project, EvaluationRun
 from hackathon_judge.ingestion import parse_submissions
 from hackathon_judge.fetcher import GitHubAPI, RepoCloner
-from hackathon_judge.analyzer import RepoAnalyzer, GitForensics, X402Detector
+from hackathon_judge.fetcher.cloner import CLONE_STRATEGIES
+from hackathon_judge.analyzer import (
+    RepoAnalyzer, GitForensics, X402Detector, RepoIndex, FactStore, ProvenanceIndex,
+    SharedHistoryIndex, VendoredFiles,
+)
+from hackathon_judge.analyzer.vendored import blob_sha
 from hackathon_judge.scoring import ScoringEngine
 from hackathon_judge.reporter import MarkdownReporter, JSONExporter
+from hackathon_judge.pipeline import EvaluationPipeline, CheckpointStore, StrategyPlanner
 
 
 console = Console()
@@ -36,9 +44,25 @@ def cli():
 @click.option('-o', '--output', 'output_dir', required=True, type=click.Path(),
               help='Output directory for results')
 @click.option('--dry-run', is_flag=True, help='API-only analysis without cloning')
-@click.option('--resume', is_flag=True, help='Resume from previous run')
+@click.option('--resume', is_flag=True, help='Skip projects already in the output checkpoint')
+@click.option('--reanalyze', is_flag=True,
+              help='Analyze every project, even if its HEAD matches a checkpointed result')
 @click.option('--limit', type=int, default=0, help='Limit number of projects to evaluate')
-def evaluate(input_file: str, output_dir: str, dry_run: bool, resume: bool, limit: int):
+@click.option('--jobs', type=int, default=PIPELINE_JOBS, show_default=True,
+              help='Workers for the metadata and analysis stages')
+@click.option('--clone-jobs', type=int, default=PIPELINE_CLONE_JOBS, show_default=True,
+              help='Concurrent repository clones')
+@click.option('--no-http-cache', is_flag=True, help='Disable the on-disk GitHub API response cache')
+@click.option('--no-scan-cache', is_flag=True, help='Disable the per-file scan cache shared across repos')
+@click.option('--clone-strategy', type=click.Choice(CLONE_STRATEGIES), default=None,
+              help='Use one strategy for every repo instead of planning per repo by size. '
+                   'shallow: depth-limited; window: history from just before the hackathon window; '
+                   'partial: blobless + sparse source checkout; full: everything')
+@click.option('--no-checkout', is_flag=True,
+              help='Skip writing a working tree; read files from the git object database')
+def evaluate(input_file: str, output_dir: str, dry_run: bool, resume: bool, reanalyze: bool, limit: int,
+             jobs: int, clone_jobs: int, no_http_cache: bool, no_scan_cache: bool,
+             clone_strategy: Optional[str], no_checkout: bool):
     """Evaluate all projects from submissions file."""
     console.print("[bold blue]Hackathon Judge System[/bold blue]")
     console.print(f"Input: {input_file}")
@@ -59,12 +83,20 @@ def evaluate(input_file: str, output_dir: str, dry_run: bool, resume: bool, limi
         console.print(f"[yellow]Limited to {limit} projects[/yellow]")
 
     # Initialize components
-    github_api = GitHubAPI()
-    cloner = RepoCloner() if not dry_run else None
+    github_api = GitHubAPI(use_cache=not no_http_cache)
+    cloner = RepoCloner(
+        strategy=clone_strategy or CLONE_STRATEGY, checkout=not no_checkout
+    ) if not dry_run else None
+    # Without an explicit strategy, each repo's fetch is planned from its size
+    planner = StrategyPlanner(github_api) if cloner and not clone_strategy else None
     repo_analyzer = RepoAnalyzer(github_api)
     git_forensics = GitForensics(github_api)
     x402_detector = X402Detector(github_api)
     scoring_engine = ScoringEngine()
+    facts = FactStore(persist=not no_scan_cache)
+    provenance = ProvenanceIndex(facts)
+    history = SharedHistoryIndex(facts)
+    vendored = VendoredFiles(persist=not no_scan_cache)
 
     # Prepare output
     output_path = Path(output_dir)
@@ -72,6 +104,18 @@ def evaluate(input_file: str, output_dir: str, dry_run: bool, resume: bool, limi
     logs_path = output_path / 'logs'
     logs_path.mkdir(exist_ok=True)
 
+    checkpoint = CheckpointStore(output_path)
+    if resume:
+        done = sum(1 for p in projects if p.id in checkpoint)
+        console.print(f"[yellow]Resuming: {done} projects restored from {checkpoint.path}[/yellow]")
+
+    pipeline = EvaluationPipeline(
+        github_api, cloner, repo_analyzer, git_forensics, x402_detector,
+        scoring_engine, api_only=dry_run, jobs=jobs, clone_jobs=clone_jobs,
+        checkpoint=checkpoint, resume=resume, reanalyze=reanalyze, facts=facts,
+        provenance=provenance, history=history, planner=planner, vendored=vendored,
+    )
+
     # Initialize run
     run = EvaluationRun(
         run_id=str(uuid.uuid4())[:8],
@@ -79,10 +123,7 @@ def evaluate(input_file: str, output_dir: str, dry_run: bool, resume: bool, limi
         total_projects=len(projects),
     )
 
-    scored_projects: list[ScoredProject] = []
-    skipped: list[dict] = []
-
-    # Evaluate each project
+    # Evaluate projects through the staged pipeline
     console.print()
     with Progress(
         SpinnerColumn(),
@@ -93,25 +134,28 @@ def evaluate(input_file: str, output_dir: str, dry_run: bool, resume: bool, limi
     ) as progress:
         task = progress.add_task("Evaluating projects...", total=len(projects))
 
-        for project in projects:
-            progress.update(task, description=f"[cyan]{project.name[:30]}...[/cyan]")
-
-            try:
-                scored = evaluate_single_project(
-                    project, github_api, cloner, repo_analyzer,
-                    git_forensics, x402_detector, scoring_engine, dry_run
-                )
-                scored_projects.append(scored)
-            except Exception as e:
-                console.print(f"[red]Error evaluating {project.name}: {e}[/red]")
-                skipped.append({
-                    "name": project.name,
-                    "url": project.github_url,
-                    "reason": str(e)
-                })
-
+        refresh_counts = {'reused': 0, 'fetched': 0, 'cloned': 0, 'stale': 0}
+        restore_counts = {'verified': 0, 'unverified': 0}
+        plan_counts: dict[str, int] = {}
+
+        def on_result(item):
+            if item.head_verified is not None:
+                restore_counts['verified' if item.head_verified else 'unverified'] += 1
+            if item.reused:
+                refresh_counts['reused'] += 1
+            elif item.refresh and item.refresh.action in refresh_counts:
+                refresh_counts[item.refresh.action] += 1
+            if item.plan:
+                plan_counts[item.plan.mode] = plan_counts.get(item.plan.mode, 0) + 1
+            if item.error:
+                console.print(f"[red]Error evaluating {item.project.name}: {item.error}[/red]")
+            if item.refresh and item.refresh.prefetch_error:
+                console.print(f"[yellow]{item.project.name}: {item.refresh.prefetch_error}[/yellow]")
+            progress.update(task, description=f"[cyan]{item.project.name[:30]}...[/cyan]")
             progress.advance(task)
 
+        scored_projects, skipped = pipeline.run(projects, on_result=on_result)
+
     # Rank projects
     console.print()
     console.print("[yellow]Ranking projects...[/yellow]")
@@ -124,6 +168,20 @@ def evaluate(input_file: str, output_dir: str, dry_run: bool, resume: bool, limi
     run.skipped_projects = skipped
     if ranked_projects:
         run.average_score = sum(p.weighted_total for p in ranked_projects) / len(ranked_projects)
+    run.stats['clones'] = refresh_counts
+    if resume:
+        run.stats['restored'] = restore_counts
+        if restore_counts['unverified']:
+            console.print(f"[yellow]{restore_counts['unverified']} restored projects could not be "
+                          f"checked against their current HEAD[/yellow]")
+    if planner:
+        run.stats['plans'] = plan_counts
+    run.stats['scan_cache'] = facts.stats()
+    run.stats['provenance'] = provenance.stats()
+    run.stats['shared_history'] = history.stats()
+    run.stats['vendored'] = vendored.stats()
+    if github_api.cache:
+        run.stats['http_cache'] = github_api.cache.stats()
 
     # Generate reports
     console.print("[yellow]Generating reports...[/yellow]")
@@ -166,58 +224,53 @@ def evaluate(input_file: str, output_dir: str, dry_run: bool, resume: bool, limi
     console.print(f"[green]Evaluated: {run.evaluated}[/green]")
     console.print(f"[yellow]Skipped: {run.skipped}[/yellow]")
     console.print(f"[blue]Average Score: {run.average_score:.2f}[/blue]")
+    console.print(f"[blue]Unchanged (analysis reused): {refresh_counts['reused']}, "
+                  f"updated by fetch: {refresh_counts['fetched']}, "
+                  f"cloned: {refresh_counts['cloned']}, "
+                  f"stale (fetch failed): {refresh_counts['stale']}[/blue]")
+    if planner:
+        console.print("[blue]Fetch plans: " + ", ".join(
+            f"{mode} {count}" for mode, count in sorted(plan_counts.items())
+        ) + "[/blue]")
+    if github_api.cache:
+        cache_stats = run.stats['http_cache']
+        console.print(f"[blue]HTTP cache: {cache_stats['hits']} hits, "
+                      f"{cache_stats['revalidated']} revalidated (304), "
+                      f"{cache_stats['misses']} fetched[/blue]")
+    scan_stats = run.stats['scan_cache']
+    console.print(f"[blue]Scan cache: {scan_stats['hits']} of "
+                  f"{scan_stats['hits'] + scan_stats['misses']} file facts cached "
+                  f"({scan_stats['hit_rate']:.0%} hit rate)[/blue]")
+    provenance_stats = run.stats['provenance']
+    console.print(f"[blue]Code provenance: {provenance_stats['indexed']} submissions indexed, "
+                  f"{provenance_stats['overlapping_pairs']} overlapping pairs[/blue]")
+    history_stats = run.stats['shared_history']
+    console.print(f"[blue]Shared history: {history_stats['shared_commits']} commits "
+                  f"found in more than one submission[/blue]")
+    vendored_stats = run.stats['vendored']
+    console.print(f"[blue]Vendored files: {vendored_stats['excluded']} skipped, "
+                  f"{vendored_stats['learned']} newly learned, "
+                  f"{vendored_stats['known']} known[/blue]")
     console.print()
     console.print(f"[bold]Results saved to: {output_path}[/bold]")
 
 
-def evaluate_single_project(
-    project: Project,
-    github_api: GitHubAPI,
-    cloner: Optional[RepoCloner],
-    repo_analyzer: RepoAnalyzer,
-    git_forensics: GitForensics,
-    x402_detector: X402Detector,
-    scoring_engine: ScoringEngine,
-    api_only: bool = False,
-) -> ScoredProject:
-    """Evaluate a single project."""
-    local_path = None
-
-    # Get metadata
-    metadata = github_api.get_repo_metadata(project.github_url)
-
-    if not metadata.is_accessible:
-        raise ValueError(f"Repository not accessible: {metadata.error}")
-
-    # Clone if needed
-    if cloner and not api_only:
-        local_path, error = cloner.clone(project.github_url)
-        if error:
-            # Continue with API-only analysis
-            local_path = None
-
-    # Run analyzers
-    analysis = repo_analyzer.analyze(project.id, project.github_url, metadata, local_path)
-    forensics = git_forensics.analyze(project.id, project.github_url, local_path)
-    x402 = x402_detector.analyze(project.id, project, local_path)
-
-    # Score project
-    scored = scoring_engine.score_project(project, analysis, forensics, x402)
-    scored.metadata = metadata
-
-    return scored
-
-
 @cli.command()
 @click.argument('url')
 @click.option('--forensics/--no-forensics', default=False, help='Run git forensics analysis')
-def analyze(url: str, forensics: bool):
+@click.option('--clone-strategy', type=click.Choice(CLONE_STRATEGIES), default=CLONE_STRATEGY,
+              show_default=True,
+              help='shallow: depth-limited; window: history from just before the hackathon window; '
+                   'partial: blobless + sparse source checkout; full: everything')
+@click.option('--no-checkout', is_flag=True,
+              help='Skip writing a working tree; read files from the git object database')
+def analyze(url: str, forensics: bool, clone_strategy: str, no_checkout: bool):
     """Analyze a single GitHub repository."""
     console.print(f"[bold blue]Analyzing: {url}[/bold blue]")
 
     # Initialize components
     github_api = GitHubAPI()
-    cloner = RepoCloner()
+    cloner = RepoCloner(strategy=clone_strategy, checkout=not no_checkout)
     repo_analyzer = RepoAnalyzer(github_api)
     git_forensics_analyzer = GitForensics(github_api)
     x402_detector = X402Detector(github_api)
@@ -256,8 +309,17 @@ def analyze(url: str, forensics: bool):
     console.print()
     console.print("[yellow]Running analysis...[/yellow]")
 
-    analysis = repo_analyzer.analyze(project.id, url, metadata, local_path)
-    console.print(f"Languages: {', '.join(analysis.languages)}")
+    index = RepoIndex.open(local_path, FactStore(), cloner.checkout) if local_path else None
+    if index is not None:
+        index.exclude_vendored(VendoredFiles())
+
+    analysis = repo_analyzer.analyze(project.id, url, metadata, local_path, index)
+    if analysis.language_shares:
+        console.print("Languages: " + ', '.join(
+            f"{language} {share:.0%}" for language, share in analysis.language_shares.items()
+        ))
+    else:
+        console.print(f"Languages: {', '.join(analysis.languages)}")
     console.print(f"Frameworks: {', '.join(analysis.frameworks)}")
     console.print(f"Architecture: {analysis.architecture}")
     console.print(f"README Quality: {analysis.readme_quality}/10")
@@ -276,13 +338,25 @@ def analyze(url: str, forensics: bool):
 
     console.print()
     console.print("[yellow]Checking X402 integration...[/yellow]")
-    x402 = x402_detector.analyze(project.id, project, local_path)
+    x402 = x402_detector.analyze(project.id, project, local_path, index)
     console.print(f"Uses X402: {x402.uses_x402}")
     console.print(f"Integration Score: {x402.integration_score}/10")
     console.print(f"Use Case: {x402.use_case}")
     if x402.creative_elements:
         console.print(f"Creative Elements: {', '.join(x402.creative_elements)}")
 
+    if index is not None and index.budget.skipped_count:
+        console.print()
+        console.print(f"[yellow]Not read ({index.budget.skipped_count} files):[/yellow]")
+        for skipped in index.budget.report(limit=10):
+            console.print(f"  {skipped['path']} ({skipped['reason']})")
+
+    if index is not None:
+        index.save_facts()
+        index.close()
+    if local_path:
+        cloner.release(local_path)
+
     console.print()
     console.print("[green]Analysis complete![/green]")
 
@@ -330,5 +404,101 @@ def info():
     console.print(f"  End: {TIME_WINDOW.end}")
 
 
+def _format_bytes(size: float) -> str:
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def _parse_size(value: str) -> int:
+    """Parse a size like '500M' or '10G' into bytes."""
+    units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+    value = value.strip().upper().rstrip('B')
+    if value and value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+@cli.group()
+def cache():
+    """Inspect and prune the clone cache."""
+    pass
+
+
+@cache.command('stats')
+def cache_stats():
+    """Show clone cache usage."""
+    cloner = RepoCloner()
+    stats = cloner.index.stats()
+
+    console.print(f"[bold blue]Clone cache: {cloner.cache_dir}[/bold blue]")
+    console.print(f"Clones: {stats['clones']} ({stats['leased']} in use)")
+    console.print(f"Size: {_format_bytes(stats['bytes'])} / {_format_bytes(stats['max_bytes'])}")
+
+    entries = cloner.index.entries()
+    if entries:
+        table = Table()
+        table.add_column("Repository", style="cyan")
+        table.add_column("Strategy")
+        table.add_column("HEAD")
+        table.add_column("Size", justify="right")
+        table.add_column("Last access")
+        for clone in entries:
+            table.add_row(
+                clone.key,
+                clone.strategy,
+                (clone.head_sha or '')[:7],
+                _format_bytes(clone.bytes),
+                datetime.fromtimestamp(clone.last_access).strftime('%Y-%m-%d %H:%M'),
+            )
+        console.print(table)
+
+
+@cache.command('prune')
+@click.option('--max-size', help='Evict least recently used clones down to this size (e.g. 2G)')
+@click.option('--all', 'prune_all', is_flag=True, help='Remove every clone not in use')
+def cache_prune(max_size: Optional[str], prune_all: bool):
+    """Evict clones beyond the cache size limit."""
+    cloner = RepoCloner()
+    limit = 0 if prune_all else (_parse_size(max_size) if max_size else None)
+    removed = cloner.index.prune(limit)
+
+    for key in removed:
+        console.print(f"[yellow]Removed {key}[/yellow]")
+    stats = cloner.index.stats()
+    console.print(f"[green]Pruned {len(removed)} clones; "
+                  f"{_format_bytes(stats['bytes'])} in {stats['clones']} clones remain[/green]")
+
+
+@cli.group()
+def vendored():
+    """Manage the database of vendored third-party files."""
+    pass
+
+
+@vendored.command('add')
+@click.argument('paths', nargs=-1, required=True, type=click.Path(exists=True))
+@click.option('--label', required=True, help='Library name, e.g. jquery-3.7.1')
+def vendored_add(paths: tuple[str, ...], label: str):
+    """Mark files (or every file under directories) as vendored by content."""
+    db = VendoredFiles()
+    added = 0
+    for path in map(Path, paths):
+        for file in (p for p in path.rglob('*') if p.is_file()) if path.is_dir() else [path]:
+            db.add(blob_sha(file.read_bytes()), label)
+            added += 1
+    console.print(f"[green]Added {added} files as {label}[/green]")
+
+
+@vendored.command('stats')
+def vendored_stats():
+    """Show how many files are known as vendored."""
+    stats = VendoredFiles().stats()
+    console.print(f"Known files: {stats['known']} "
+                  f"({stats['seeded']} added, {stats['learned_total']} learned from submissions)")
+
+
 if __name__ == "__main__":
     cli()
@@ -42,8 +42,78 @@ TIME_WINDOW = TimeWindow()
 
 # GitHub API settings
 GITHUB_API_BASE = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_BASE}/graphql"
+GITHUB_GRAPHQL_BATCH_SIZE = 40  # repositories per batched GraphQL query
+GITHUB_RAW_BASE = "https://raw.githubusercontent.com"
 GITHUB_RATE_LIMIT_PAUSE = 60  # seconds
+GITHUB_CACHE_TTL = 15 * 60  # seconds before a cached response is revalidated
+GITHUB_CACHE_MAX_BYTES = 256 * 1024 * 1024
+GITHUB_REQUEST_TIMEOUT = 30  # seconds
+GITHUB_MAX_CONCURRENCY = 8  # upper bound for adaptive in-flight requests
+GITHUB_MAX_RETRIES = 3  # retries for secondary rate limits and 5xx
+GITHUB_PACING_THRESHOLD = 0.25  # start spreading calls below this share of the hourly limit
+GITHUB_MAX_RATE_LIMIT_WAIT = 3660  # seconds; longer waits raise GitHubRateLimitError
 
 # Analysis settings
-MAX_TOKENS_PER_REPO = 50000
+MAX_TOKENS_PER_REPO = 50000  # file content read per repo, shared by all analyzers
+CONTENT_BYTES_PER_TOKEN = 4  # rough size of a token of source code
+CONTENT_MAX_FILE_BYTES = 100_000  # larger files are skipped, never truncated
+CONTENT_MINIFIED_LINE_LENGTH = 500  # mean line length above which a file counts as minified
+CONTENT_SKIPPED_REPORT_MAX = 50  # skipped files listed per project
+LANGUAGE_MIN_SHARE = 0.05  # languages below this share of code bytes are incidental
 CLONE_TIMEOUT = 120  # seconds
+CLONE_STRATEGY = "partial"  # shallow | window | partial | full
+SHALLOW_CLONE_DEPTH = 100
+WINDOW_CLONE_MARGIN_DAYS = 7  # window clones start this long before TIME_WINDOW.start
+WINDOW_DEEPEN_COMMITS = 10  # commits fetched per step when proving pre-window history exists
+WINDOW_DEEPEN_MAX_STEPS = 3
+# Per-submission strategy planning from repository size (GitHub reports KB)
+PLAN_API_ONLY_KB = 1024 * 1024  # larger repos are scanned through the API, never cloned
+PLAN_FULL_CLONE_MAX_KB = 20 * 1024  # at most this size...
+PLAN_FULL_CLONE_MAX_COMMITS = 2000  # ...and this many commits, a full clone is cheap
+PLAN_MIN_CODE_SHARE = 0.2  # below this share of code bytes, the repo is mostly assets
+CLONE_CACHE_MAX_BYTES = 10 * 1024 ** 3  # clones kept on disk before LRU eviction
+
+# Paths checked out by partial clones (gitignore-style, non-cone sparse checkout).
+# Source files and the manifests/configs the analyzers read; vendored dirs excluded.
+SPARSE_CHECKOUT_PATTERNS = [
+    '*.js', '*.jsx', '*.mjs', '*.cjs', '*.ts', '*.tsx', '*.vue', '*.svelte',
+    '*.py', '*.rs', '*.go', '*.sol', '*.move', '*.kt', '*.java',
+    '*.yaml', '*.yml', '*.toml',
+    'package.json', 'tsconfig.json', 'vercel.json', '.eslintrc*', '.prettierrc*',
+    '.editorconfig', '.pylintrc', 'requirements.txt', 'setup.py', 'go.mod',
+    'pom.xml', 'build.gradle', 'build.gradle.kts', 'Dockerfile', '.gitattributes',
+    'README*', 'Readme*', 'readme*', 'LICENSE*',
+    '!node_modules/', '!bower_components/', '!vendor/', '!dist/', '!build/',
+    '!.next/', '!target/', '!venv/', '!.venv/',
+]
+GIT_COMMAND_TIMEOUT = 120  # seconds, for local git subprocesses
+REMOTE_BYTE_BUDGET = 1_000_000  # bytes of file content downloaded per repo in API-only mode
+REMOTE_MAX_FILES = 150  # files downloaded per repo in API-only mode
+FACT_CACHE_MAX_ROWS = 2_000_000  # per-file facts kept in the blob-SHA scan cache
+VENDORED_MIN_REPOS = 5  # identical source files in this many submissions are third-party
+VENDORED_MIN_BYTES = 512  # smaller files are too generic to learn as vendored
+
+# Forensics heuristics
+BULK_COMMIT_LINES = 5000  # insertions that make the first in-window commit a bulk dump
+DATE_MISMATCH_SECONDS = 86400  # author/committer date gap that counts as a mismatch
+DATE_MISMATCH_SHARE = 0.15  # share of in-window commits with mismatches that gets flagged
+BURST_WINDOW_SECONDS = 600
+BURST_MIN_COMMITS = 20  # commits inside BURST_WINDOW_SECONDS that count as a burst
+LINE_AGE_JOBS = 4  # concurrent `git blame` processes per repo
+LINE_AGE_BUDGET = 30  # seconds of blame per repo; files left over are reported as skipped
+LINE_AGE_MAX_FILE_BYTES = 500_000
+LINE_AGE_PRE_EXISTING_SHARE = 0.5  # share of surviving lines from before the window that marks pre-existing code
+
+# Cross-submission code provenance (winnowing)
+PROVENANCE_KGRAM = 30  # normalized characters per hashed k-gram
+PROVENANCE_WINDOW = 20  # k-grams per winnowing window; shared runs of KGRAM + WINDOW - 1 chars are always caught
+PROVENANCE_MAX_FILE_BYTES = 200_000  # larger files are usually generated or minified
+PROVENANCE_COMMON_REPOS = 5  # fingerprints in more submissions than this are boilerplate
+PROVENANCE_PAIR_SHARE = 0.5  # share of the smaller code base two submissions must share to be reported
+PROVENANCE_PLAGIARISM_SHARE = 0.3  # share of code found in another submission's pre-window history
+
+# Pipeline settings
+PIPELINE_JOBS = 4  # workers for metadata and analysis stages
+PIPELINE_CLONE_JOBS = 2  # concurrent clones
+PIPELINE_QUEUE_SIZE = 8  # items buffered between stages
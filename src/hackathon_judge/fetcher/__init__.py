@@ -1,6 +1,9 @@
 """Fetcher module for GitHub API and repo cloning."""
 
-from .github_api import GitHubAPI
+from .github_api import GitHubAPI, AsyncGitHubAPI, ResponseCache
+from .rate_limit import GitHubRateLimitError
 from .cloner import RepoCloner
+from .clone_cache import CloneCache
 
-__all__ = ["GitHubAPI", "RepoCloner"]
+__all__ = ["GitHubAPI", "AsyncGitHubAPI", "ResponseCache", "GitHubRateLimitError", "RepoCloner",
+           "CloneCache"]
@@ -0,0 +1,253 @@
+"""SQLite index of cached clones with size-bounded LRU eviction."""
+
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from hackathon_judge.config import CLONE_CACHE_MAX_BYTES
+
+
+@dataclass
+class CachedClone:
+    """One clone recorded in the cache index."""
+    key: str  # "owner/repo"
+    path: Path
+    head_sha: Optional[str]
+    bytes: int
+    last_access: float
+    strategy: str
+
+
+def dir_size(path: Path) -> int:
+    """Bytes used by the files under path (symlinks not followed)."""
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
+
+# Evicted clones are renamed to this prefix before they are deleted
+TOMBSTONE_PREFIX = '.evicted-'
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class CloneCache:
+    """Index of the clones under a cache directory.
+
+    Records owner/repo, HEAD SHA, bytes on disk, last access and clone
+    strategy per clone. When the total exceeds max_bytes, least recently
+    used clones are deleted. Clones in use hold a lease (tagged with the
+    owning pid, so several processes can share the cache); leased clones
+    are never evicted, and leases of dead processes are ignored.
+
+    A doomed clone is renamed to a tombstone while the lock is held and
+    deleted afterwards, so a lease taken right after eviction finds an
+    empty cache path, never a directory that is half deleted.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = CLONE_CACHE_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.cache_dir / "clones.sqlite", check_same_thread=False,
+                                   timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS clones (
+                key TEXT PRIMARY KEY,
+                path TEXT,
+                head_sha TEXT,
+                bytes INTEGER,
+                last_access REAL,
+                strategy TEXT
+            )"""
+        )
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS leases (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                key TEXT,
+                pid INTEGER,
+                acquired REAL
+            )"""
+        )
+        self._db.commit()
+
+    def get(self, key: str) -> Optional[CachedClone]:
+        """Look up a clone and mark it as recently used."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT key, path, head_sha, bytes, last_access, strategy FROM clones WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE clones SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+
+        return CachedClone(row[0], Path(row[1]), row[2], row[3], row[4], row[5])
+
+    def record(self, key: str, path: Path, head_sha: Optional[str], strategy: str):
+        """Add or update a clone, then evict down to max_bytes."""
+        size = dir_size(path)
+        with self._lock:
+            self._db.execute(
+                """INSERT OR REPLACE INTO clones (key, path, head_sha, bytes, last_access, strategy)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (key, str(path), head_sha, size, time.time(), strategy)
+            )
+            self._db.commit()
+        self.evict()
+
+    def remove(self, key: str):
+        """Delete a clone from disk and from the index."""
+        with self._lock:
+            row = self._db.execute("SELECT path FROM clones WHERE key = ?", (key,)).fetchone()
+            self._db.execute("DELETE FROM clones WHERE key = ?", (key,))
+            self._db.commit()
+            tombstone = self._bury(Path(row[0])) if row else None
+        if tombstone:
+            shutil.rmtree(tombstone, ignore_errors=True)
+
+    def _bury(self, path: Path) -> Optional[Path]:
+        """Move a clone out of its cache path; call with the lock held.
+
+        Returns the tombstone to delete, or None if the clone is gone.
+        """
+        tombstone = self.cache_dir / f"{TOMBSTONE_PREFIX}{path.name}-{uuid.uuid4().hex[:8]}"
+        try:
+            os.rename(path, tombstone)
+        except FileNotFoundError:
+            return None
+        except OSError:
+            # Not renameable (e.g. another filesystem): delete in place, still under the lock
+            shutil.rmtree(path, ignore_errors=True)
+            return None
+        return tombstone
+
+    def acquire(self, key: str) -> int:
+        """Take a lease on a clone so eviction leaves it alone. Returns the lease id."""
+        with self._lock:
+            cur = self._db.execute(
+                "INSERT INTO leases (key, pid, acquired) VALUES (?, ?, ?)",
+                (key, os.getpid(), time.time())
+            )
+            self._db.commit()
+            return cur.lastrowid
+
+    def release(self, lease_id: int):
+        with self._lock:
+            self._db.execute("DELETE FROM leases WHERE id = ?", (lease_id,))
+            self._db.commit()
+
+    def _leased_keys(self) -> set[str]:
+        """Keys with a lease held by a live process; stale leases are dropped."""
+        rows = self._db.execute("SELECT id, key, pid FROM leases").fetchall()
+        leased, stale = set(), []
+        for lease_id, key, pid in rows:
+            if _pid_alive(pid):
+                leased.add(key)
+            else:
+                stale.append((lease_id,))
+        if stale:
+            self._db.executemany("DELETE FROM leases WHERE id = ?", stale)
+            self._db.commit()
+        return leased
+
+    def evict(self, max_bytes: Optional[int] = None) -> list[str]:
+        """Delete least recently used, unleased clones until the total fits.
+
+        Returns the evicted keys.
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        with self._lock:
+            total = self._db.execute("SELECT COALESCE(SUM(bytes), 0) FROM clones").fetchone()[0]
+            if total <= limit:
+                return []
+
+            leased = self._leased_keys()
+            rows = self._db.execute(
+                "SELECT key, path, bytes FROM clones ORDER BY last_access"
+            ).fetchall()
+            doomed = []
+            for key, path, size in rows:
+                if total <= limit:
+                    break
+                if key in leased:
+                    continue
+                doomed.append((key, path))
+                total -= size
+
+            self._db.executemany("DELETE FROM clones WHERE key = ?", [(k,) for k, _ in doomed])
+            self._db.commit()
+            tombstones = [self._bury(Path(path)) for _, path in doomed]
+
+        for tombstone in tombstones:
+            if tombstone:
+                shutil.rmtree(tombstone, ignore_errors=True)
+        return [key for key, _ in doomed]
+
+    def prune(self, max_bytes: Optional[int] = None) -> list[str]:
+        """Forget clones whose directory is gone, delete tombstones left by
+        interrupted evictions, then evict down to max_bytes."""
+        with self._lock:
+            rows = self._db.execute("SELECT key, path FROM clones").fetchall()
+            missing = [(key,) for key, path in rows if not Path(path).exists()]
+            self._db.executemany("DELETE FROM clones WHERE key = ?", missing)
+            self._db.commit()
+        for tombstone in self.cache_dir.glob(f"{TOMBSTONE_PREFIX}*"):
+            shutil.rmtree(tombstone, ignore_errors=True)
+        return [key for key, in missing] + self.evict(max_bytes)
+
+    def clear(self):
+        """Delete every unleased clone."""
+        self.evict(max_bytes=0)
+
+    def entries(self) -> list[CachedClone]:
+        """All clones, most recently used first."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT key, path, head_sha, bytes, last_access, strategy FROM clones "
+                "ORDER BY last_access DESC"
+            ).fetchall()
+        return [CachedClone(r[0], Path(r[1]), r[2], r[3], r[4], r[5]) for r in rows]
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, total = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM clones"
+            ).fetchone()
+            leased = len(self._leased_keys())
+        return {
+            'clones': count,
+            'bytes': total,
+            'max_bytes': self.max_bytes,
+            'leased': leased,
+        }
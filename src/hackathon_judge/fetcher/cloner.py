@@ -1,29 +1,168 @@
 """Repository cloner using GitPython."""
 
+import fnmatch
 import os
 import shutil
+import subprocess
 import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
-from git import Repo, GitCommandError
+from git import Repo, GitCommandError, InvalidGitRepositoryError
 
-from hackathon_judge.config import CLONE_TIMEOUT
+from hackathon_judge.config import (
+    CLONE_TIMEOUT, CLONE_STRATEGY, SHALLOW_CLONE_DEPTH, SPARSE_CHECKOUT_PATTERNS, GIT_COMMAND_TIMEOUT,
+    CLONE_CACHE_MAX_BYTES, TIME_WINDOW, WINDOW_CLONE_MARGIN_DAYS, WINDOW_DEEPEN_COMMITS,
+    WINDOW_DEEPEN_MAX_STEPS,
+)
+from .clone_cache import CloneCache
+
+
+CLONE_STRATEGIES = ('shallow', 'window', 'partial', 'full')
+
+# Git config key recording the strategy a clone was made with
+STRATEGY_CONFIG_KEY = 'hackathon-judge.strategy'
+
+
+@dataclass
+class CloneRefresh:
+    """How clone() brought a repository up to date."""
+    action: str  # 'cached' (already current), 'fetched', 'cloned' or 'stale' (fetch failed)
+    old_sha: Optional[str] = None
+    new_sha: Optional[str] = None
+    prefetch_error: Optional[str] = None  # partial clones: history blobs left to lazy fetches
+
+    @property
+    def changed(self) -> bool:
+        return self.old_sha != self.new_sha
+
+
+def sparse_pathspecs(patterns: list[str] = SPARSE_CHECKOUT_PATTERNS) -> list[str]:
+    """Translate sparse-checkout patterns into equivalent git pathspecs."""
+    pathspecs = []
+    for pattern in patterns:
+        magic = 'glob'
+        if pattern.startswith('!'):
+            magic = 'exclude,glob'
+            pattern = pattern[1:]
+        if pattern.endswith('/'):
+            pattern += '**'
+        pathspecs.append(f":({magic})**/{pattern}")
+    return pathspecs
+
+
+def sparse_match(path: str, patterns: list[str] = SPARSE_CHECKOUT_PATTERNS) -> bool:
+    """Whether a sparse checkout with these patterns would include path.
+
+    Follows gitignore rules for the slash-less patterns used here: a
+    pattern matches the file name at any depth, 'dir/' matches any parent
+    directory of that name, and the last matching pattern wins.
+    """
+    parts = path.split('/')
+    included = False
+    for pattern in patterns:
+        negate = pattern.startswith('!')
+        if negate:
+            pattern = pattern[1:]
+        if pattern.endswith('/'):
+            hit = pattern[:-1] in parts[:-1]
+        else:
+            hit = fnmatch.fnmatchcase(parts[-1], pattern)
+        if hit:
+            included = not negate
+    return included
+
+
+def _first_line(stderr: str) -> str:
+    lines = stderr.strip().splitlines()
+    return lines[0] if lines else 'unknown error'
+
+
+def is_partial_clone(path: Path) -> bool:
+    """Whether a repository was cloned with a blob filter (promisor remote)."""
+    proc = subprocess.run(
+        ['git', '-C', str(path), 'config', '--get', 'remote.origin.promisor'],
+        capture_output=True, text=True,
+    )
+    return proc.stdout.strip() == 'true'
 
 
 class RepoCloner:
-    """Clone and manage temporary repository copies."""
+    """Clone and manage temporary repository copies.
+
+    Strategies:
+      shallow  depth-limited clone of the default branch (all files)
+      window   history since WINDOW_CLONE_MARGIN_DAYS before the hackathon
+               window (--shallow-since), deepened a few commits at a time
+               only until one pre-window commit is present (all files)
+      partial  blobless clone (--filter=blob:none) with full commit history and
+               a sparse checkout of source files and manifests; the blobs of
+               those paths at HEAD and changed since the window clone cutoff
+               are fetched in one batch, so analysis of the window does not
+               fall back to per-commit lazy fetches
+      full     complete clone
+
+    With checkout=False no working tree is written at all; the analyzers
+    then read files from the object database (RepoIndex.from_git).
+
+    Clones are kept in a size-bounded LRU cache. A cached clone whose
+    remote HEAD moved is refreshed with a fetch of the default branch
+    rather than recloned; refreshes[path] records the old and new HEAD.
+    If that fetch fails (network, lock file), the cached clone is used as
+    it is and recorded as 'stale'; only a corrupt clone is recloned.
+    Every successful clone() holds a lease until release(path), so
+    eviction never removes a repo that is still being analyzed. Clones of
+    the same repository are serialized, so concurrent submissions of one
+    URL never clone, refresh or delete the same checkout at once.
+    """
 
-    def __init__(self, cache_dir: Optional[str] = None):
+    def __init__(self, cache_dir: Optional[str] = None, strategy: str = CLONE_STRATEGY,
+                 max_cache_bytes: int = CLONE_CACHE_MAX_BYTES, checkout: bool = True,
+                 time_window=None):
+        if strategy not in CLONE_STRATEGIES:
+            raise ValueError(f"Unknown clone strategy: {strategy}")
         self.cache_dir = Path(cache_dir) if cache_dir else Path(tempfile.gettempdir()) / "hackathon_judge_repos"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.strategy = strategy
+        self.checkout = checkout
+        self.window = time_window or TIME_WINDOW
+        self.index = CloneCache(self.cache_dir, max_cache_bytes)
+        self._leases: dict[Path, list[int]] = {}
+        self.refreshes: dict[Path, CloneRefresh] = {}
+        self._prefetch_errors: dict[Path, str] = {}
+        self._leases_lock = threading.Lock()
+        self._key_locks: dict[str, threading.Lock] = {}
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._leases_lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _cache_strategy(self, strategy: str) -> str:
+        """Strategy as recorded in the cache index; clones with and without a
+        work tree are not interchangeable."""
+        return strategy if self.checkout else f"{strategy}+no-checkout"
 
     def _get_cache_path(self, owner: str, repo: str) -> Path:
         """Get cache path for a repository."""
         return self.cache_dir / f"{owner}_{repo}"
 
-    def clone(self, github_url: str, force_fresh: bool = False) -> tuple[Optional[Path], Optional[str]]:
-        """Clone a repository. Returns (path, error)."""
+    def clone(self, github_url: str, force_fresh: bool = False,
+              expected_sha: Optional[str] = None,
+              strategy: Optional[str] = None) -> tuple[Optional[Path], Optional[str]]:
+        """Clone a repository, or reuse an up-to-date cached clone. Returns (path, error).
+
+        expected_sha is the remote HEAD if already known (e.g. from the
+        metadata query); otherwise the remote is asked with ls-remote.
+        strategy overrides the cloner's strategy for this repository.
+        Call release(path) once done with a successful clone.
+        """
+        strategy = strategy or self.strategy
+        if strategy not in CLONE_STRATEGIES:
+            return None, f"Unknown clone strategy: {strategy}"
+
         # Parse owner/repo from URL
         import re
         match = re.search(r'github\.com/([^/]+)/([^/\s]+)', github_url)
@@ -32,17 +171,73 @@ class RepoCloner:
 
         owner = match.group(1)
         repo = match.group(2).rstrip('/').replace('.git', '')
+        key = f"{owner}/{repo}"
+
+        # Lease first so a concurrent eviction cannot delete the clone under us
+        lease = self.index.acquire(key)
+        with self._key_lock(key):
+            path, error = self._clone_cached(owner, repo, force_fresh, expected_sha, strategy)
+        if error:
+            self.index.release(lease)
+            return None, error
 
+        with self._leases_lock:
+            self._leases.setdefault(path, []).append(lease)
+        return path, None
+
+    def release(self, path: Path):
+        """Give up the lease taken by clone(), making the clone evictable again."""
+        with self._leases_lock:
+            leases = self._leases.get(path)
+            if not leases:
+                return
+            lease = leases.pop()
+            if not leases:
+                del self._leases[path]
+                self.refreshes.pop(path, None)
+        self.index.release(lease)
+
+    def _clone_cached(self, owner: str, repo: str, force_fresh: bool,
+                      expected_sha: Optional[str],
+                      strategy: str) -> tuple[Optional[Path], Optional[str]]:
+        """Return a clone at the remote HEAD, reusing or fetching into the cached one."""
+        key = f"{owner}/{repo}"
         cache_path = self._get_cache_path(owner, repo)
+        cache_strategy = self._cache_strategy(strategy)
+        head_sha = None
+        self._prefetch_errors.pop(cache_path, None)
 
-        # Check if already cloned
+        # Check if already cloned with the same strategy
         if cache_path.exists() and not force_fresh:
-            try:
-                Repo(cache_path)
-                return cache_path, None
-            except:
-                # Invalid repo, remove and reclone
-                shutil.rmtree(cache_path, ignore_errors=True)
+            head_sha = self.get_head_sha(cache_path)  # None if the clone is corrupt
+            cached = self.index.get(key)
+            cached_strategy = cached.strategy if cached else self.strategy_of(cache_path)
+            if head_sha is not None and cached_strategy == cache_strategy:
+                remote_sha = expected_sha or self.get_remote_head_sha(cache_path)
+                # An unreachable remote keeps the cached clone usable
+                if remote_sha is None or remote_sha == head_sha:
+                    if cached is None:
+                        self.index.record(key, cache_path, head_sha, cache_strategy)
+                    self.refreshes[cache_path] = CloneRefresh('cached', head_sha, head_sha)
+                    return cache_path, None
+
+                # Remote moved: fetch just the default branch
+                try:
+                    new_sha = self.refresh(cache_path, strategy)
+                    action = 'fetched'
+                except (GitCommandError, subprocess.CalledProcessError,
+                        subprocess.TimeoutExpired, OSError):
+                    # A failed fetch leaves a usable clone, just behind the remote
+                    new_sha = self.get_head_sha(cache_path)
+                    action = 'stale'
+                if new_sha is not None:
+                    self.index.record(key, cache_path, new_sha, cache_strategy)
+                    self.refreshes[cache_path] = CloneRefresh(
+                        action, head_sha, new_sha, self._prefetch_errors.pop(cache_path, None)
+                    )
+                    return cache_path, None
+            # Corrupt repo or different strategy: remove and reclone
+            shutil.rmtree(cache_path, ignore_errors=True)
 
         # Remove existing if forcing fresh
         if cache_path.exists() and force_fresh:
@@ -51,11 +246,11 @@ class RepoCloner:
         # Clone
         try:
             clone_url = f"https://github.com/{owner}/{repo}.git"
-            Repo.clone_from(
-                clone_url,
-                cache_path,
-                depth=100,  # Shallow clone with some history
-                single_branch=True,
+            self._clone_with_strategy(clone_url, cache_path, strategy)
+            new_sha = self.get_head_sha(cache_path)
+            self.index.record(key, cache_path, new_sha, cache_strategy)
+            self.refreshes[cache_path] = CloneRefresh(
+                'cloned', head_sha, new_sha, self._prefetch_errors.pop(cache_path, None)
             )
             return cache_path, None
 
@@ -66,21 +261,249 @@ class RepoCloner:
             shutil.rmtree(cache_path, ignore_errors=True)
             return None, f"Clone error: {str(e)}"
 
+    def _clone_with_strategy(self, clone_url: str, path: Path, strategy: Optional[str] = None):
+        """Run the clone for a strategy (default: the configured one)."""
+        strategy = strategy or self.strategy
+        if strategy == 'shallow':
+            repo = Repo.clone_from(
+                clone_url,
+                path,
+                depth=SHALLOW_CLONE_DEPTH,  # Shallow clone with some history
+                single_branch=True,
+                no_checkout=not self.checkout,
+            )
+        elif strategy == 'window':
+            try:
+                repo = Repo.clone_from(
+                    clone_url,
+                    path,
+                    shallow_since=self._shallow_since(),
+                    single_branch=True,
+                    no_checkout=not self.checkout,
+                )
+            except GitCommandError:
+                # No commits since the cutoff: the newest commits are all pre-window
+                shutil.rmtree(path, ignore_errors=True)
+                repo = Repo.clone_from(
+                    clone_url,
+                    path,
+                    depth=WINDOW_DEEPEN_COMMITS,
+                    single_branch=True,
+                    no_checkout=not self.checkout,
+                )
+            self._deepen_to_window(repo, path)
+        elif strategy == 'full':
+            repo = Repo.clone_from(clone_url, path, single_branch=True, no_checkout=not self.checkout)
+        else:
+            repo = Repo.clone_from(
+                clone_url,
+                path,
+                multi_options=['--filter=blob:none', '--no-checkout'],
+                single_branch=True,
+            )
+            if self.checkout:
+                repo.git.sparse_checkout('set', '--no-cone', *SPARSE_CHECKOUT_PATTERNS)
+                repo.git.checkout()
+            self._prefetch_history_blobs(path)
+        # Lets strategy_of() tell a clone's strategy apart without the cache index
+        repo.git.config(STRATEGY_CONFIG_KEY, strategy)
+
+    def refresh(self, path: Path, strategy: Optional[str] = None) -> Optional[str]:
+        """Fetch the default branch into an existing clone and check it out.
+
+        Only the new commits are transferred; shallow clones stay shallow
+        and partial clones stay blobless. Returns the new HEAD SHA.
+        """
+        strategy = strategy or self.strategy
+        repo = Repo(path)
+        branch = repo.active_branch.name
+
+        if strategy == 'shallow':
+            repo.git.fetch('origin', branch, depth=SHALLOW_CLONE_DEPTH)
+        elif strategy == 'window':
+            repo.git.fetch('origin', branch, shallow_since=self._shallow_since())
+        elif strategy == 'partial':
+            repo.git.fetch('origin', branch, filter='blob:none')
+        else:
+            repo.git.fetch('origin', branch)
+
+        # Force-pushes are fine: the branch is reset to whatever was fetched
+        repo.git.reset('--hard' if self.checkout else '--soft', 'FETCH_HEAD')
+        if strategy == 'window':
+            self._deepen_to_window(repo, path)
+        if strategy == 'partial':
+            self._prefetch_history_blobs(path)
+        return self.get_head_sha(path)
+
+    def _shallow_since(self) -> str:
+        """Cutoff date for window clones."""
+        return (self.window.start - timedelta(days=WINDOW_CLONE_MARGIN_DAYS)).isoformat()
+
+    def _deepen_to_window(self, repo: Repo, path: Path):
+        """Deepen a window clone until it holds a commit from before the window.
+
+        One pre-window commit is enough for forensics to know that earlier
+        history exists; beyond that, older history is never transferred.
+        Stops when the clone is no longer shallow (the whole history is
+        present).
+        """
+        window_start = datetime.combine(self.window.start, datetime.min.time()).timestamp()
+        for _ in range(WINDOW_DEEPEN_MAX_STEPS):
+            if not (path / '.git' / 'shallow').exists():
+                return
+            if repo.git.rev_list('-1', f'--before={int(window_start)}', 'HEAD'):
+                return
+            repo.git.fetch('origin', deepen=WINDOW_DEEPEN_COMMITS)
+
+    def _prefetch_history_blobs(self, path: Path):
+        """Fetch the missing blobs under the sparse paths in one request.
+
+        Covers the blobs at HEAD and those changed since the window clone
+        cutoff (WINDOW_CLONE_MARGIN_DAYS before the hackathon window), which
+        is what the analyzers and the in-window numstat and blame read.
+        Without this, `git log --numstat` in a blobless clone triggers one
+        lazy fetch per commit. A failed prefetch is not fatal, git still
+        fetches lazily, but it is recorded in the clone's CloneRefresh.
+        """
+        git = ['git', '-C', str(path)]
+        try:
+            log = subprocess.run(
+                git + ['log', '--raw', '--no-abbrev', '--no-renames', '--format=',
+                       f'--since={self._shallow_since()}', 'HEAD', '--'] + sparse_pathspecs(),
+                capture_output=True, text=True, timeout=CLONE_TIMEOUT,
+            )
+            head = subprocess.run(
+                git + ['ls-tree', '-r', '--full-tree', 'HEAD'],
+                capture_output=True, text=True, timeout=CLONE_TIMEOUT,
+            )
+            # --missing=print lists absent objects without fetching them
+            listing = subprocess.run(
+                git + ['rev-list', '--objects', '--missing=print', 'HEAD'],
+                capture_output=True, text=True, timeout=CLONE_TIMEOUT,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            self._prefetch_errors[path] = f"blob prefetch failed: {e}"
+            return
+        for proc in (log, head, listing):
+            if proc.returncode != 0:
+                self._prefetch_errors[path] = f"blob prefetch failed: {_first_line(proc.stderr)}"
+                return
+
+        wanted = set()
+        for line in log.stdout.splitlines():
+            if line.startswith(':'):
+                old, new = line.split()[2:4]
+                wanted.update((old, new))
+        for line in head.stdout.splitlines():
+            # "<mode> blob <sha>\t<path>"; ls-tree takes no glob pathspecs
+            meta, _, rel_path = line.partition('\t')
+            parts = meta.split()
+            if len(parts) == 3 and parts[1] == 'blob' and sparse_match(rel_path):
+                wanted.add(parts[2])
+        missing = {line[1:] for line in listing.stdout.splitlines() if line.startswith('?')}
+
+        oids = wanted & missing
+        if not oids:
+            return
+
+        try:
+            fetch = subprocess.run(
+                git + ['-c', 'fetch.negotiationAlgorithm=noop', 'fetch', '--quiet',
+                       '--no-tags', '--no-write-fetch-head', '--recurse-submodules=no',
+                       '--filter=blob:none', '--stdin', 'origin'],
+                input='\n'.join(sorted(oids)) + '\n',
+                capture_output=True, text=True, timeout=CLONE_TIMEOUT,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            self._prefetch_errors[path] = f"blob prefetch failed: {e}"
+            return
+        if fetch.returncode != 0:
+            self._prefetch_errors[path] = (
+                f"blob prefetch of {len(oids)} blobs failed: {_first_line(fetch.stderr)}"
+            )
+
+    def strategy_of(self, path: Path) -> str:
+        """Infer the strategy (and checkout state) an existing clone was made with.
+
+        Clones record their strategy in their git config. For older clones
+        it is inferred: a shallow clone with other than SHALLOW_CLONE_DEPTH
+        commits was cut by date, i.e. is a window clone.
+        """
+        git = ['git', '--git-dir', str(Path(path) / '.git')]
+        try:
+            recorded = subprocess.run(
+                git + ['config', '--get', STRATEGY_CONFIG_KEY],
+                capture_output=True, text=True, timeout=GIT_COMMAND_TIMEOUT,
+            ).stdout.strip()
+        except (OSError, subprocess.TimeoutExpired):
+            recorded = ''
+
+        if recorded in CLONE_STRATEGIES:
+            strategy = recorded
+        elif is_partial_clone(path):
+            strategy = 'partial'
+        elif (path / '.git' / 'shallow').exists():
+            try:
+                count = subprocess.run(
+                    git + ['rev-list', '--count', 'HEAD'],
+                    capture_output=True, text=True, timeout=GIT_COMMAND_TIMEOUT,
+                ).stdout.strip()
+            except (OSError, subprocess.TimeoutExpired):
+                count = ''
+            strategy = 'shallow' if count == str(SHALLOW_CLONE_DEPTH) else 'window'
+        else:
+            strategy = 'full'
+        # A clone that was never checked out has no index file
+        if not (path / '.git' / 'index').exists():
+            strategy += '+no-checkout'
+        return strategy
+
+    def get_remote_head_sha(self, path: Path) -> Optional[str]:
+        """Ask the remote for its HEAD SHA (one ls-remote round trip)."""
+        try:
+            proc = subprocess.run(
+                ['git', '-C', str(path), 'ls-remote', 'origin', 'HEAD'],
+                capture_output=True, text=True, timeout=CLONE_TIMEOUT,
+            )
+        except subprocess.TimeoutExpired:
+            return None
+        if proc.returncode != 0 or not proc.stdout:
+            return None
+        return proc.stdout.split()[0]
+
     def get_repo(self, path: Path) -> Optional[Repo]:
         """Get a Repo object for a cloned repository."""
         try:
             return Repo(path)
-        except:
+        except (InvalidGitRepositoryError, OSError):
+            return None
+
+    def get_head_sha(self, path: Path) -> Optional[str]:
+        """Get the HEAD commit SHA of a cloned repository, or None if it is
+        not a valid repository with a commit checked out."""
+        try:
+            proc = subprocess.run(
+                ['git', '--git-dir', str(Path(path) / '.git'),
+                 'rev-parse', '--verify', '--quiet', 'HEAD^{commit}'],
+                capture_output=True, text=True, timeout=GIT_COMMAND_TIMEOUT,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if proc.returncode != 0:
             return None
+        return proc.stdout.strip() or None
 
     def cleanup(self, owner: str, repo: str):
         """Remove a cached repository."""
+        self.index.remove(f"{owner}/{repo}")
         cache_path = self._get_cache_path(owner, repo)
         if cache_path.exists():
             shutil.rmtree(cache_path, ignore_errors=True)
 
     def cleanup_all(self):
-        """Remove all cached repositories."""
-        if self.cache_dir.exists():
-            shutil.rmtree(self.cache_dir, ignore_errors=True)
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        """Remove all cached repositories that are not in use."""
+        self.index.clear()
+        kept = {clone.path for clone in self.index.entries()}
+        for entry in self.cache_dir.iterdir():
+            if entry.is_dir() and entry not in kept:
+                shutil.rmtree(entry, ignore_errors=True)
@@ -1,26 +1,185 @@
 """GitHub API client for fetching repository metadata."""
 
+import asyncio
+import json
 import os
 import re
+import sqlite3
+import tempfile
+import threading
 import time
-from typing import Optional
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import AsyncIterator, Iterator, Optional
+from urllib.parse import parse_qs, quote, urlencode, urlparse
 
 import requests
+from requests.structures import CaseInsensitiveDict
 
-from hackathon_judge.config import GITHUB_API_BASE, GITHUB_RATE_LIMIT_PAUSE
+from hackathon_judge.config import (
+    GITHUB_API_BASE, GITHUB_RATE_LIMIT_PAUSE, GITHUB_CACHE_TTL, GITHUB_CACHE_MAX_BYTES,
+    GITHUB_MAX_CONCURRENCY, GITHUB_MAX_RETRIES, GITHUB_REQUEST_TIMEOUT,
+    GITHUB_GRAPHQL_URL, GITHUB_GRAPHQL_BATCH_SIZE, GITHUB_RAW_BASE
+)
 from hackathon_judge.models import RepoMetadata
+from .graphql import RepoSnapshot, build_batch_query, parse_batch_response
+from .rate_limit import AdaptiveConcurrency, GitHubRateLimitError, RateLimitBudget
+
+
+@dataclass
+class CachedResponse:
+    """A stored GitHub API response."""
+    body: bytes
+    headers: dict
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+    def to_response(self, url: str) -> requests.Response:
+        """Rebuild a requests.Response so callers can't tell it was cached."""
+        response = requests.Response()
+        response.status_code = 200
+        response._content = self.body
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.url = url
+        response.encoding = 'utf-8'
+        return response
+
+
+class ResponseCache:
+    """On-disk, size-bounded cache of GitHub API responses.
+
+    Entries younger than ttl are served without a request. Older entries are
+    revalidated with If-None-Match / If-Modified-Since; a 304 answer does not
+    count against the rate limit. When the total body size exceeds
+    max_bytes, least recently used entries are evicted.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: int = GITHUB_CACHE_TTL,
+                 max_bytes: int = GITHUB_CACHE_MAX_BYTES):
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(tempfile.gettempdir()) / "hackathon_judge_http"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.counts = {'hits': 0, 'revalidated': 0, 'misses': 0}
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.cache_dir / "responses.sqlite", check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                headers TEXT,
+                body BLOB,
+                size INTEGER,
+                fetched_at REAL,
+                accessed_at REAL
+            )"""
+        )
+        self._db.commit()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Look up a cached response and mark it as recently used."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, headers, etag, last_modified, fetched_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+
+        body, headers, etag, last_modified, fetched_at = row
+        return CachedResponse(body, json.loads(headers), etag, last_modified, fetched_at)
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        return time.time() - entry.fetched_at < self.ttl
+
+    def put(self, key: str, response: requests.Response):
+        """Store a 200 response."""
+        body = response.content
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                """INSERT OR REPLACE INTO responses
+                   (key, etag, last_modified, headers, body, size, fetched_at, accessed_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (key, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                 json.dumps(dict(response.headers)), body, len(body), now, now)
+            )
+            self._db.commit()
+            self._evict()
+
+    def touch(self, key: str):
+        """Mark an entry as revalidated (after a 304)."""
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE key = ?", (now, now, key)
+            )
+            self._db.commit()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes."""
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        doomed = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        self._db.commit()
+
+    def record(self, outcome: str):
+        """Count a lookup outcome: hits, revalidated or misses."""
+        with self._lock:
+            self.counts[outcome] += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self.counts)
+
+
+def _page_number(url: Optional[str]) -> Optional[int]:
+    """The page query parameter of a pagination URL."""
+    if not url:
+        return None
+    page = parse_qs(urlparse(url).query).get('page', [''])[0]
+    return int(page) if page.isdigit() else None
 
 
-class GitHubAPI:
-    """Client for GitHub REST API."""
+class AsyncGitHubAPI:
+    """Asyncio client for GitHub REST API.
+
+    Requests are budgeted against X-RateLimit-Remaining/Reset before they
+    are sent, so a long run spreads its calls over the reset window instead
+    of hitting a 403 wall. In-flight concurrency adapts to the server:
+    secondary rate limits, 429s and 5xx answers halve it, sustained success
+    grows it again. Blocking I/O runs in worker threads via asyncio.to_thread.
+    An instance must only be used from one event loop.
+    """
 
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, token: Optional[str] = None, cache: Optional[ResponseCache] = None,
+                 use_cache: bool = True, max_concurrency: int = GITHUB_MAX_CONCURRENCY):
         self.token = token or os.environ.get('GITHUB_TOKEN')
         self.session = requests.Session()
         if self.token:
             self.session.headers['Authorization'] = f'token {self.token}'
         self.session.headers['Accept'] = 'application/vnd.github.v3+json'
         self.session.headers['User-Agent'] = 'HackathonJudge/1.0'
+        self.cache = cache or (ResponseCache() if use_cache else None)
+        self.concurrency = AdaptiveConcurrency(
+            initial=max(max_concurrency // 2, 1), maximum=max_concurrency
+        )
+        self.budgets: dict[str, RateLimitBudget] = {}
+        self.snapshots: dict[tuple[str, str], RepoSnapshot] = {}
 
     def _parse_repo_url(self, url: str) -> tuple[str, str] | None:
         """Extract owner and repo name from GitHub URL."""
@@ -40,18 +199,139 @@ class GitHubAPI:
 
         return None
 
-    def _handle_rate_limit(self, response: requests.Response) -> bool:
-        """Handle rate limiting. Returns True if we should retry."""
-        if response.status_code == 403:
-            remaining = response.headers.get('X-RateLimit-Remaining', '0')
-            if remaining == '0':
-                reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
-                wait_time = max(reset_time - time.time(), GITHUB_RATE_LIMIT_PAUSE)
-                time.sleep(min(wait_time, GITHUB_RATE_LIMIT_PAUSE))
-                return True
+    def _budget(self, resource: str) -> RateLimitBudget:
+        """Budget for one rate-limit resource (core, graphql, ...)."""
+        if resource not in self.budgets:
+            self.budgets[resource] = RateLimitBudget()
+        return self.budgets[resource]
+
+    def _is_primary_limit(self, response: requests.Response) -> bool:
+        """True when the hourly budget itself is used up."""
+        return (response.status_code in (403, 429)
+                and response.headers.get('X-RateLimit-Remaining') == '0')
+
+    def _is_throttled(self, response: requests.Response) -> bool:
+        """True for secondary rate limits, 429s and server errors."""
+        if response.status_code >= 500:
+            return True
+        if response.status_code in (403, 429):
+            return ('Retry-After' in response.headers
+                    or 'secondary rate limit' in response.text.lower())
         return False
 
-    def get_repo_metadata(self, github_url: str) -> RepoMetadata:
+    def _backoff(self, response: requests.Response, attempt: int) -> float:
+        """Seconds to wait before retrying a throttled request."""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return float(min(2 ** attempt, GITHUB_RATE_LIMIT_PAUSE))
+
+    async def _send(self, method: str, url: str, resource: str = 'core',
+                    **kwargs) -> requests.Response:
+        """Send a request within the rate budget, retrying throttled answers."""
+        budget = self._budget(resource)
+
+        for attempt in range(GITHUB_MAX_RETRIES + 1):
+            await budget.acquire()
+            async with self.concurrency:
+                response = await asyncio.to_thread(
+                    self.session.request, method, url,
+                    timeout=GITHUB_REQUEST_TIMEOUT, **kwargs
+                )
+            budget.update(response.headers)
+
+            if self._is_primary_limit(response):
+                # The next acquire() waits for the reset (or raises if it is too far off)
+                reset = response.headers.get('X-RateLimit-Reset')
+                budget.exhaust(float(reset) if reset else None)
+                continue
+
+            if self._is_throttled(response):
+                self.concurrency.on_throttle()
+                if attempt < GITHUB_MAX_RETRIES:
+                    await asyncio.sleep(self._backoff(response, attempt))
+                    continue
+                return response
+
+            self.concurrency.on_success()
+            return response
+
+        raise GitHubRateLimitError(f"GitHub rate limit still exhausted after retries: {url}")
+
+    async def _get(self, url: str, params: Optional[dict] = None,
+                   resource: str = 'core') -> requests.Response:
+        """GET through the response cache, revalidating stale entries."""
+        if self.cache is None:
+            return await self._send('GET', url, resource=resource, params=params)
+
+        key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        entry = self.cache.get(key)
+        if entry and self.cache.is_fresh(entry):
+            self.cache.record('hits')
+            return entry.to_response(url)
+
+        headers = {}
+        if entry:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        response = await self._send('GET', url, resource=resource, params=params, headers=headers)
+
+        if response.status_code == 304 and entry:
+            self.cache.record('revalidated')
+            self.cache.touch(key)
+            return entry.to_response(url)
+
+        self.cache.record('misses')
+        if response.status_code == 200:
+            self.cache.put(key, response)
+        return response
+
+    async def prefetch_metadata(self, github_urls: list[str],
+                                batch_size: int = GITHUB_GRAPHQL_BATCH_SIZE) -> dict[str, RepoMetadata]:
+        """Fetch metadata, languages and root entries for many repos via batched GraphQL.
+
+        Each request covers batch_size repositories using aliased
+        `repository` fields. Results are kept and served by
+        get_repo_metadata, get_languages and get_repo_contents, so later
+        per-repo calls cost no requests. GraphQL needs a token; without one
+        nothing is prefetched and the REST calls are used as before.
+        """
+        if not self.token:
+            return {}
+
+        wanted: dict[str, tuple[str, str]] = {}
+        for url in github_urls:
+            parsed = self._parse_repo_url(url)
+            if parsed:
+                wanted[url] = parsed
+
+        missing = list(dict.fromkeys(r for r in wanted.values() if r not in self.snapshots))
+        batches = [missing[i:i + batch_size] for i in range(0, len(missing), max(batch_size, 1))]
+        for snapshots in await asyncio.gather(*(self._fetch_batch(b) for b in batches)):
+            self.snapshots.update(snapshots)
+
+        return {
+            url: replace(self.snapshots[repo].metadata)
+            for url, repo in wanted.items() if repo in self.snapshots
+        }
+
+    async def _fetch_batch(self, repos: list[tuple[str, str]]) -> dict[tuple[str, str], RepoSnapshot]:
+        """Run one batched GraphQL query; failures leave the batch to REST."""
+        try:
+            response = await self._send(
+                'POST', GITHUB_GRAPHQL_URL, resource='graphql',
+                json={'query': build_batch_query(repos)},
+            )
+            if response.status_code != 200:
+                return {}
+            return parse_batch_response(repos, response.json())
+        except (requests.RequestException, GitHubRateLimitError, ValueError):
+            return {}
+
+    async def get_repo_metadata(self, github_url: str) -> RepoMetadata:
         """Fetch repository metadata from GitHub API."""
         parsed = self._parse_repo_url(github_url)
 
@@ -65,12 +345,13 @@ class GitHubAPI:
 
         owner, repo = parsed
 
+        snapshot = self.snapshots.get((owner, repo))
+        if snapshot:
+            return replace(snapshot.metadata)
+
         try:
             # Get repository info
-            response = self.session.get(f"{GITHUB_API_BASE}/repos/{owner}/{repo}")
-
-            if self._handle_rate_limit(response):
-                response = self.session.get(f"{GITHUB_API_BASE}/repos/{owner}/{repo}")
+            response = await self._get(f"{GITHUB_API_BASE}/repos/{owner}/{repo}")
 
             if response.status_code == 404:
                 return RepoMetadata(
@@ -102,6 +383,7 @@ class GitHubAPI:
                 topics=data.get('topics', []),
                 has_readme=True,  # Will be checked later
                 has_license=data.get('license') is not None,
+                size_kb=data.get('size', 0),
                 is_accessible=True,
             )
 
@@ -113,14 +395,15 @@ class GitHubAPI:
                 error=f"Request error: {str(e)}"
             )
 
-    def get_repo_contents(self, owner: str, repo: str, path: str = "") -> list[dict]:
+    async def get_repo_contents(self, owner: str, repo: str, path: str = "") -> list[dict]:
         """Get repository contents at a given path."""
+        snapshot = self.snapshots.get((owner, repo))
+        if not path and snapshot and snapshot.root_entries:
+            return list(snapshot.root_entries)
+
         try:
             url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/contents/{path}"
-            response = self.session.get(url)
-
-            if self._handle_rate_limit(response):
-                response = self.session.get(url)
+            response = await self._get(url)
 
             if response.status_code != 200:
                 return []
@@ -130,14 +413,11 @@ class GitHubAPI:
         except requests.RequestException:
             return []
 
-    def get_file_content(self, owner: str, repo: str, path: str) -> str | None:
+    async def get_file_content(self, owner: str, repo: str, path: str) -> str | None:
         """Get content of a specific file."""
         try:
             url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/contents/{path}"
-            response = self.session.get(url)
-
-            if self._handle_rate_limit(response):
-                response = self.session.get(url)
+            response = await self._get(url)
 
             if response.status_code != 200:
                 return None
@@ -149,10 +429,12 @@ class GitHubAPI:
 
             return data.get('content')
 
+        except GitHubRateLimitError:
+            raise
         except (requests.RequestException, Exception):
             return None
 
-    def get_commits(self, owner: str, repo: str, since: str | None = None,
+    async def get_commits(self, owner: str, repo: str, since: str | None = None,
                     until: str | None = None, per_page: int = 100) -> list[dict]:
         """Get repository commits."""
         try:
@@ -163,10 +445,7 @@ class GitHubAPI:
                 params['until'] = until
 
             url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/commits"
-            response = self.session.get(url, params=params)
-
-            if self._handle_rate_limit(response):
-                response = self.session.get(url, params=params)
+            response = await self._get(url, params=params)
 
             if response.status_code != 200:
                 return []
@@ -176,14 +455,124 @@ class GitHubAPI:
         except requests.RequestException:
             return []
 
-    def get_languages(self, owner: str, repo: str) -> dict[str, int]:
+    async def iter_commits(self, owner: str, repo: str, since: str | None = None,
+                           until: str | None = None, per_page: int = 100) -> AsyncIterator[dict]:
+        """Stream every commit, newest first, following Link-header pagination.
+
+        since/until (ISO 8601) are applied by the server. Once the first page
+        reveals the last page number, the remaining pages are fetched
+        concurrently in waves that double up to GITHUB_MAX_CONCURRENCY
+        pages; a wave is only requested when the caller has consumed the
+        previous one, so stopping early saves the remaining requests. The stream ends
+        at the first failed page.
+        """
+        url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/commits"
+        params = {'per_page': per_page}
+        if since:
+            params['since'] = since
+        if until:
+            params['until'] = until
+
+        try:
+            response = await self._get(url, params=params)
+            if response.status_code != 200:
+                return
+            for commit in response.json():
+                yield commit
+
+            last_page = _page_number(response.links.get('last', {}).get('url'))
+            if last_page is None:
+                # No page count: follow rel="next" one page at a time
+                while 'next' in response.links:
+                    response = await self._get(response.links['next']['url'])
+                    if response.status_code != 200:
+                        return
+                    for commit in response.json():
+                        yield commit
+                return
+
+            page, wave_size = 2, 1
+            while page <= last_page:
+                wave = range(page, min(page + wave_size, last_page + 1))
+                page += len(wave)
+                wave_size = min(wave_size * 2, GITHUB_MAX_CONCURRENCY)
+                responses = await asyncio.gather(
+                    *(self._get(url, params={**params, 'page': p}) for p in wave)
+                )
+                for response in responses:
+                    if response.status_code != 200:
+                        return
+                    for commit in response.json():
+                        yield commit
+        except requests.RequestException:
+            return
+
+    async def count_commits(self, owner: str, repo: str, since: str | None = None,
+                            until: str | None = None) -> int | None:
+        """Count commits with one request: with one commit per page, the
+        last page number in the Link header is the total. None on failure."""
+        url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/commits"
+        params = {'per_page': 1}
+        if since:
+            params['since'] = since
+        if until:
+            params['until'] = until
+
+        try:
+            response = await self._get(url, params=params)
+            if response.status_code != 200:
+                return None
+            last_page = _page_number(response.links.get('last', {}).get('url'))
+            return last_page if last_page is not None else len(response.json())
+        except (requests.RequestException, ValueError):
+            return None
+
+    async def get_tree(self, owner: str, repo: str, ref: str) -> dict:
+        """Get the full recursive file tree at a ref in one call.
+
+        Returns the Git Trees API payload ({'sha', 'tree': [...], 'truncated'})
+        or {} on failure.
+        """
+        try:
+            url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/git/trees/{ref}"
+            response = await self._get(url, params={'recursive': '1'})
+
+            if response.status_code != 200:
+                return {}
+
+            return response.json()
+
+        except requests.RequestException:
+            return {}
+
+    async def get_raw_file(self, owner: str, repo: str, ref: str, path: str) -> bytes | None:
+        """Get raw file bytes from raw.githubusercontent.com.
+
+        Raw downloads do not count against the REST rate limit, so they use
+        their own 'raw' budget: its responses carry no X-RateLimit headers,
+        so it never paces, while concurrency stays shared with the API.
+        """
+        try:
+            url = f"{GITHUB_RAW_BASE}/{owner}/{repo}/{ref}/{quote(path)}"
+            response = await self._get(url, resource='raw')
+
+            if response.status_code != 200:
+                return None
+
+            return response.content
+
+        except requests.RequestException:
+            return None
+
+    async def get_languages(self, owner: str, repo: str) -> dict[str, int]:
         """Get repository languages."""
+        snapshot = self.snapshots.get((owner, repo))
+        if snapshot:
+            return dict(snapshot.languages)
+
         try:
             url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/languages"
-            response = self.session.get(url)
-
-            if self._handle_rate_limit(response):
-                response = self.session.get(url)
+            response = await self._get(url)
 
             if response.status_code != 200:
                 return {}
@@ -192,3 +581,97 @@ class GitHubAPI:
 
         except requests.RequestException:
             return {}
+
+
+class GitHubAPI:
+    """Synchronous client for GitHub REST API.
+
+    A thin wrapper over AsyncGitHubAPI: every call runs the matching
+    coroutine on one private event-loop thread. Callers in any thread
+    therefore share a single rate budget and concurrency limiter.
+    """
+
+    def __init__(self, token: Optional[str] = None, cache: Optional[ResponseCache] = None,
+                 use_cache: bool = True, max_concurrency: int = GITHUB_MAX_CONCURRENCY):
+        self.aio = AsyncGitHubAPI(token, cache, use_cache, max_concurrency)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+
+    @property
+    def token(self) -> Optional[str]:
+        return self.aio.token
+
+    @property
+    def session(self) -> requests.Session:
+        return self.aio.session
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        return self.aio.cache
+
+    def _run(self, coro):
+        """Run a coroutine on the client's event loop and wait for its result."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _parse_repo_url(self, url: str) -> tuple[str, str] | None:
+        """Extract owner and repo name from GitHub URL."""
+        return self.aio._parse_repo_url(url)
+
+    def _get(self, url: str, params: Optional[dict] = None) -> requests.Response:
+        return self._run(self.aio._get(url, params))
+
+    def prefetch_metadata(self, github_urls: list[str],
+                          batch_size: int = GITHUB_GRAPHQL_BATCH_SIZE) -> dict[str, RepoMetadata]:
+        """Fetch metadata for many repos via batched GraphQL (see AsyncGitHubAPI)."""
+        return self._run(self.aio.prefetch_metadata(github_urls, batch_size))
+
+    def get_repo_metadata(self, github_url: str) -> RepoMetadata:
+        """Fetch repository metadata from GitHub API."""
+        return self._run(self.aio.get_repo_metadata(github_url))
+
+    def get_repo_contents(self, owner: str, repo: str, path: str = "") -> list[dict]:
+        """Get repository contents at a given path."""
+        return self._run(self.aio.get_repo_contents(owner, repo, path))
+
+    def get_file_content(self, owner: str, repo: str, path: str) -> str | None:
+        """Get content of a specific file."""
+        return self._run(self.aio.get_file_content(owner, repo, path))
+
+    def get_commits(self, owner: str, repo: str, since: str | None = None,
+                    until: str | None = None, per_page: int = 100) -> list[dict]:
+        """Get repository commits."""
+        return self._run(self.aio.get_commits(owner, repo, since, until, per_page))
+
+    def iter_commits(self, owner: str, repo: str, since: str | None = None,
+                     until: str | None = None, per_page: int = 100) -> Iterator[dict]:
+        """Stream every commit, newest first (see AsyncGitHubAPI.iter_commits)."""
+        stream = self.aio.iter_commits(owner, repo, since, until, per_page)
+        try:
+            while True:
+                try:
+                    yield self._run(stream.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._run(stream.aclose())
+
+    def count_commits(self, owner: str, repo: str, since: str | None = None,
+                      until: str | None = None) -> int | None:
+        """Count commits with one request."""
+        return self._run(self.aio.count_commits(owner, repo, since, until))
+
+    def get_tree(self, owner: str, repo: str, ref: str) -> dict:
+        """Get the full recursive file tree at a ref in one call."""
+        return self._run(self.aio.get_tree(owner, repo, ref))
+
+    def get_raw_file(self, owner: str, repo: str, ref: str, path: str) -> bytes | None:
+        """Get raw file bytes from raw.githubusercontent.com."""
+        return self._run(self.aio.get_raw_file(owner, repo, ref, path))
+
+    def get_languages(self, owner: str, repo: str) -> dict[str, int]:
+        """Get repository languages."""
+        return self._run(self.aio.get_languages(owner, repo))
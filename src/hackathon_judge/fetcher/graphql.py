@@ -0,0 +1,120 @@
+"""Batched GitHub GraphQL queries for repository metadata."""
+
+import json
+from dataclasses import dataclass, field
+from typing import Optional
+
+from hackathon_judge.models import RepoMetadata
+
+
+# Fields fetched for every repository in a batch
+REPO_FIELDS = """
+    defaultBranchRef { name target { oid ... on Commit { history { totalCount } } } }
+    diskUsage
+    stargazerCount
+    forkCount
+    createdAt
+    pushedAt
+    primaryLanguage { name }
+    repositoryTopics(first: 20) { nodes { topic { name } } }
+    licenseInfo { key }
+    languages(first: 50) { edges { size node { name } } }
+    object(expression: "HEAD:") { ... on Tree { entries { name type } } }
+"""
+
+
+@dataclass
+class RepoSnapshot:
+    """Everything one batched query returns for a repository."""
+    metadata: RepoMetadata
+    languages: dict[str, int] = field(default_factory=dict)
+    root_entries: list[dict] = field(default_factory=list)
+
+
+def build_batch_query(repos: list[tuple[str, str]]) -> str:
+    """Build one query with an aliased `repository` field per (owner, repo)."""
+    parts = []
+    for i, (owner, repo) in enumerate(repos):
+        parts.append(
+            f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)}) {{{REPO_FIELDS}}}"
+        )
+    return "query {\n" + "\n".join(parts) + "\n}"
+
+
+def parse_batch_response(repos: list[tuple[str, str]],
+                         payload: dict) -> dict[tuple[str, str], RepoSnapshot]:
+    """Turn a batch response into snapshots keyed by (owner, repo).
+
+    Repositories that GraphQL reports as NOT_FOUND become inaccessible
+    metadata; repositories missing for any other reason are left out so the
+    caller can fall back to REST for them.
+    """
+    data = payload.get('data') or {}
+    not_found = {
+        err['path'][0]
+        for err in payload.get('errors') or []
+        if err.get('type') == 'NOT_FOUND' and err.get('path')
+    }
+
+    snapshots: dict[tuple[str, str], RepoSnapshot] = {}
+    for i, (owner, repo) in enumerate(repos):
+        alias = f"r{i}"
+        node = data.get(alias)
+
+        if node is None:
+            if alias in not_found:
+                snapshots[(owner, repo)] = RepoSnapshot(RepoMetadata(
+                    owner=owner,
+                    repo_name=repo,
+                    is_accessible=False,
+                    error="Repository not found or is private",
+                ))
+            continue
+
+        snapshots[(owner, repo)] = _parse_repo_node(owner, repo, node)
+
+    return snapshots
+
+
+def _parse_repo_node(owner: str, repo: str, node: dict) -> RepoSnapshot:
+    """Map one `repository` node onto RepoMetadata plus languages and root entries."""
+    branch = node.get('defaultBranchRef') or {}
+    target = branch.get('target') or {}
+    primary = node.get('primaryLanguage') or {}
+    topics = [
+        t['topic']['name']
+        for t in (node.get('repositoryTopics') or {}).get('nodes', [])
+        if t.get('topic')
+    ]
+
+    metadata = RepoMetadata(
+        owner=owner,
+        repo_name=repo,
+        default_branch=branch.get('name', 'main'),
+        stars=node.get('stargazerCount', 0),
+        forks=node.get('forkCount', 0),
+        created_at=node.get('createdAt'),
+        pushed_at=node.get('pushedAt'),
+        language=primary.get('name'),
+        topics=topics,
+        has_readme=True,  # Will be checked later
+        has_license=node.get('licenseInfo') is not None,
+        head_sha=target.get('oid'),
+        size_kb=node.get('diskUsage') or 0,
+        commit_count=(target.get('history') or {}).get('totalCount'),
+        is_accessible=True,
+    )
+
+    languages = {
+        edge['node']['name']: edge['size']
+        for edge in (node.get('languages') or {}).get('edges', [])
+    }
+
+    # Match the REST contents API: type is "file" or "dir"
+    tree: Optional[dict] = node.get('object')
+    root_entries = [
+        {'name': entry['name'], 'type': 'dir' if entry['type'] == 'tree' else 'file'}
+        for entry in (tree or {}).get('entries', [])
+    ]
+
+    return RepoSnapshot(metadata, languages, root_entries)
@@ -0,0 +1,123 @@
+"""Rate-limit budgeting and adaptive concurrency for the GitHub client."""
+
+import asyncio
+import time
+from typing import Mapping, Optional
+
+from hackathon_judge.config import GITHUB_MAX_RATE_LIMIT_WAIT, GITHUB_PACING_THRESHOLD
+
+
+class GitHubRateLimitError(Exception):
+    """Raised when the rate limit cannot be satisfied within the allowed wait."""
+
+
+class RateLimitBudget:
+    """Track one X-RateLimit resource and pace requests to fit its reset window.
+
+    While more than GITHUB_PACING_THRESHOLD of the hourly limit is left,
+    requests go out unthrottled. Below that, requests are spaced evenly so
+    the remaining calls last until the window resets. The budget never hits
+    a 403: once nothing is left it waits for the reset instead.
+    """
+
+    def __init__(self, reserve: int = 0, pacing_threshold: float = GITHUB_PACING_THRESHOLD,
+                 max_wait: float = GITHUB_MAX_RATE_LIMIT_WAIT):
+        self.reserve = reserve
+        self.pacing_threshold = pacing_threshold
+        self.max_wait = max_wait
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset: Optional[float] = None
+        self._last_sent = 0.0
+        self._lock = asyncio.Lock()
+
+    def update(self, headers: Mapping[str, str]):
+        """Refresh the budget from a response's X-RateLimit-* headers."""
+        try:
+            limit = int(headers['X-RateLimit-Limit'])
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset = float(headers['X-RateLimit-Reset'])
+        except (KeyError, ValueError):
+            return
+
+        # Responses can arrive out of order; keep the most pessimistic view of the window
+        if self.reset is not None and reset == self.reset and self.remaining is not None:
+            remaining = min(remaining, self.remaining)
+        self.limit, self.remaining, self.reset = limit, remaining, reset
+
+    def exhaust(self, reset: Optional[float] = None):
+        """Mark the budget as used up, e.g. after an unexpected primary-limit 403."""
+        self.remaining = 0
+        if reset:
+            self.reset = reset
+
+    def delay(self, now: Optional[float] = None) -> float:
+        """Seconds to wait before the next request may be sent."""
+        now = now if now is not None else time.time()
+        if self.remaining is None or self.reset is None or now >= self.reset:
+            return 0.0
+
+        usable = self.remaining - self.reserve
+        window = self.reset - now
+        if usable <= 0:
+            return window + 1.0
+
+        if self.limit and self.remaining > self.limit * self.pacing_threshold:
+            return 0.0
+
+        interval = window / usable
+        return max(self._last_sent + interval - now, 0.0)
+
+    async def acquire(self):
+        """Wait for a slot in the budget and reserve it."""
+        async with self._lock:
+            wait = self.delay()
+            if wait > self.max_wait:
+                raise GitHubRateLimitError(
+                    f"GitHub rate limit exhausted; resets in {wait:.0f}s"
+                )
+            if wait > 0:
+                await asyncio.sleep(wait)
+                if self.reset is not None and time.time() >= self.reset:
+                    self.remaining = None
+            self._last_sent = time.time()
+            if self.remaining is not None:
+                self.remaining -= 1
+
+
+class AdaptiveConcurrency:
+    """Limit in-flight requests, adapting the limit to server feedback (AIMD).
+
+    Every `limit` consecutive successes raise the limit by one up to
+    `maximum`; a throttling signal (secondary rate limit, 429, 5xx) halves it
+    down to `minimum`.
+    """
+
+    def __init__(self, initial: int, minimum: int = 1, maximum: int = 32):
+        self.minimum = max(minimum, 1)
+        self.maximum = max(maximum, self.minimum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.in_flight = 0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc):
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def on_success(self):
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.maximum:
+            self.limit += 1
+            self._successes = 0
+
+    def on_throttle(self):
+        self.limit = max(self.minimum, self.limit // 2)
+        self._successes = 0
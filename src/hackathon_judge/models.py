@@ -40,6 +40,9 @@ class RepoMetadata:
     topics: list[str] = field(default_factory=list)
     has_readme: bool = False
     has_license: bool = False
+    head_sha: Optional[str] = None
+    size_kb: int = 0  # as reported by GitHub, 0 if unknown
+    commit_count: Optional[int] = None  # commits on the default branch, if known
     is_accessible: bool = True
     error: Optional[str] = None
 
@@ -48,7 +51,9 @@ class RepoMetadata:
 class AnalysisResult:
     """Result from repo analysis."""
     project_id: str
-    languages: list[str] = field(default_factory=list)
+    languages: list[str] = field(default_factory=list)  # largest share first
+    language_bytes: dict[str, int] = field(default_factory=dict)
+    language_shares: dict[str, float] = field(default_factory=dict)  # of code bytes, sums to ~1
     frameworks: list[str] = field(default_factory=list)
     architecture: str = "unknown"
     has_readme: bool = False
@@ -62,6 +67,8 @@ class AnalysisResult:
     code_quality_signals: dict = field(default_factory=dict)
     notable_findings: list[str] = field(default_factory=list)
     concerns: list[str] = field(default_factory=list)
+    files_skipped: int = 0  # files the analyzers were not allowed to read
+    skipped_files: list[dict] = field(default_factory=list)  # largest first: path, reason, bytes
     error: Optional[str] = None
 
 
@@ -77,6 +84,15 @@ class ForensicsResult:
     development_pattern: str = "unknown"  # organic|suspicious|likely_pre-existing
     lines_added_in_window: int = 0
     lines_before_window: int = 0
+    # From blame of HEAD: lines still present, and those last changed before the window
+    surviving_lines: int = 0
+    surviving_lines_before_window: int = 0
+    line_age_files_skipped: int = 0
+    # Cross-submission provenance, filled in once every submission is indexed
+    code_overlaps: list[dict] = field(default_factory=list)  # [{project_id, overlap}]
+    pre_window_code_share: float = 0.0  # share of code in another submission's pre-window history
+    pre_window_code_sources: list[str] = field(default_factory=list)
+    shared_history: list[dict] = field(default_factory=list)  # other submissions with common commits
     verdict: str = "UNKNOWN"  # VALID|QUESTIONABLE|INVALID|UNKNOWN
     confidence: float = 0.5
     notes: str = ""
@@ -150,3 +166,4 @@ class EvaluationRun:
     average_score: float = 0.0
     rankings: list[ScoredProject] = field(default_factory=list)
     skipped_projects: list[dict] = field(default_factory=list)
+    stats: dict = field(default_factory=dict)  # cache hit rates and other run statistics
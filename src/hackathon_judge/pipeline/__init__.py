@@ -0,0 +1,7 @@
+"""Pipeline module for running evaluations end to end."""
+
+from .runner import EvaluationPipeline, WorkItem
+from .checkpoint import CheckpointStore
+from .planner import Plan, StrategyPlanner
+
+__all__ = ["EvaluationPipeline", "WorkItem", "CheckpointStore", "Plan", "StrategyPlanner"]
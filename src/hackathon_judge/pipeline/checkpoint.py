@@ -0,0 +1,120 @@
+"""Crash-safe per-project checkpoint store."""
+
+import json
+import os
+import threading
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Any, Optional
+
+from hackathon_judge.models import (
+    Project, ProjectScores, ScoredProject, AnalysisResult,
+    ForensicsResult, X402Result, RepoMetadata
+)
+
+
+def _from_dict(cls, data: Optional[dict]):
+    """Build a dataclass from a dict, ignoring unknown keys."""
+    if data is None:
+        return None
+    names = {f.name for f in fields(cls)}
+    return cls(**{k: v for k, v in data.items() if k in names})
+
+
+def scored_project_from_dict(data: dict[str, Any]) -> ScoredProject:
+    """Rebuild a ScoredProject (and its nested results) from asdict() output."""
+    scored = _from_dict(ScoredProject, data)
+    scored.project = _from_dict(Project, data['project'])
+    scored.scores = _from_dict(ProjectScores, data['scores'])
+    scored.analysis = _from_dict(AnalysisResult, data.get('analysis'))
+    scored.forensics = _from_dict(ForensicsResult, data.get('forensics'))
+    scored.x402 = _from_dict(X402Result, data.get('x402'))
+    scored.metadata = _from_dict(RepoMetadata, data.get('metadata'))
+    return scored
+
+
+class CheckpointStore:
+    """Append-only JSONL store of finished projects.
+
+    Every record is written with a single O_APPEND write followed by fsync,
+    so a crash can at worst leave one truncated trailing line, which is
+    ignored on load. Records are keyed by project id and repo HEAD SHA;
+    later records for the same key win.
+    """
+
+    FILENAME = 'checkpoint.jsonl'
+
+    def __init__(self, output_dir: str | Path):
+        self.path = Path(output_dir) / self.FILENAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._records: dict[tuple[str, Optional[str]], dict] = {}
+        self._latest: dict[str, dict] = {}
+        self._load()
+
+    def _load(self):
+        """Read existing records, skipping any partially written line."""
+        if not self.path.exists():
+            return
+
+        with open(self.path, 'rb') as f:
+            data = f.read()
+
+        for line in data.splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            self._index(record)
+
+        # Terminate a torn trailing line so the next append starts cleanly
+        if data and not data.endswith(b'\n'):
+            with open(self.path, 'ab') as f:
+                f.write(b'\n')
+
+    def _index(self, record: dict):
+        key = (record['project_id'], record.get('head_sha'))
+        self._records[key] = record
+        self._latest[record['project_id']] = record
+
+    def __contains__(self, project_id: str) -> bool:
+        return project_id in self._latest
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+    def get(self, project_id: str, head_sha: Optional[str] = None,
+            any_sha: bool = False) -> Optional[ScoredProject]:
+        """Return the checkpointed result for a project.
+
+        With any_sha=True the most recent record is returned regardless of
+        the HEAD SHA it was produced from.
+        """
+        with self._lock:
+            if any_sha:
+                record = self._latest.get(project_id)
+            else:
+                record = self._records.get((project_id, head_sha))
+
+        if record is None:
+            return None
+        return scored_project_from_dict(record['scored'])
+
+    def append(self, scored: ScoredProject):
+        """Durably append a finished project."""
+        head_sha = scored.metadata.head_sha if scored.metadata else None
+        record = {
+            'project_id': scored.project.id,
+            'head_sha': head_sha,
+            'scored': asdict(scored),
+        }
+        line = (json.dumps(record, default=str) + '\n').encode('utf-8')
+
+        with self._lock:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self._index(record)
@@ -0,0 +1,74 @@
+"""Per-submission clone strategy planning from repository size."""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from hackathon_judge.config import (
+    CLONE_STRATEGY, PLAN_API_ONLY_KB, PLAN_FULL_CLONE_MAX_KB, PLAN_FULL_CLONE_MAX_COMMITS,
+    PLAN_MIN_CODE_SHARE,
+)
+from hackathon_judge.models import RepoMetadata
+from hackathon_judge.fetcher import GitHubAPI
+
+
+@dataclass
+class Plan:
+    """How one submission is fetched: 'api' (no clone) or a clone strategy."""
+    mode: str
+    reason: str
+    cost: int = 0  # estimated KB to transfer, used to order the queue
+
+    def as_dict(self) -> dict:
+        return {'mode': self.mode, 'reason': self.reason}
+
+
+class StrategyPlanner:
+    """Pick a fetch strategy per submission from its size, commits and languages.
+
+    - Repositories of PLAN_API_ONLY_KB or more are never cloned; their
+      tree is scanned through the API and forensics use the commits API.
+    - Small repositories with a short history, mostly made of code, get a
+      full clone: the whole history is cheap and gives exact line stats.
+    - Everything else gets a partial clone (history without the blobs
+      outside the sparse source paths).
+
+    Submissions of unknown size keep the default strategy. Languages are
+    only looked up for repositories small enough for a full clone; after
+    a GraphQL prefetch they cost no request.
+    """
+
+    def __init__(self, github_api: GitHubAPI, default: str = CLONE_STRATEGY):
+        self.api = github_api
+        self.default = default
+
+    def plan(self, metadata: Optional[RepoMetadata]) -> Plan:
+        if metadata is None or not metadata.size_kb:
+            return Plan(self.default, "repository size unknown")
+
+        size_kb = metadata.size_kb
+        size = _format_kb(size_kb)
+        if size_kb >= PLAN_API_ONLY_KB:
+            # Only the files the analyzers need are downloaded
+            return Plan('api', f"{size} repository; scanning the tree through the API",
+                        cost=PLAN_FULL_CLONE_MAX_KB)
+
+        commits = metadata.commit_count
+        if size_kb <= PLAN_FULL_CLONE_MAX_KB and commits is not None \
+                and commits <= PLAN_FULL_CLONE_MAX_COMMITS:
+            languages = self.api.get_languages(metadata.owner, metadata.repo_name)
+            code_share = sum(languages.values()) / (size_kb * 1024)
+            if code_share >= PLAN_MIN_CODE_SHARE:
+                return Plan('full', f"{size} repository with {commits} commits", cost=size_kb)
+            return Plan('partial', f"{size} repository, only {code_share:.0%} of it code",
+                        cost=size_kb)
+
+        detail = f"{commits} commits" if commits is not None else "unknown history"
+        return Plan('partial', f"{size} repository with {detail}", cost=size_kb)
+
+
+def _format_kb(size_kb: int) -> str:
+    if size_kb >= 1024 * 1024:
+        return f"{size_kb / (1024 * 1024):.1f} GB"
+    if size_kb >= 1024:
+        return f"{size_kb / 1024:.1f} MB"
+    return f"{size_kb} KB"
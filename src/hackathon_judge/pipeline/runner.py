@@ -0,0 +1,431 @@
+"""Staged, concurrent evaluation pipeline."""
+
+import queue
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from hackathon_judge.config import PIPELINE_JOBS, PIPELINE_CLONE_JOBS, PIPELINE_QUEUE_SIZE
+from hackathon_judge.models import (
+    Project, RepoMetadata, AnalysisResult, ForensicsResult, X402Result, ScoredProject
+)
+from hackathon_judge.fetcher import GitHubAPI, RepoCloner
+from hackathon_judge.fetcher.cloner import CloneRefresh
+from hackathon_judge.analyzer import (
+    RepoAnalyzer, GitForensics, X402Detector, RepoIndex, FactStore, ProvenanceIndex,
+    SharedHistoryIndex, VendoredFiles,
+)
+from hackathon_judge.analyzer.provenance import RepoFingerprints
+from hackathon_judge.analyzer.shared_history import RepoHistory
+from hackathon_judge.scoring import ScoringEngine
+from .checkpoint import CheckpointStore
+from .planner import Plan, StrategyPlanner
+
+
+# Sentinel passed down the queues once a stage has drained its input
+_DONE = object()
+
+
+@dataclass
+class WorkItem:
+    """A project moving through the pipeline stages."""
+    index: int
+    project: Project
+    metadata: Optional[RepoMetadata] = None
+    plan: Optional[Plan] = None
+    local_path: Optional[Path] = None
+    file_index: Optional[RepoIndex] = None
+    refresh: Optional[CloneRefresh] = None
+    fingerprints: Optional[RepoFingerprints] = None
+    history: Optional[RepoHistory] = None
+    analysis: Optional[AnalysisResult] = None
+    forensics: Optional[ForensicsResult] = None
+    x402: Optional[X402Result] = None
+    scored: Optional[ScoredProject] = None
+    error: Optional[str] = None
+    from_checkpoint: bool = False
+    reused: bool = False  # analysis results taken from the checkpoint (HEAD unchanged)
+    head_verified: Optional[bool] = None  # restored item's HEAD checked against GitHub
+
+
+class EvaluationPipeline:
+    """Evaluate projects through fetch -> clone -> analyze -> score stages.
+
+    Each stage runs its own pool of worker threads and hands items to the
+    next stage through a bounded queue, so network-bound work (metadata,
+    cloning) overlaps with CPU-bound analysis. Results are returned in input
+    order, which makes the output identical to a serial run.
+
+    When a checkpoint store is given, every finished project is appended to
+    it; with resume=True, projects already in the store are restored from it
+    without being cloned or analyzed. When the GraphQL prefetch can see
+    their current HEAD, projects that moved on since the checkpoint are
+    evaluated again; otherwise the restored result is marked unverified
+    in its flags. Projects whose HEAD SHA matches a
+    checkpointed result skip cloning (when the SHA is known from metadata)
+    and analysis, and are only re-scored; reanalyze=True disables this.
+    A shared FactStore caches per-file scan results across repositories.
+
+    With a ProvenanceIndex and/or SharedHistoryIndex, every finished
+    submission is added to them as it arrives, and once all are in, each
+    project's code overlap and shared commits with the others are recorded
+    in its forensics and flags.
+
+    With a StrategyPlanner, each submission is fetched with the strategy
+    planned from its size (API-only, partial or full clone), the queue is
+    ordered largest job first, and the plan is recorded in its flags.
+
+    With VendoredFiles, known third-party files are dropped from each
+    file index before analysis, and files found identical in many
+    submissions are learned as vendored once the run is over.
+    """
+
+    def __init__(self, github_api: GitHubAPI, cloner: Optional[RepoCloner],
+                 repo_analyzer: RepoAnalyzer, git_forensics: GitForensics,
+                 x402_detector: X402Detector, scoring_engine: ScoringEngine,
+                 api_only: bool = False, jobs: int = PIPELINE_JOBS,
+                 clone_jobs: int = PIPELINE_CLONE_JOBS,
+                 queue_size: int = PIPELINE_QUEUE_SIZE,
+                 checkpoint: Optional[CheckpointStore] = None,
+                 resume: bool = False, reanalyze: bool = False,
+                 facts: Optional[FactStore] = None,
+                 provenance: Optional[ProvenanceIndex] = None,
+                 history: Optional[SharedHistoryIndex] = None,
+                 planner: Optional[StrategyPlanner] = None,
+                 vendored: Optional[VendoredFiles] = None):
+        self.api = github_api
+        self.cloner = cloner
+        self.repo_analyzer = repo_analyzer
+        self.git_forensics = git_forensics
+        self.x402_detector = x402_detector
+        self.scoring_engine = scoring_engine
+        self.api_only = api_only
+        self.jobs = max(jobs, 1)
+        self.clone_jobs = max(clone_jobs, 1)
+        self.queue_size = max(queue_size, 1)
+        self.checkpoint = checkpoint
+        self.resume = resume
+        self.reanalyze = reanalyze
+        self.facts = facts
+        self.provenance = provenance
+        self.history = history
+        self.planner = planner
+        self.vendored = vendored
+
+    def run(self, projects: list[Project],
+            on_result: Optional[Callable[[WorkItem], None]] = None
+            ) -> tuple[list[ScoredProject], list[dict]]:
+        """Evaluate projects. Returns (scored projects, skipped projects) in input order."""
+        stages = [
+            (self._fetch_metadata, self.jobs),
+            (self._clone, self.clone_jobs),
+            (self._analyze, self.jobs),
+            (self._score, 1),
+        ]
+
+        # One bounded queue in front of every stage, unbounded results queue at the end
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in stages]
+        queues.append(queue.Queue())
+
+        threads = []
+        for i, (fn, workers) in enumerate(stages):
+            threads.extend(self._start_stage(fn, workers, queues[i], queues[i + 1]))
+
+        restored: list[WorkItem] = []
+        pending: list[WorkItem] = []
+        for i, project in enumerate(projects):
+            item = self._restore(i, project)
+            if item:
+                restored.append(item)
+            else:
+                pending.append(WorkItem(index=i, project=project))
+
+        # Batch the metadata stage's lookups into a few GraphQL requests;
+        # restored projects are included to check their HEAD is unchanged
+        prefetched = self.api.prefetch_metadata(
+            [item.project.github_url for item in restored + pending]
+        )
+
+        items: list[WorkItem] = []
+        for item in restored:
+            if self._verify_restored(item, prefetched.get(item.project.github_url)):
+                items.append(item)
+            else:
+                pending.append(WorkItem(index=item.index, project=item.project))
+
+        # Start the largest jobs first so they do not trail at the end of the run
+        if self.planner is not None:
+            for item in pending:
+                metadata = prefetched.get(item.project.github_url)
+                if metadata is not None and metadata.is_accessible:
+                    item.plan = self.planner.plan(metadata)
+            pending.sort(key=lambda it: it.plan.cost if it.plan else 0, reverse=True)
+
+        feeder = threading.Thread(
+            target=self._feed, args=(pending, queues[0]), daemon=True
+        )
+        feeder.start()
+
+        for item in items:
+            self._index_submission(item)
+            if on_result:
+                on_result(item)
+
+        while True:
+            item = queues[-1].get()
+            if item is _DONE:
+                break
+            if self.checkpoint is not None and item.error is None and not item.from_checkpoint:
+                self.checkpoint.append(item.scored)
+            self._index_submission(item)
+            items.append(item)
+            if on_result:
+                on_result(item)
+
+        feeder.join()
+        for thread in threads:
+            thread.join()
+
+        items.sort(key=lambda it: it.index)
+        self._apply_indexes(items)
+        if self.vendored is not None:
+            self.vendored.learn()
+        scored = [it.scored for it in items if it.error is None]
+        skipped = [
+            {
+                "name": it.project.name,
+                "url": it.project.github_url,
+                "reason": it.error,
+            }
+            for it in items if it.error is not None
+        ]
+        return scored, skipped
+
+    def _restore(self, index: int, project: Project) -> Optional[WorkItem]:
+        """Rebuild a finished work item from the checkpoint when resuming."""
+        if not self.resume or self.checkpoint is None:
+            return None
+
+        scored = self.checkpoint.get(project.id, any_sha=True)
+        if scored is None:
+            return None
+
+        return WorkItem(
+            index=index,
+            project=project,
+            metadata=scored.metadata,
+            analysis=scored.analysis,
+            forensics=scored.forensics,
+            x402=scored.x402,
+            scored=scored,
+            from_checkpoint=True,
+        )
+
+    def _verify_restored(self, item: WorkItem, metadata: Optional[RepoMetadata]) -> bool:
+        """Check a restored item's HEAD against prefetched metadata.
+
+        Returns False when the repository's HEAD differs from the
+        checkpointed one, so the project is evaluated again. When the
+        current HEAD is unknown (no token, lookup failed, repository gone)
+        the restored result is kept and flagged as unverified.
+        """
+        checkpointed = item.metadata.head_sha if item.metadata else None
+        current = metadata.head_sha if metadata is not None and metadata.is_accessible else None
+        if current and current != checkpointed:
+            return False
+
+        item.head_verified = current is not None
+        item.scored.flags['restored'] = {'head_sha': checkpointed, 'verified': item.head_verified}
+        return True
+
+    def _reuse(self, item: WorkItem, head_sha: Optional[str]) -> bool:
+        """Take analysis results from the checkpoint if HEAD is unchanged."""
+        if self.reanalyze or self.checkpoint is None or not head_sha:
+            return False
+
+        cached = self.checkpoint.get(item.project.id, head_sha)
+        if cached is None:
+            return False
+
+        item.analysis = cached.analysis
+        item.forensics = cached.forensics
+        item.x402 = cached.x402
+        item.scored = cached
+        item.reused = True
+        return True
+
+    def _index_submission(self, item: WorkItem):
+        """Add a finished submission to the cross-submission indexes.
+
+        When analysis was skipped (unchanged HEAD or resume), the
+        fingerprints and history stored under its HEAD SHA are used.
+        """
+        if item.error is not None:
+            return
+        head_sha = item.metadata.head_sha if item.metadata else None
+        if self.provenance is not None:
+            self.provenance.add(item.project.id, item.fingerprints or self.provenance.lookup(head_sha))
+        if self.history is not None:
+            self.history.add(item.project.id, item.history or self.history.lookup(head_sha))
+        item.fingerprints = None
+        item.history = None
+
+    def _apply_indexes(self, items: list[WorkItem]):
+        """Record cross-submission overlap once every submission is indexed."""
+        for item in items:
+            if item.error is not None:
+                continue
+            project_id = item.project.id
+            if self.provenance is not None and project_id in self.provenance:
+                self.scoring_engine.apply_provenance(item.scored, self.provenance.report(project_id))
+            if self.history is not None and project_id in self.history:
+                self.scoring_engine.apply_shared_history(item.scored, self.history.report(project_id))
+
+    def _feed(self, items: list[WorkItem], inbox: queue.Queue):
+        """Push work items into the first stage."""
+        for item in items:
+            inbox.put(item)
+        inbox.put(_DONE)
+
+    def _start_stage(self, fn: Callable[[WorkItem], None], workers: int,
+                     inbox: queue.Queue, outbox: queue.Queue) -> list[threading.Thread]:
+        """Start worker threads for a stage."""
+        remaining = [workers]
+        lock = threading.Lock()
+
+        def worker():
+            while True:
+                item = inbox.get()
+                if item is _DONE:
+                    # Let sibling workers see the sentinel too
+                    inbox.put(_DONE)
+                    break
+
+                if item.error is None:
+                    try:
+                        fn(item)
+                    except Exception as e:
+                        item.error = str(e)
+
+                outbox.put(item)
+
+            # The last worker to finish closes the downstream queue
+            with lock:
+                remaining[0] -= 1
+                if remaining[0] == 0:
+                    outbox.put(_DONE)
+
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def _fetch_metadata(self, item: WorkItem):
+        """Stage 1: fetch repository metadata."""
+        metadata = self.api.get_repo_metadata(item.project.github_url)
+
+        if not metadata.is_accessible:
+            raise ValueError(f"Repository not accessible: {metadata.error}")
+
+        item.metadata = metadata
+        if self.planner is not None and item.plan is None:
+            item.plan = self.planner.plan(metadata)
+
+    def _clone(self, item: WorkItem):
+        """Stage 2: clone the repository and index its files.
+
+        In API-only mode, when the plan says so, or when the clone fails,
+        the index is built from one recursive Git Trees API call instead.
+        """
+        if self._reuse(item, item.metadata.head_sha):
+            return
+
+        mode = item.plan.mode if item.plan else None
+        if self.cloner and not self.api_only and mode != 'api':
+            local_path, error = self.cloner.clone(
+                item.project.github_url, expected_sha=item.metadata.head_sha, strategy=mode
+            )
+            if not error:
+                try:
+                    item.metadata.head_sha = self.cloner.get_head_sha(local_path)
+                    item.local_path = local_path
+                    item.refresh = self.cloner.refreshes.get(local_path)
+                    if self._reuse(item, item.metadata.head_sha):
+                        return
+                    # Walk the clone once and share the file index between analyzers
+                    item.file_index = RepoIndex.open(local_path, self.facts, self.cloner.checkout)
+                except Exception:
+                    # The analyze stage, which normally releases the lease, is skipped
+                    item.local_path = None
+                    self.cloner.release(local_path)
+                    raise
+                return
+
+        metadata = item.metadata
+        ref = metadata.head_sha or metadata.default_branch
+        item.file_index = RepoIndex.from_github(
+            self.api, metadata.owner, metadata.repo_name, ref, facts=self.facts
+        )
+
+    def _analyze(self, item: WorkItem):
+        """Stage 3: run the analyzers."""
+        project = item.project
+        index = item.file_index
+
+        try:
+            if item.reused:
+                return
+            if self.vendored is not None and index is not None:
+                excluded = index.exclude_vendored(self.vendored)
+                self.vendored.record_excluded(len(excluded))
+                self.vendored.observe(project.id, index.files)
+            item.analysis = self.repo_analyzer.analyze(
+                project.id, project.github_url, item.metadata, item.local_path, index
+            )
+            timeline = None
+            if self.history is not None and item.local_path:
+                try:
+                    timeline = self.git_forensics.read_timeline(item.local_path)
+                    item.history = self.history.record(timeline, item.metadata.head_sha)
+                except Exception:
+                    pass  # forensics reports the read error itself
+            item.forensics = self.git_forensics.analyze(
+                project.id, project.github_url, item.local_path, timeline
+            )
+            item.x402 = self.x402_detector.analyze(project.id, project, item.local_path, index)
+            if self.provenance is not None and index is not None:
+                item.fingerprints = self.provenance.fingerprint(
+                    index, item.local_path, item.metadata.head_sha
+                )
+            if index is not None:
+                item.analysis.files_skipped = index.budget.skipped_count
+                item.analysis.skipped_files = index.budget.report()
+        finally:
+            # Keep per-file facts for the next run, drop the index (and any
+            # downloaded file contents) and let the clone be evicted
+            if index is not None:
+                index.save_facts()
+                index.close()
+            item.file_index = None
+            if item.local_path:
+                self.cloner.release(item.local_path)
+
+    def _score(self, item: WorkItem):
+        """Stage 4: score the project."""
+        scored = self.scoring_engine.score_project(
+            item.project, item.analysis, item.forensics, item.x402
+        )
+        scored.metadata = item.metadata
+        if item.plan is not None:
+            scored.flags['plan'] = item.plan.as_dict()
+        if item.refresh is not None and item.refresh.action == 'stale':
+            # The fetch failed: analyzed at the cached HEAD, behind the remote
+            scored.flags['stale_clone'] = item.refresh.new_sha
+        if item.refresh is not None and item.refresh.prefetch_error:
+            # History blobs are fetched lazily instead: slower, but complete
+            scored.flags['blob_prefetch_error'] = item.refresh.prefetch_error
+        # Unchanged repo with unchanged scores: nothing new to checkpoint
+        if item.reused and scored.scores == item.scored.scores:
+            item.from_checkpoint = True
+        item.scored = scored
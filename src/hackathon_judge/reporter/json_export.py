@@ -29,7 +29,8 @@ class JSONExporter:
                 "total_projects": run.total_projects,
                 "evaluated": run.evaluated,
                 "skipped": run.skipped,
-                "average_score": round(run.average_score, 2)
+                "average_score": round(run.average_score, 2),
+                "run_stats": run.stats
             },
             "rankings": [self._serialize_scored_project(p) for p in run.rankings],
             "skipped_projects": run.skipped_projects,
@@ -76,6 +77,7 @@ class JSONExporter:
         if scored.analysis:
             data["analysis"] = {
                 "languages": scored.analysis.languages,
+                "language_shares": scored.analysis.language_shares,
                 "frameworks": scored.analysis.frameworks,
                 "architecture": scored.analysis.architecture,
                 "has_readme": scored.analysis.has_readme,
@@ -85,6 +87,7 @@ class JSONExporter:
                 "has_demo": scored.analysis.has_demo,
                 "has_deployment": scored.analysis.has_deployment_config,
                 "deployment_target": scored.analysis.deployment_target,
+                "concerns": scored.analysis.concerns,
             }
 
         # Add forensics details if available
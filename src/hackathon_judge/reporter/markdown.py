@@ -103,7 +103,8 @@ class MarkdownReporter:
             output.append("")
 
         # Flagged projects
-        flagged = [p for p in run.rankings if any(p.flags.values())]
+        # Only boolean flags raise an issue; others (like the fetch plan) are informational
+        flagged = [p for p in run.rankings if any(v is True for v in p.flags.values())]
         if flagged:
             output.append("## Flagged for Review")
             output.append("")
@@ -115,6 +116,10 @@ class MarkdownReporter:
                     issues.append("Timeline concerns")
                 if p.flags.get('missing_x402'):
                     issues.append("Missing X402")
+                if p.flags.get('potential_plagiarism'):
+                    issues.append("Code found in other submissions")
+                if p.flags.get('shared_history'):
+                    issues.append("Git history shared with other submissions")
                 output.append(f"| {p.project.name} | {', '.join(issues)} |")
             output.append("")
 
@@ -152,6 +157,10 @@ class MarkdownReporter:
         if scored.analysis:
             techs = ', '.join(scored.analysis.languages + scored.analysis.frameworks)
             output.append(f"- **Technologies**: {techs or 'Not detected'}")
+            if scored.analysis.language_shares:
+                shares = ', '.join(f"{language} {share:.0%}" for language, share
+                                   in scored.analysis.language_shares.items())
+                output.append(f"- **Code by language**: {shares}")
 
         output.append(f"- **Evaluated**: {datetime.now().isoformat()}")
         output.append("")
@@ -216,8 +225,23 @@ class MarkdownReporter:
 
         output.append(f"- Timeline Compliance: {timeline}")
         output.append(f"- X402 Usage: {x402_status}")
+        if scored.analysis:
+            for concern in scored.analysis.concerns:
+                output.append(f"- Analysis: {concern}")
         output.append("")
 
+        # Files left out by the content budget
+        if scored.analysis and scored.analysis.files_skipped:
+            output.append("## Files Not Read")
+            output.append(f"{scored.analysis.files_skipped} files were not analyzed "
+                          f"(largest {len(scored.analysis.skipped_files)} listed).")
+            output.append("")
+            output.append("| File | Reason | Size |")
+            output.append("|------|--------|------|")
+            for skipped in scored.analysis.skipped_files:
+                output.append(f"| {skipped['path']} | {skipped['reason']} | {skipped['bytes']:,} B |")
+            output.append("")
+
         output.append("---")
         output.append("*Generated by Hackathon Judge System*")
 
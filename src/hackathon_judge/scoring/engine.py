@@ -1,7 +1,9 @@
 """Scoring engine for hackathon evaluation."""
 
 from typing import Optional
-from hackathon_judge.config import WEIGHTS, ScoringWeights
+from hackathon_judge.config import (
+    WEIGHTS, ScoringWeights, PROVENANCE_PLAGIARISM_SHARE, LANGUAGE_MIN_SHARE,
+)
 from hackathon_judge.models import (
     Project, AnalysisResult, ForensicsResult, X402Result,
     ProjectScores, ScoredProject
@@ -157,9 +159,15 @@ class ScoringEngine:
         if analysis and analysis.has_deployment_config:
             score += 1.5
 
-        # Multiple languages/frameworks (indicates full-stack)
+        # Multiple languages/frameworks (indicates full-stack); languages
+        # with a token share of the code (a config script) do not count
         if analysis:
-            if len(analysis.languages) >= 2:
+            if analysis.language_shares:
+                languages = [language for language, share in analysis.language_shares.items()
+                             if share >= LANGUAGE_MIN_SHARE]
+            else:
+                languages = analysis.languages
+            if len(languages) >= 2:
                 score += 1.0
             if len(analysis.frameworks) >= 2:
                 score += 1.0
@@ -291,11 +299,28 @@ class ScoringEngine:
 
         return feedback[:4]  # Limit to top 4
 
+    def apply_provenance(self, scored: ScoredProject, report: dict):
+        """Record a ProvenanceIndex report on a scored project and update its flags."""
+        if scored.forensics is None:
+            scored.forensics = ForensicsResult(project_id=scored.project.id)
+        scored.forensics.code_overlaps = report['code_overlaps']
+        scored.forensics.pre_window_code_share = report['pre_window_code_share']
+        scored.forensics.pre_window_code_sources = report['pre_window_code_sources']
+        scored.flags.update(self._generate_flags(scored))
+
+    def apply_shared_history(self, scored: ScoredProject, report: list[dict]):
+        """Record a SharedHistoryIndex report on a scored project and update its flags."""
+        if scored.forensics is None:
+            scored.forensics = ForensicsResult(project_id=scored.project.id)
+        scored.forensics.shared_history = report
+        scored.flags.update(self._generate_flags(scored))
+
     def _generate_flags(self, scored: ScoredProject) -> dict:
         """Generate flags for special conditions."""
         flags = {
             'timeline_issues': False,
             'potential_plagiarism': False,
+            'shared_history': False,
             'exceptional_quality': False,
             'missing_x402': False,
         }
@@ -304,6 +329,11 @@ class ScoringEngine:
         if scored.forensics:
             if scored.forensics.verdict in ['QUESTIONABLE', 'INVALID']:
                 flags['timeline_issues'] = True
+            if (scored.forensics.code_overlaps or
+                    scored.forensics.pre_window_code_share >= PROVENANCE_PLAGIARISM_SHARE):
+                flags['potential_plagiarism'] = True
+            if scored.forensics.shared_history:
+                flags['shared_history'] = True
 
         # Check X402
         if scored.x402 and not scored.x402.uses_x402:
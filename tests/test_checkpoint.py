@@ -0,0 +1,128 @@
+"""Checkpoint store and resuming a run from it."""
+
+import json
+from dataclasses import replace
+
+from hackathon_judge.models import (
+    AnalysisResult, ForensicsResult, Project, ProjectScores, RepoMetadata, ScoredProject,
+    X402Result,
+)
+from hackathon_judge.pipeline import CheckpointStore, EvaluationPipeline
+
+
+def _scored(project_id: str, head_sha: str, total: float = 1.0) -> ScoredProject:
+    project = Project(id=project_id, name=project_id, github_url=f"https://github.com/team/{project_id}")
+    return ScoredProject(
+        project=project,
+        scores=ProjectScores(),
+        weighted_total=total,
+        metadata=RepoMetadata(owner='team', repo_name=project_id, head_sha=head_sha),
+    )
+
+
+def test_torn_final_line_is_skipped(tmp_path):
+    store = CheckpointStore(tmp_path)
+    store.append(_scored('p1', 'a'))
+    store.append(_scored('p2', 'b'))
+    with open(store.path, 'ab') as f:
+        f.write(json.dumps({'project_id': 'p3', 'head_sha': 'c'}).encode()[:20])
+
+    reloaded = CheckpointStore(tmp_path)
+    assert 'p1' in reloaded and 'p2' in reloaded and 'p3' not in reloaded
+
+    # The next record starts on its own line and survives another reload
+    reloaded.append(_scored('p3', 'c'))
+    assert CheckpointStore(tmp_path).get('p3', 'c') is not None
+
+
+def test_records_are_keyed_by_project_and_head(tmp_path):
+    store = CheckpointStore(tmp_path)
+    store.append(_scored('p1', 'a', total=1.0))
+    store.append(_scored('p1', 'b', total=2.0))
+
+    reloaded = CheckpointStore(tmp_path)
+    assert reloaded.get('p1', 'a').weighted_total == 1.0
+    assert reloaded.get('p1', 'b').weighted_total == 2.0
+    assert reloaded.get('p1', 'c') is None
+    assert reloaded.get('p1', any_sha=True).weighted_total == 2.0
+    assert reloaded.get('p1', 'b').metadata.head_sha == 'b'
+    assert len(reloaded) == 1
+
+
+class _Api:
+    """GitHub client stand-in reporting one HEAD per repository."""
+
+    def __init__(self, heads: dict[str, str]):
+        self.heads = heads
+        self.metadata_calls = []
+
+    def _metadata(self, url: str) -> RepoMetadata:
+        return RepoMetadata(owner='team', repo_name=url.rsplit('/', 1)[-1], head_sha=self.heads[url])
+
+    def prefetch_metadata(self, urls):
+        return {url: self._metadata(url) for url in urls if url in self.heads}
+
+    def get_repo_metadata(self, url):
+        self.metadata_calls.append(url)
+        return self._metadata(url)
+
+    def get_tree(self, owner, repo, ref):
+        return {'tree': [{'path': 'app.py', 'type': 'blob', 'size': 10, 'sha': ref}]}
+
+
+class _Analyzer:
+    def analyze(self, project_id, *args):
+        return AnalysisResult(project_id=project_id)
+
+
+class _Forensics:
+    def analyze(self, project_id, *args):
+        return ForensicsResult(project_id=project_id)
+
+
+class _X402:
+    def analyze(self, project_id, *args):
+        return X402Result(project_id=project_id)
+
+
+class _Scoring:
+    def score_project(self, project, analysis, forensics, x402):
+        return ScoredProject(project=project, scores=ProjectScores(), weighted_total=5.0)
+
+
+def _resume(tmp_path, api) -> EvaluationPipeline:
+    return EvaluationPipeline(
+        api, None, _Analyzer(), _Forensics(), _X402(), _Scoring(), api_only=True,
+        checkpoint=CheckpointStore(tmp_path), resume=True,
+    )
+
+
+def test_resume_reruns_projects_whose_head_moved(tmp_path):
+    store = CheckpointStore(tmp_path)
+    kept, moved = _scored('kept', 'old-kept'), _scored('moved', 'old-moved')
+    store.append(kept)
+    store.append(moved)
+
+    api = _Api({kept.project.github_url: 'old-kept', moved.project.github_url: 'new-moved'})
+    scored, skipped = _resume(tmp_path, api).run([kept.project, moved.project])
+
+    assert skipped == []
+    restored, rerun = scored
+    assert restored.weighted_total == 1.0
+    assert restored.flags['restored'] == {'head_sha': 'old-kept', 'verified': True}
+    assert rerun.weighted_total == 5.0
+    assert rerun.metadata.head_sha == 'new-moved'
+    assert api.metadata_calls == [moved.project.github_url]
+    assert CheckpointStore(tmp_path).get('moved', 'new-moved') is not None
+
+
+def test_resume_without_prefetch_marks_restored_heads_unverified(tmp_path):
+    store = CheckpointStore(tmp_path)
+    store.append(_scored('p1', 'a'))
+
+    api = _Api({})
+    project = replace(store.get('p1', 'a').project)
+    (scored,), _ = _resume(tmp_path, api).run([project])
+
+    assert scored.flags['restored'] == {'head_sha': 'a', 'verified': False}
+    assert api.metadata_calls == []
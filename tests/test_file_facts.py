@@ -0,0 +1,34 @@
+"""Fact cache lookups and hit-rate accounting."""
+
+from hackathon_judge.analyzer.file_facts import MISSING, FactStore
+from hackathon_judge.analyzer.repo_index import FileEntry, RepoIndex
+
+
+class _Source:
+    def __init__(self, files: dict[str, str]):
+        self.files = files
+
+    def read_bytes(self, rel_path: str) -> bytes:
+        return self.files[rel_path].encode()
+
+    def close(self):
+        pass
+
+
+def test_uncounted_get_leaves_hit_rate_alone():
+    facts = FactStore(persist=False)
+    facts.put('sha', 'kind', 1)
+    assert facts.get('sha', 'other', count=False) is MISSING
+    assert facts.get('sha', 'kind', count=False) == 1
+    assert facts.stats()['hits'] == facts.stats()['misses'] == 0
+
+
+def test_fact_counts_only_the_callers_kind():
+    facts = FactStore(persist=False)
+    files = [FileEntry(path='app.py', ext='.py', size=20, blob_sha='sha')]
+    index = RepoIndex(files, set(), _Source({'app.py': 'print("hello")\n'}), facts)
+
+    assert index.fact('app.py', 'length', len) == 15
+    assert index.fact('app.py', 'length', len) == 15
+    stats = facts.stats()
+    assert (stats['hits'], stats['misses']) == (1, 1)
@@ -0,0 +1,215 @@
+"""Batched GraphQL metadata: query building, response parsing and prefetching."""
+
+import asyncio
+import json
+import re
+
+import requests
+
+from hackathon_judge.config import GITHUB_API_BASE, GITHUB_GRAPHQL_URL
+from hackathon_judge.fetcher.github_api import AsyncGitHubAPI
+from hackathon_judge.fetcher.graphql import build_batch_query, parse_batch_response
+
+
+REPOS = [('alice', 'pay-app'), ('bob', 'gone'), ('carol', 'flaky')]
+
+FOUND_NODE = {
+    'defaultBranchRef': {
+        'name': 'main',
+        'target': {'oid': 'a' * 40, 'history': {'totalCount': 42}},
+    },
+    'diskUsage': 1234,
+    'stargazerCount': 7,
+    'forkCount': 2,
+    'createdAt': '2025-01-01T00:00:00Z',
+    'pushedAt': '2025-01-03T00:00:00Z',
+    'primaryLanguage': {'name': 'TypeScript'},
+    'repositoryTopics': {'nodes': [{'topic': {'name': 'x402'}}]},
+    'licenseInfo': {'key': 'mit'},
+    'languages': {'edges': [
+        {'size': 9000, 'node': {'name': 'TypeScript'}},
+        {'size': 100, 'node': {'name': 'CSS'}},
+    ]},
+    'object': {'entries': [
+        {'name': 'src', 'type': 'tree'},
+        {'name': 'README.md', 'type': 'blob'},
+        {'name': 'lib', 'type': 'commit'},
+    ]},
+}
+
+PAYLOAD = {
+    # r2 is missing without an error, e.g. a partial response
+    'data': {'r0': FOUND_NODE, 'r1': None},
+    'errors': [{
+        'type': 'NOT_FOUND',
+        'path': ['r1'],
+        'message': "Could not resolve to a Repository with the name 'bob/gone'.",
+    }],
+}
+
+
+def test_build_batch_query_aliases_every_repo():
+    query = build_batch_query(REPOS)
+    assert query.startswith('query {')
+    assert 'r0: repository(owner: "alice", name: "pay-app")' in query
+    assert 'r1: repository(owner: "bob", name: "gone")' in query
+    assert 'r2: repository(owner: "carol", name: "flaky")' in query
+
+
+def test_parse_found_repo():
+    snapshot = parse_batch_response(REPOS, PAYLOAD)[('alice', 'pay-app')]
+    metadata = snapshot.metadata
+    assert metadata.is_accessible
+    assert metadata.default_branch == 'main'
+    assert metadata.head_sha == 'a' * 40
+    assert metadata.commit_count == 42
+    assert metadata.size_kb == 1234
+    assert metadata.stars == 7
+    assert metadata.language == 'TypeScript'
+    assert metadata.topics == ['x402']
+    assert metadata.has_license
+    assert snapshot.languages == {'TypeScript': 9000, 'CSS': 100}
+
+
+def test_parse_maps_tree_entries_to_rest_types():
+    snapshot = parse_batch_response(REPOS, PAYLOAD)[('alice', 'pay-app')]
+    assert snapshot.root_entries == [
+        {'name': 'src', 'type': 'dir'},
+        {'name': 'README.md', 'type': 'file'},
+        {'name': 'lib', 'type': 'file'},
+    ]
+
+
+def test_parse_not_found_repo_is_inaccessible():
+    snapshot = parse_batch_response(REPOS, PAYLOAD)[('bob', 'gone')]
+    assert not snapshot.metadata.is_accessible
+    assert snapshot.metadata.error
+    assert snapshot.languages == {}
+    assert snapshot.root_entries == []
+
+
+def test_parse_leaves_out_missing_alias():
+    snapshots = parse_batch_response(REPOS, PAYLOAD)
+    assert ('carol', 'flaky') not in snapshots
+    assert set(snapshots) == {('alice', 'pay-app'), ('bob', 'gone')}
+
+
+class _StubSession:
+    """Stands in for requests.Session: answers GraphQL batches and REST calls
+    from recorded payloads, and records every request."""
+
+    def __init__(self, nodes: dict, rest: dict, missing: frozenset = frozenset(),
+                 failing_batches: int = 0):
+        self.nodes = nodes  # (owner, repo) -> repository node; absent repos are NOT_FOUND
+        self.rest = rest  # URL -> JSON body
+        self.missing = missing  # repos whose alias the server drops without an error
+        self.failing_batches = failing_batches
+        self.headers = {}
+        self.calls = []
+
+    def request(self, method, url, timeout=None, **kwargs):
+        self.calls.append((method, url))
+        if url == GITHUB_GRAPHQL_URL:
+            if self.failing_batches:
+                self.failing_batches -= 1
+                return _response(400, {'message': 'Problems parsing JSON'})
+            return _response(200, self._graphql(kwargs['json']['query']))
+        if url in self.rest:
+            return _response(200, self.rest[url])
+        return _response(404, {'message': 'Not Found'})
+
+    def _graphql(self, query: str) -> dict:
+        data, errors = {}, []
+        for alias, owner, repo in re.findall(r'(r\d+): repository\(owner: "([^"]+)", name: "([^"]+)"\)', query):
+            if (owner, repo) in self.missing:
+                continue
+            node = self.nodes.get((owner, repo))
+            data[alias] = node
+            if node is None:
+                errors.append({'type': 'NOT_FOUND', 'path': [alias]})
+        return {'data': data, 'errors': errors} if errors else {'data': data}
+
+
+def _response(status: int, body: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body).encode()
+    response.encoding = 'utf-8'
+    return response
+
+
+def _client(session: _StubSession, token='token') -> AsyncGitHubAPI:
+    api = AsyncGitHubAPI(token=token, use_cache=False)
+    api.session = session
+    return api
+
+
+def _url(owner: str, repo: str) -> str:
+    return f"https://github.com/{owner}/{repo}"
+
+
+def _graphql_calls(session: _StubSession) -> int:
+    return sum(1 for _, url in session.calls if url == GITHUB_GRAPHQL_URL)
+
+
+def test_prefetch_batches_repositories():
+    repos = [('team', f'app{i}') for i in range(5)]
+    session = _StubSession({repo: FOUND_NODE for repo in repos}, {})
+    api = _client(session)
+
+    metadata = asyncio.run(api.prefetch_metadata([_url(*r) for r in repos], batch_size=2))
+
+    assert _graphql_calls(session) == 3
+    assert set(metadata) == {_url(*r) for r in repos}
+    assert all(m.head_sha == 'a' * 40 for m in metadata.values())
+
+    # Later per-repo calls are served from the prefetch
+    languages = asyncio.run(api.get_languages('team', 'app3'))
+    assert languages == {'TypeScript': 9000, 'CSS': 100}
+    assert len(session.calls) == 3
+
+
+def test_prefetch_falls_back_to_rest_per_alias():
+    rest_url = f"{GITHUB_API_BASE}/repos/carol/flaky"
+    session = _StubSession(
+        {('alice', 'pay-app'): FOUND_NODE, ('carol', 'flaky'): FOUND_NODE},
+        {rest_url: {'default_branch': 'dev', 'stargazers_count': 3, 'size': 10}},
+        missing=frozenset({('carol', 'flaky')}),
+    )
+    api = _client(session)
+    urls = [_url('alice', 'pay-app'), _url('bob', 'gone'), _url('carol', 'flaky')]
+
+    metadata = asyncio.run(api.prefetch_metadata(urls))
+    assert metadata[urls[0]].is_accessible
+    assert not metadata[urls[1]].is_accessible
+    assert urls[2] not in metadata
+
+    async def lookup_all():
+        return [await api.get_repo_metadata(url) for url in urls]
+
+    found, gone, flaky = asyncio.run(lookup_all())
+    # Only the repository missing from the batch answer costs a REST call
+    assert session.calls[1:] == [('GET', rest_url)]
+    assert found.head_sha == 'a' * 40
+    assert not gone.is_accessible
+    assert flaky.default_branch == 'dev' and flaky.stars == 3
+
+
+def test_failed_batch_leaves_its_repositories_to_rest():
+    repos = [('team', f'app{i}') for i in range(4)]
+    session = _StubSession({repo: FOUND_NODE for repo in repos}, {}, failing_batches=1)
+    api = _client(session)
+
+    metadata = asyncio.run(api.prefetch_metadata([_url(*r) for r in repos], batch_size=2))
+
+    assert _graphql_calls(session) == 2
+    assert len(metadata) == 2
+
+
+def test_prefetch_without_token_sends_nothing(monkeypatch):
+    monkeypatch.delenv('GITHUB_TOKEN', raising=False)
+    session = _StubSession({('alice', 'pay-app'): FOUND_NODE}, {})
+    api = _client(session, token=None)
+
+    assert asyncio.run(api.prefetch_metadata([_url('alice', 'pay-app')])) == {}
+    assert session.calls == []
@@ -0,0 +1,24 @@
+"""gitattributes pattern matching for language statistics."""
+
+import pytest
+
+from hackathon_judge.analyzer.languages import _attribute_match
+
+
+@pytest.mark.parametrize('path, pattern, expected', [
+    ('docs/a.md', 'docs/*.md', True),
+    ('docs/a/b/c.md', 'docs/*.md', False),
+    ('docs/a/b/c.md', 'docs/**', True),
+    ('docs/a/b/c.md', 'docs/**/*.md', True),
+    ('docs/c.md', 'docs/**/*.md', True),
+    ('src/gen/x.ts', '**/gen/*.ts', True),
+    ('gen/x.ts', '**/gen/*.ts', True),
+    ('gen/sub/x.ts', '**/gen/*.ts', False),
+    ('lib/a.js', '/lib/?.js', True),
+    ('lib/ab.js', 'lib/[ab].js', False),
+    ('lib/b.js', 'lib/[!a].js', True),
+    ('deep/dir/bundle.min.js', '*.min.js', True),
+    ('vendor/x.js', 'vendor/', False),
+])
+def test_attribute_match(path, pattern, expected):
+    assert _attribute_match(path, pattern) is expected
@@ -0,0 +1,63 @@
+"""Clone strategy planning from repository size and history."""
+
+import pytest
+
+from hackathon_judge.config import (
+    PLAN_API_ONLY_KB, PLAN_FULL_CLONE_MAX_COMMITS, PLAN_FULL_CLONE_MAX_KB, PLAN_MIN_CODE_SHARE,
+)
+from hackathon_judge.models import RepoMetadata
+from hackathon_judge.pipeline import StrategyPlanner
+
+
+class _Api:
+    """Reports code bytes as a fixed share of the repository size."""
+
+    def __init__(self, code_share: float, size_kb: int = 0):
+        self.code_share = code_share
+        self.size_kb = size_kb
+        self.calls = 0
+
+    def get_languages(self, owner, repo):
+        self.calls += 1
+        return {'TypeScript': int(self.size_kb * 1024 * self.code_share)}
+
+
+def _plan(size_kb: int, commits, code_share: float = 1.0):
+    api = _Api(code_share, size_kb)
+    metadata = RepoMetadata(owner='team', repo_name='app', size_kb=size_kb, commit_count=commits)
+    return StrategyPlanner(api, default='window').plan(metadata), api
+
+
+@pytest.mark.parametrize('size_kb, commits, code_share, mode', [
+    (0, 10, 1.0, 'window'),  # size unknown: the default strategy
+    (PLAN_API_ONLY_KB, 10, 1.0, 'api'),
+    (PLAN_API_ONLY_KB - 1, 10, 1.0, 'partial'),
+    (PLAN_FULL_CLONE_MAX_KB, PLAN_FULL_CLONE_MAX_COMMITS, 1.0, 'full'),
+    (PLAN_FULL_CLONE_MAX_KB + 1, 10, 1.0, 'partial'),
+    (100, PLAN_FULL_CLONE_MAX_COMMITS + 1, 1.0, 'partial'),
+    (100, None, 1.0, 'partial'),  # unknown history
+    (100, 10, PLAN_MIN_CODE_SHARE, 'full'),
+    (100, 10, PLAN_MIN_CODE_SHARE / 2, 'partial'),  # mostly assets
+])
+def test_plan_mode(size_kb, commits, code_share, mode):
+    plan, _ = _plan(size_kb, commits, code_share)
+    assert plan.mode == mode
+
+
+def test_languages_are_only_looked_up_for_full_clone_candidates():
+    _, api = _plan(PLAN_FULL_CLONE_MAX_KB + 1, 10)
+    assert api.calls == 0
+    _, api = _plan(100, 10)
+    assert api.calls == 1
+
+
+def test_plan_cost_orders_the_queue():
+    assert _plan(PLAN_API_ONLY_KB, 10)[0].cost == PLAN_FULL_CLONE_MAX_KB
+    assert _plan(5000, None)[0].cost == 5000
+    assert _plan(0, None)[0].cost == 0
+
+
+def test_plan_without_metadata_keeps_the_default():
+    plan = StrategyPlanner(_Api(1.0), default='partial').plan(None)
+    assert plan.mode == 'partial'
+    assert plan.as_dict() == {'mode': 'partial', 'reason': 'repository size unknown'}
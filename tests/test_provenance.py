@@ -0,0 +1,86 @@
+"""Winnowing fingerprints and cross-submission overlap reports."""
+
+import random
+
+import numpy as np
+
+from hackathon_judge.analyzer.provenance import ProvenanceIndex, RepoFingerprints, winnow
+from hackathon_judge.config import PROVENANCE_COMMON_REPOS, PROVENANCE_KGRAM, PROVENANCE_WINDOW
+
+NONE = np.empty(0, dtype=np.uint64)
+
+
+def _code(seed: int, lines: int = 60) -> str:
+    """Deterministic, distinct source text."""
+    rng = random.Random(seed)
+    words = ['value', 'amount', 'payment', 'wallet', 'invoice', 'price', 'token', 'user']
+    return '\n'.join(
+        f"const {rng.choice(words)}{rng.randrange(10**6)} = {rng.choice(words)}({rng.randrange(10**6)});"
+        for _ in range(lines)
+    )
+
+
+def _fingerprints(code: str, pre_window: str = '') -> RepoFingerprints:
+    return RepoFingerprints(winnow(code), winnow(pre_window) if pre_window else NONE)
+
+
+def test_winnow_ignores_whitespace_and_case():
+    code = _code(1)
+    reformatted = code.upper().replace(' = ', '=\n    ').replace(';', ' ;')
+    assert np.array_equal(winnow(code), winnow(reformatted))
+
+
+def test_winnow_short_texts():
+    assert winnow('x' * (PROVENANCE_KGRAM - 1)).size == 0
+    assert winnow('abcdefghij' * 4).size == 1
+
+
+def test_shared_snippet_always_yields_a_shared_fingerprint():
+    snippet = ''.join(_code(2).split())[:PROVENANCE_KGRAM + PROVENANCE_WINDOW - 1]
+    left = _code(3) + snippet + _code(4)
+    right = _code(5) + snippet + _code(6)
+    assert np.intersect1d(winnow(left), winnow(right)).size >= 1
+    assert np.intersect1d(winnow(_code(3)), winnow(_code(5))).size == 0
+
+
+def test_report_overlap_on_copied_code():
+    shared = _code(10)
+    index = ProvenanceIndex()
+    index.add('original', _fingerprints(shared + _code(11, lines=10)))
+    index.add('copy', _fingerprints(shared + _code(12, lines=10)))
+    index.add('other', _fingerprints(_code(13)))
+
+    report = index.report('copy')
+    assert [o['project_id'] for o in report['code_overlaps']] == ['original']
+    assert report['code_overlaps'][0]['overlap'] > 0.8
+    assert index.report('other')['code_overlaps'] == []
+    assert index.stats()['overlapping_pairs'] == 1
+
+
+def test_report_pre_window_share():
+    reused = _code(20)
+    index = ProvenanceIndex()
+    index.add('late', _fingerprints(reused))
+    index.add('early', _fingerprints(_code(21), pre_window=reused))
+
+    report = index.report('late')
+    assert report['pre_window_code_share'] == 1.0
+    assert report['pre_window_code_sources'] == ['early']
+    assert index.report('early')['pre_window_code_share'] == 0.0
+
+
+def test_boilerplate_shared_by_many_submissions_is_ignored():
+    boilerplate = _code(30)
+    index = ProvenanceIndex()
+    for i in range(PROVENANCE_COMMON_REPOS + 1):
+        index.add(f"p{i}", _fingerprints(boilerplate + _code(100 + i, lines=5)))
+    assert all(index.report(f"p{i}")['code_overlaps'] == []
+               for i in range(PROVENANCE_COMMON_REPOS + 1))
+
+
+def test_add_ignores_duplicates_and_missing_fingerprints():
+    index = ProvenanceIndex()
+    index.add('p', _fingerprints(_code(40)))
+    index.add('p', _fingerprints(_code(41)))
+    index.add('q', None)
+    assert len(index) == 1 and 'q' not in index
@@ -0,0 +1,129 @@
+"""Rate-limit pacing and adaptive concurrency."""
+
+import asyncio
+
+import pytest
+
+from hackathon_judge.fetcher.rate_limit import (
+    AdaptiveConcurrency, GitHubRateLimitError, RateLimitBudget,
+)
+
+NOW = 1_000_000.0
+
+
+def _budget(remaining: int, reset_in: float, limit: int = 5000, **kwargs) -> RateLimitBudget:
+    budget = RateLimitBudget(pacing_threshold=0.2, **kwargs)
+    budget.update(_headers(limit, remaining, NOW + reset_in))
+    return budget
+
+
+def _headers(limit: int, remaining: int, reset: float) -> dict:
+    return {
+        'X-RateLimit-Limit': str(limit),
+        'X-RateLimit-Remaining': str(remaining),
+        'X-RateLimit-Reset': str(reset),
+    }
+
+
+@pytest.mark.parametrize('remaining, reset_in, last_sent_ago, expected', [
+    (4000, 3600, 0.0, 0.0),  # above the pacing threshold: unthrottled
+    (100, 100, 0.0, 1.0),  # paced: 100 calls spread over 100 s
+    (100, 100, 0.4, 0.6),  # part of the interval already elapsed
+    (100, 100, 5.0, 0.0),
+    (10, 1, 0.0, 0.1),  # close to the reset, the interval shrinks
+    (0, 30, 0.0, 31.0),  # nothing left: wait for the reset
+    (100, -1, 0.0, 0.0),  # window already reset
+])
+def test_delay(remaining, reset_in, last_sent_ago, expected):
+    budget = _budget(remaining, reset_in)
+    budget._last_sent = NOW - last_sent_ago
+    assert budget.delay(NOW) == pytest.approx(expected)
+
+
+def test_delay_without_headers_is_zero():
+    assert RateLimitBudget().delay(NOW) == 0.0
+
+
+def test_reserve_is_never_spent():
+    budget = _budget(5, 60, reserve=5)
+    assert budget.delay(NOW) == pytest.approx(61.0)
+
+
+def test_exhaust_waits_for_the_reset():
+    budget = _budget(4000, 600)
+    budget.exhaust()
+    assert budget.remaining == 0
+    assert budget.delay(NOW) == pytest.approx(601.0)
+
+    budget.exhaust(NOW + 10)
+    assert budget.delay(NOW) == pytest.approx(11.0)
+
+
+def test_update_keeps_the_lowest_remaining_within_a_window():
+    budget = _budget(50, 600)
+    budget.update(_headers(5000, 60, NOW + 600))  # late, out-of-order response
+    assert budget.remaining == 50
+
+    budget.update(_headers(5000, 4999, NOW + 4200))  # new window
+    assert budget.remaining == 4999
+    assert budget.reset == NOW + 4200
+
+    budget.update({'X-RateLimit-Remaining': '1'})  # incomplete headers are ignored
+    assert budget.remaining == 4999
+
+
+def test_acquire_refuses_waits_past_max_wait():
+    budget = RateLimitBudget(max_wait=5)
+    budget.exhaust()
+    budget.reset = 2e10  # far in the future
+    with pytest.raises(GitHubRateLimitError):
+        asyncio.run(budget.acquire())
+
+
+def test_throttle_halves_down_to_minimum():
+    concurrency = AdaptiveConcurrency(initial=8, minimum=2, maximum=16)
+    limits = []
+    for _ in range(3):
+        concurrency.on_throttle()
+        limits.append(concurrency.limit)
+    assert limits == [4, 2, 2]
+
+
+def test_successes_grow_the_limit_back_up_to_maximum():
+    concurrency = AdaptiveConcurrency(initial=1, maximum=3)
+    limits = []
+    for _ in range(8):
+        concurrency.on_success()
+        limits.append(concurrency.limit)
+    # One success raises 1 -> 2, two more 2 -> 3, then the maximum holds
+    assert limits == [2, 2, 3, 3, 3, 3, 3, 3]
+
+
+def test_throttle_resets_the_success_streak():
+    concurrency = AdaptiveConcurrency(initial=4, maximum=8)
+    for _ in range(3):
+        concurrency.on_success()
+    concurrency.on_throttle()
+    assert concurrency.limit == 2
+    concurrency.on_success()
+    assert concurrency.limit == 2
+    concurrency.on_success()
+    assert concurrency.limit == 3
+
+
+def test_in_flight_requests_stay_within_the_limit():
+    concurrency = AdaptiveConcurrency(initial=2, maximum=2)
+    peak = 0
+
+    async def request():
+        nonlocal peak
+        async with concurrency:
+            peak = max(peak, concurrency.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        await asyncio.gather(*(request() for _ in range(6)))
+
+    asyncio.run(main())
+    assert peak == 2
+    assert concurrency.in_flight == 0
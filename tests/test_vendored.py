@@ -0,0 +1,64 @@
+"""Vendored file matching and learning."""
+
+import pytest
+
+from hackathon_judge.analyzer.repo_index import FileEntry, RepoIndex
+from hackathon_judge.analyzer.vendored import VendoredFiles, is_learnable
+
+
+def _entry(path: str, sha: str, size: int = 4096) -> FileEntry:
+    return FileEntry(path=path, ext='.' + path.rsplit('.', 1)[-1], size=size, blob_sha=sha)
+
+
+@pytest.mark.parametrize('path, label', [
+    ('static/js/jquery.min.js', 'jquery'),
+    ('lib/forge-std/src/Test.sol', 'forge-std'),
+    ('idl/program.json', 'anchor idl'),
+    ('target/idl/program.json', 'anchor idl'),
+    ('idl/nested/program.json', None),
+    ('src/app.ts', None),
+])
+def test_path_heuristics(path, label):
+    assert VendoredFiles(persist=False).match(path) == label
+
+
+def test_learn_only_library_like_files(tmp_path):
+    vendored = VendoredFiles(cache_dir=str(tmp_path), min_repos=3)
+    for project in ('a', 'b', 'c'):
+        vendored.observe(project, [
+            _entry('public/js/chart.min.js', 'lib-sha'),
+            _entry('src/x402.ts', 'copied-sha'),
+        ])
+    assert vendored.learn() == 1
+
+    learned = VendoredFiles(cache_dir=str(tmp_path), min_repos=3)
+    assert learned.match('public/js/chart.min.js', 'lib-sha') == 'shared by submissions'
+    assert learned.match('public/js/chart.min.js', 'lib-sha', learned=False) is None
+    assert learned.match('src/x402.ts', 'copied-sha') is None
+
+
+def test_sightings_are_scoped_to_the_run(tmp_path):
+    for project in ('a', 'b'):
+        run = VendoredFiles(cache_dir=str(tmp_path), min_repos=3)
+        run.observe(project, [_entry('dist/sdk.js', 'sdk-sha')])
+        assert run.learn() == 0
+    assert VendoredFiles(cache_dir=str(tmp_path)).match('dist/sdk.js', 'sdk-sha') is None
+
+
+def test_learned_files_stay_indexed_outside_the_budget():
+    vendored = VendoredFiles(persist=False)
+    vendored.add('jq-sha', 'jquery')
+    vendored.add('lib-sha', 'shared by submissions', source='learned')
+    files = [
+        _entry('assets/js/jq.js', 'jq-sha'),
+        _entry('assets/js/chart.min.js', 'lib-sha'),
+        _entry('src/index.ts', 'own-sha'),
+    ]
+    index = RepoIndex(files, set(), source=None)
+
+    excluded = index.exclude_vendored(vendored)
+    assert [e.path for e in excluded] == ['assets/js/chart.min.js', 'assets/js/jq.js']
+    assert [e.path for e in index.files] == ['assets/js/chart.min.js', 'src/index.ts']
+    index.budget.plan(index.files)
+    assert index.budget.refusal('assets/js/chart.min.js') == 'vendored (shared by submissions)'
+    assert index.budget.refusal('src/index.ts') is None